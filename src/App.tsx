@@ -21,7 +21,8 @@ function App() {
     const canvas = canvasRef.current;
     if (!canvas) return;
 
-    const ctx = canvas.getContext('2d');
+    // Every frame starts from an opaque background fill, so the canvas needs no alpha channel
+    const ctx = canvas.getContext('2d', { alpha: false });
     if (!ctx) return;
 
     // Set canvas size
@@ -37,54 +38,54 @@ function App() {
     // Initialize scene manager
     const sceneManager = new SceneManager();
 
-    // Create scenes
-    const houseVillageScene = new HouseVillageScene((sceneName) => {
+    const changeScene = (sceneName: string) => {
       sceneManager.changeScene(sceneName);
-    });
-
-    const characterSelectionScene = new CharacterSelectionScene((sceneName) => {
-      sceneManager.changeScene(sceneName);
-    });
-
-    const pokemonSelectionScene = new PokemonSelectionScene();
+    };
 
-    // Register scenes
-    sceneManager.registerScene('character_selection', characterSelectionScene);
-    sceneManager.registerScene('house_village', houseVillageScene);
-    sceneManager.registerScene('pokemon_selection', pokemonSelectionScene);
+    // Register scene factories; each scene (and its font/asset loading) is only
+    // constructed the first time it is entered
+    sceneManager.registerScene('character_selection', () => new CharacterSelectionScene(changeScene));
+    sceneManager.registerScene('house_village', () => new HouseVillageScene(changeScene));
+    sceneManager.registerScene('pokemon_selection', () => new PokemonSelectionScene());
 
     // Start with house_village scene
     sceneManager.changeScene('house_village');
 
     sceneManagerRef.current = sceneManager;
 
-    // Event handlers
-    const handleKeyDown = (e: KeyboardEvent) => {
-      sceneManager.handleEvent(e);
-    };
-
-    const handleKeyUp = (e: KeyboardEvent) => {
+    // Only event types some scene handles are listened for; the scene manager
+    // further filters them per scene (pointer moves only reach the battle hover UI)
+    const forwardedEventTypes = ['keydown', 'keyup', 'mousedown', 'mousemove'] as const;
+    const handleInputEvent = (e: KeyboardEvent | MouseEvent) => {
       sceneManager.handleEvent(e);
     };
 
-    const handleMouseDown = (e: MouseEvent) => {
-      sceneManager.handleEvent(e);
-    };
+    for (const type of forwardedEventTypes) {
+      window.addEventListener(type, handleInputEvent);
+    }
 
-    window.addEventListener('keydown', handleKeyDown);
-    window.addEventListener('keyup', handleKeyUp);
-    window.addEventListener('mousedown', handleMouseDown);
+    // Frame limiter: requestAnimationFrame follows the display refresh rate,
+    // so skip callbacks that arrive before the next Config.FPS slot
+    const frameInterval = 1000 / Config.FPS;
+    let nextFrameTime = 0;
 
     // Game loop
     const gameLoop = (currentTime: number) => {
+      // Small tolerance so rAF timestamp jitter on a 60Hz display doesn't drop frames
+      if (currentTime < nextFrameTime - 1) {
+        animationFrameRef.current = requestAnimationFrame(gameLoop);
+        return;
+      }
+      nextFrameTime += frameInterval;
+      if (currentTime - nextFrameTime > frameInterval) {
+        // Fell behind (e.g. tab was hidden), resync instead of bursting catch-up frames
+        nextFrameTime = currentTime + frameInterval;
+      }
+
       const deltaTime = currentTime - lastTimeRef.current;
       lastTimeRef.current = currentTime;
 
-      // Clear canvas
-      ctx.fillStyle = `rgb(${Config.BG_COLOR.join(',')})`;
-      ctx.fillRect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
-
-      // Update and render
+      // Update and render (the scene manager clears only what the scene reports as dirty)
       if (sceneManagerRef.current) {
         sceneManagerRef.current.update(deltaTime);
         sceneManagerRef.current.render(ctx);
@@ -94,13 +95,14 @@ function App() {
     };
 
     lastTimeRef.current = performance.now();
+    nextFrameTime = lastTimeRef.current;
     animationFrameRef.current = requestAnimationFrame(gameLoop);
 
     // Cleanup
     return () => {
-      window.removeEventListener('keydown', handleKeyDown);
-      window.removeEventListener('keyup', handleKeyUp);
-      window.removeEventListener('mousedown', handleMouseDown);
+      for (const type of forwardedEventTypes) {
+        window.removeEventListener(type, handleInputEvent);
+      }
       if (animationFrameRef.current) {
         cancelAnimationFrame(animationFrameRef.current);
       }
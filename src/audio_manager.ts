@@ -12,7 +12,8 @@ export class AudioManager {
   private currentMusic: HTMLAudioElement | null = null;
   private currentMusicPath: string | null = null; // Track which music is currently playing
   private soundEffects: Map<string, HTMLAudioElement> = new Map();
-  private playingSoundEffects: Map<string, HTMLAudioElement> = new Map(); // Track currently playing sounds
+  private soundEffectPaths: Map<string, string> = new Map(); // Registered sounds, loaded on first use
+  private musicCache: Map<string, HTMLAudioElement> = new Map(); // Loaded tracks, reused instead of refetched
   private userHasInteracted = false;
   private musicLoaded = false;
 
@@ -36,20 +37,31 @@ export class AudioManager {
     document.addEventListener('touchstart', enableAudio, { once: true });
   }
 
-  async loadSoundEffect(name: string, path: string): Promise<void> {
-    try {
-      const audio = new Audio(path);
-      audio.volume = this.sfxVolume;
-      audio.preload = 'auto';
-      await new Promise((resolve, reject) => {
-        audio.oncanplaythrough = resolve;
-        audio.onerror = reject;
-        audio.load();
-      });
-      this.soundEffects.set(name, audio);
-    } catch (error) {
-      console.warn(`Unable to load sound effect ${name}:`, error);
-    }
+  registerSoundEffect(name: string, path: string): void {
+    // Only record the path; the element is created by preloadSoundEffects() or, for a
+    // sound registered later, the first time it plays
+    this.soundEffectPaths.set(name, path);
+  }
+
+  preloadSoundEffects(): void {
+    // Start fetching every registered sound without waiting on any of them
+    this.soundEffectPaths.forEach((_path, name) => {
+      this.getSoundEffect(name);
+    });
+  }
+
+  private getSoundEffect(name: string): HTMLAudioElement | null {
+    const cached = this.soundEffects.get(name);
+    if (cached) return cached;
+
+    const path = this.soundEffectPaths.get(name);
+    if (!path) return null;
+
+    const audio = new Audio(path);
+    audio.volume = this.muted ? 0 : this.sfxVolume;
+    audio.preload = 'auto';
+    this.soundEffects.set(name, audio);
+    return audio;
   }
 
   async loadMusic(path: string, loop: boolean = true): Promise<HTMLAudioElement | null> {
@@ -63,16 +75,9 @@ export class AudioManager {
       // Stop current music if playing (different track or paused)
       this.stopMusic();
 
-      const audio = new Audio(path);
-      audio.volume = this.musicVolume;
+      const audio = this.musicCache.get(path) ?? (await this.fetchMusic(path));
+      audio.volume = this.muted ? 0 : this.musicVolume;
       audio.loop = loop;
-      audio.preload = 'auto';
-      
-      await new Promise((resolve, reject) => {
-        audio.oncanplaythrough = resolve;
-        audio.onerror = reject;
-        audio.load();
-      });
 
       this.currentMusic = audio;
       this.currentMusicPath = path;
@@ -90,6 +95,20 @@ export class AudioManager {
     }
   }
 
+  private async fetchMusic(path: string): Promise<HTMLAudioElement> {
+    const audio = new Audio(path);
+    audio.preload = 'auto';
+    // Music tracks are large WAVs; start once playback can begin rather than
+    // waiting for the browser to estimate the whole file can buffer
+    await new Promise((resolve, reject) => {
+      audio.oncanplay = resolve;
+      audio.onerror = reject;
+      audio.load();
+    });
+    this.musicCache.set(path, audio);
+    return audio;
+  }
+
   playMusic(path: string, loop: boolean = true): void {
     // If the same music is already playing, don't do anything
     if (this.currentMusic && this.currentMusicPath === path && !this.currentMusic.paused) {
@@ -112,36 +131,21 @@ export class AudioManager {
   playSoundEffect(name: string): HTMLAudioElement | null {
     if (this.muted) return null;
 
-    // Check if this sound effect is already playing
-    const currentlyPlaying = this.playingSoundEffects.get(name);
-    if (currentlyPlaying && !currentlyPlaying.paused && !currentlyPlaying.ended) {
+    // Each sound owns one element, like a reserved channel: it is restarted rather
+    // than cloned, and its own playback state says whether it is still busy
+    const audio = this.getSoundEffect(name);
+    if (!audio) return null;
+
+    if (!audio.paused && !audio.ended) {
       // Sound is already playing, don't play another instance
-      return currentlyPlaying;
+      return audio;
     }
 
-    const audio = this.soundEffects.get(name);
-    if (audio) {
-      // Clone and play
-      const clone = audio.cloneNode() as HTMLAudioElement;
-      clone.volume = this.sfxVolume;
-      
-      // Track this playing sound
-      this.playingSoundEffects.set(name, clone);
-      
-      // Remove from tracking when it finishes
-      clone.addEventListener('ended', () => {
-        this.playingSoundEffects.delete(name);
-      });
-      
-      clone.play().catch((error) => {
-        console.warn(`Could not play sound effect ${name}:`, error);
-        this.playingSoundEffects.delete(name);
-      });
-      
-      return clone;
-    }
-    
-    return null;
+    audio.currentTime = 0;
+    audio.play().catch((error) => {
+      console.warn(`Could not play sound effect ${name}:`, error);
+    });
+    return audio;
   }
 
   setMusicVolume(volume: number): void {
@@ -153,10 +157,7 @@ export class AudioManager {
 
   setSfxVolume(volume: number): void {
     this.sfxVolume = Math.max(0, Math.min(1, volume));
-    // Update existing sound effects
-    this.soundEffects.forEach((audio) => {
-      audio.volume = this.sfxVolume;
-    });
+    this.applySfxVolume();
   }
 
   toggleMute(): void {
@@ -164,6 +165,16 @@ export class AudioManager {
     if (this.currentMusic) {
       this.currentMusic.volume = this.muted ? 0 : this.musicVolume;
     }
+    // Also silences effects that are already playing, not just ones started later
+    this.applySfxVolume();
+  }
+
+  private applySfxVolume(): void {
+    // One pass over every loaded effect
+    const volume = this.muted ? 0 : this.sfxVolume;
+    this.soundEffects.forEach((audio) => {
+      audio.volume = volume;
+    });
   }
 
   isMuted(): boolean {
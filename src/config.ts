@@ -35,3 +35,17 @@ export const Config = {
   FONTS_PATH: "/assets/fonts",
 };
 
+const toCss = ([r, g, b]: [number, number, number]): string => `rgb(${r},${g},${b})`;
+
+// Palette as CSS color strings, derived once from the Config tuples so render code
+// assigns fillStyle/strokeStyle without rebuilding strings every frame
+export const Colors = {
+  BG_COLOR: toCss(Config.BG_COLOR),
+  WHITE: toCss(Config.WHITE),
+  BLACK: toCss(Config.BLACK),
+  GRAY: toCss(Config.GRAY),
+  DARK_GRAY: toCss(Config.DARK_GRAY),
+  RED: toCss(Config.RED),
+  GREEN: toCss(Config.GREEN),
+  BLUE: toCss(Config.BLUE),
+};
@@ -6,20 +6,18 @@
 import { Config } from './config';
 
 let fontLoaded = false;
-let fontLoading = false;
+// In-flight load shared by concurrent callers instead of polling on a timer
+let fontLoadPromise: Promise<boolean> | null = null;
 
 export async function loadPokemonFont(): Promise<boolean> {
   if (fontLoaded) return true;
-  if (fontLoading) {
-    // Wait for existing load to complete
-    while (fontLoading) {
-      await new Promise((resolve) => setTimeout(resolve, 100));
-    }
-    return fontLoaded;
+  if (!fontLoadPromise) {
+    fontLoadPromise = loadFontFace();
   }
+  return fontLoadPromise;
+}
 
-  fontLoading = true;
-
+async function loadFontFace(): Promise<boolean> {
   try {
     const fontFace = new FontFace(
       'Pokemon Pixel Font',
@@ -33,13 +31,12 @@ export async function loadPokemonFont(): Promise<boolean> {
     await document.fonts.ready;
 
     fontLoaded = true;
-    fontLoading = false;
-    console.log('Pokemon Pixel Font loaded successfully');
     return true;
   } catch (error) {
     console.error('Failed to load Pokemon Pixel Font:', error);
     console.error('Font path attempted:', `${Config.FONTS_PATH}/pokemon_pixel_font.ttf`);
-    fontLoading = false;
+    // Allow a later call to retry
+    fontLoadPromise = null;
     return false;
   }
 }
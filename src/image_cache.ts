@@ -0,0 +1,61 @@
+/**
+ * Image Cache
+ * Shares decoded images by path so rebuilding a scene never refetches or redecodes them
+ */
+
+import { loadImage } from './utils';
+
+// Keyed by path; holds the in-flight load so concurrent callers share one request
+const imageCache: Map<string, Promise<HTMLImageElement>> = new Map();
+// Animated GIFs live in the DOM, so sharing them also keeps a rebuilt scene from
+// appending a second copy of each
+const animatedGifCache: Map<string, Promise<HTMLImageElement>> = new Map();
+
+function getOrLoad(
+  cache: Map<string, Promise<HTMLImageElement>>,
+  path: string,
+  load: () => Promise<HTMLImageElement>
+): Promise<HTMLImageElement> {
+  let image = cache.get(path);
+  if (!image) {
+    image = load();
+    cache.set(path, image);
+    // Allow a later call to retry a failed load
+    image.catch(() => {
+      if (cache.get(path) === image) {
+        cache.delete(path);
+      }
+    });
+  }
+  return image;
+}
+
+export function loadCachedImage(path: string): Promise<HTMLImageElement> {
+  return getOrLoad(imageCache, path, () => loadImage(path));
+}
+
+async function loadAnimatedGif(path: string, displayWidth: number): Promise<HTMLImageElement> {
+  // Keep visible but off-screen so browser animates it
+  // GIFs need to be visible (not display:none) and have proper dimensions to animate
+  const img = document.createElement('img');
+  img.style.position = 'fixed';
+  img.style.left = '-2000px';
+  img.style.top = '0';
+  img.style.width = `${displayWidth}px`; // Actual display width
+  img.style.height = 'auto';
+  img.style.opacity = '0.01'; // Nearly invisible but still "visible" to browser
+  document.body.appendChild(img);
+  img.src = path;
+  try {
+    // Decode up front like every other sprite, so the first frame never waits on it
+    await img.decode();
+  } catch (error) {
+    img.remove();
+    throw error;
+  }
+  return img;
+}
+
+export function loadCachedAnimatedGif(path: string, displayWidth: number): Promise<HTMLImageElement> {
+  return getOrLoad(animatedGifCache, path, () => loadAnimatedGif(path, displayWidth));
+}
@@ -3,25 +3,59 @@
  * Handles scene transitions and state management
  */
 
+import { Colors, Config } from './config';
+import { Rect } from './utils';
+
 export interface Scene {
   onEnter?(): void;
   onExit?(): void;
   handleEvent?(event: KeyboardEvent | MouseEvent): void;
   update?(deltaTime: number): void;
   render?(ctx: CanvasRenderingContext2D): void;
+  // Regions that changed since the last frame: null repaints everything,
+  // an empty list skips the frame. Scenes without it are always fully repainted.
+  getDirtyRects?(): Rect[] | null;
+  // DOM event types the scene reacts to; other events are dropped before handleEvent
+  getInterestedEventTypes?(): ReadonlySet<string>;
 }
 
+export type SceneFactory = () => Scene;
+
 export class SceneManager {
   private scenes: Map<string, Scene> = new Map();
+  // Scenes registered lazily, constructed the first time they are entered
+  private sceneFactories: Map<string, SceneFactory> = new Map();
   private currentScene: Scene | null = null;
   private currentSceneName: string | null = null;
+  // Set on scene change so the new scene is always painted in full once
+  private sceneChanged = false;
+
+  registerScene(name: string, scene: Scene | SceneFactory): void {
+    if (typeof scene === 'function') {
+      this.scenes.delete(name);
+      this.sceneFactories.set(name, scene);
+    } else {
+      this.sceneFactories.delete(name);
+      this.scenes.set(name, scene);
+    }
+  }
 
-  registerScene(name: string, scene: Scene): void {
-    this.scenes.set(name, scene);
+  private getScene(name: string): Scene | undefined {
+    let scene = this.scenes.get(name);
+    if (!scene) {
+      const factory = this.sceneFactories.get(name);
+      if (factory) {
+        scene = factory();
+        this.scenes.set(name, scene);
+        this.sceneFactories.delete(name);
+      }
+    }
+    return scene;
   }
 
   changeScene(name: string): void {
-    if (this.scenes.has(name)) {
+    const scene = this.getScene(name);
+    if (scene) {
       // Call on_exit on current scene if it exists
       if (this.currentScene?.onExit) {
         this.currentScene.onExit();
@@ -29,7 +63,8 @@ export class SceneManager {
 
       // Switch to new scene
       this.currentSceneName = name;
-      this.currentScene = this.scenes.get(name)!;
+      this.currentScene = scene;
+      this.sceneChanged = true;
 
       // Call on_enter on new scene
       if (this.currentScene?.onEnter) {
@@ -41,21 +76,52 @@ export class SceneManager {
   }
 
   handleEvent(event: KeyboardEvent | MouseEvent): void {
-    if (this.currentScene?.handleEvent) {
-      this.currentScene.handleEvent(event);
+    const scene = this.currentScene;
+    if (!scene?.handleEvent) return;
+    if (scene.getInterestedEventTypes && !scene.getInterestedEventTypes().has(event.type)) {
+      return;
     }
+    scene.handleEvent(event);
   }
 
   update(deltaTime: number): void {
+    // Input-driven scenes leave update undefined and are skipped entirely
     if (this.currentScene?.update) {
       this.currentScene.update(deltaTime);
     }
   }
 
   render(ctx: CanvasRenderingContext2D): void {
-    if (this.currentScene?.render) {
-      this.currentScene.render(ctx);
+    const scene = this.currentScene;
+    if (!scene?.render) return;
+
+    // Always query so the scene consumes its dirty state, even when overridden below
+    let dirtyRects = scene.getDirtyRects ? scene.getDirtyRects() : null;
+    if (this.sceneChanged) {
+      this.sceneChanged = false;
+      dirtyRects = null;
+    }
+    if (dirtyRects !== null && dirtyRects.length === 0) {
+      // Nothing changed, the canvas still holds last frame's pixels
+      return;
     }
+
+    ctx.save();
+    if (dirtyRects !== null) {
+      // Restrict clearing and drawing to the changed regions
+      ctx.beginPath();
+      for (const rect of dirtyRects) {
+        ctx.rect(rect.x, rect.y, rect.width, rect.height);
+      }
+      ctx.clip();
+    }
+
+    // Clear with background color
+    ctx.fillStyle = Colors.BG_COLOR;
+    ctx.fillRect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+
+    scene.render(ctx);
+    ctx.restore();
   }
 
   getCurrentSceneName(): string | null {
@@ -3,62 +3,186 @@
  * Recreates the character selection screen
  */
 
-import { Config } from '../config';
+import { Colors, Config } from '../config';
+import { loadPokemonFont } from '../font_loader';
+import { drawTextSprite, renderTextSprite, Rect, TextSprite } from '../utils';
+
+// Text anchors
+const CENTER_X = Config.SCREEN_WIDTH / 2;
+const FOOTER_Y = Config.SCREEN_HEIGHT - 40;
+
+// Only key presses drive this scene
+const INTERESTED_EVENT_TYPES: ReadonlySet<string> = new Set(['keydown']);
+
+interface CharacterOption {
+  name: string;
+  x: number;
+  y: number;
+  // Cached render data, built once per option
+  boxRect: Rect;
+  highlightRect: Rect; // boxRect grown by half the 4px stroke, used as a dirty region
+  ellipseSprite: HTMLCanvasElement;
+  nameText: TextSprite;
+  confirmText: TextSprite;
+}
+
+function renderOptionTexts(name: string, font: string): Pick<CharacterOption, 'nameText' | 'confirmText'> {
+  return {
+    nameText: renderTextSprite(name, font, Colors.BLACK, 'center'),
+    confirmText: renderTextSprite(`You chose ${name}!`, font, Colors.GREEN, 'center'),
+  };
+}
+
+function createCharacterOption(name: string, color: string, x: number, y: number, font: string): CharacterOption {
+  // Character placeholders are static, so rasterize each ellipse once
+  const ellipseSprite = document.createElement('canvas');
+  ellipseSprite.width = 80;
+  ellipseSprite.height = 80;
+  const ctx = ellipseSprite.getContext('2d');
+  if (ctx) {
+    ctx.fillStyle = color;
+    ctx.beginPath();
+    ctx.ellipse(40, 40, 40, 40, 0, 0, 2 * Math.PI);
+    ctx.fill();
+  }
+
+  return {
+    name,
+    x,
+    y,
+    boxRect: { x: x - 60, y: y - 80, width: 120, height: 120 },
+    highlightRect: { x: x - 62, y: y - 82, width: 124, height: 124 },
+    ellipseSprite,
+    ...renderOptionTexts(name, font),
+  };
+}
 
 export class CharacterSelectionScene {
-  private selectedCharacter: { name: string; color: string; x: number; y: number } | null = null;
-  private characterOptions = [
-    { name: 'Red', color: 'rgb(255, 0, 0)', x: 200, y: 200 },
-    { name: 'Blue', color: 'rgb(0, 0, 255)', x: 400, y: 200 },
-  ];
+  private selectedCharacter: CharacterOption | null = null;
   private cursorPos: number = 0;
   private confirmed: boolean = false;
   private onChangeScene?: (sceneName: string) => void;
   private fontLarge: string = '48px "Pokemon Pixel Font", Arial, sans-serif';
   private fontMedium: string = '32px "Pokemon Pixel Font", Arial, sans-serif';
 
+  private characterOptions: CharacterOption[] = [
+    createCharacterOption('Red', 'rgb(255, 0, 0)', 200, 200, this.fontMedium),
+    createCharacterOption('Blue', 'rgb(0, 0, 255)', 400, 200, this.fontMedium),
+  ];
+  private highlightRects: Rect[] = this.characterOptions.map((character) => character.highlightRect);
+
+  // Pre-rendered text (strings never change, so rasterize once instead of every frame)
+  private titleText!: TextSprite;
+  private instructionsText!: TextSprite;
+
+  // Background, title, ellipses and names composited into one screen-sized canvas
+  private staticLayer: HTMLCanvasElement = document.createElement('canvas');
+
+  // Dirty tracking: a full repaint after entering, otherwise only the highlight boxes
+  private needsFullRedraw: boolean = true;
+  private highlightDirty: boolean = false;
+
+  // Text sprites are rasterized with whatever font is available at construction and
+  // rebuilt by loadFont() once the pixel font resolves, so they always match the final font
   constructor(onChangeScene?: (sceneName: string) => void) {
     this.onChangeScene = onChangeScene;
+    this.buildHeaderTexts();
+    this.buildStaticLayer();
     this.loadFont();
   }
 
+  private buildHeaderTexts(): void {
+    this.titleText = renderTextSprite('Choose Your Character', this.fontLarge, Colors.BLACK, 'center');
+    this.instructionsText = renderTextSprite(
+      'Use Arrow Keys to select, Enter to confirm',
+      this.fontMedium,
+      Colors.DARK_GRAY,
+      'center'
+    );
+  }
+
+  private buildTextSprites(): void {
+    this.buildHeaderTexts();
+    for (const character of this.characterOptions) {
+      Object.assign(character, renderOptionTexts(character.name, this.fontMedium));
+    }
+    this.buildStaticLayer();
+  }
+
+  private buildStaticLayer(): void {
+    this.staticLayer.width = Config.SCREEN_WIDTH;
+    this.staticLayer.height = Config.SCREEN_HEIGHT;
+    // Fully covered by the background fill, so it can be an opaque canvas
+    const ctx = this.staticLayer.getContext('2d', { alpha: false });
+    if (!ctx) return;
+
+    ctx.fillStyle = Colors.BG_COLOR;
+    ctx.fillRect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+
+    // Title
+    drawTextSprite(ctx, this.titleText, CENTER_X, 80);
+
+    for (const character of this.characterOptions) {
+      // Character placeholder (colored circle)
+      ctx.drawImage(character.ellipseSprite, character.x - 40, character.y - 40);
+
+      // Character name
+      drawTextSprite(ctx, character.nameText, character.x, character.y + 60);
+    }
+  }
+
   private async loadFont(): Promise<void> {
-    // Font should already be loaded by font_loader, but check anyway
-    if (document.fonts.check('32px "Pokemon Pixel Font"')) {
-      this.fontLoaded = true;
-    } else {
-      try {
-        const fontFace = new FontFace(
-          'Pokemon Pixel Font',
-          `url(${Config.FONTS_PATH}/pokemon_pixel_font.ttf)`
-        );
-        await fontFace.load();
-        document.fonts.add(fontFace);
-        this.fontLoaded = true;
-      } catch (error) {
-        console.warn('Unable to load Pokemon pixel font, using fallback:', error);
-        this.fontLarge = '48px Arial, sans-serif';
-        this.fontMedium = '32px Arial, sans-serif';
-      }
+    // Shared with App's startup load, so this normally resolves immediately
+    if (!(await loadPokemonFont())) {
+      console.warn('Unable to load Pokemon pixel font, using fallback');
+      this.fontLarge = '48px Arial, sans-serif';
+      this.fontMedium = '32px Arial, sans-serif';
     }
+    // Re-rasterize with the final font
+    this.buildTextSprites();
+    this.needsFullRedraw = true;
   }
 
   onEnter(): void {
     this.selectedCharacter = null;
     this.cursorPos = 0;
     this.confirmed = false;
+    this.needsFullRedraw = true;
+  }
+
+  getDirtyRects(): Rect[] | null {
+    if (this.needsFullRedraw) {
+      this.needsFullRedraw = false;
+      this.highlightDirty = false;
+      return null;
+    }
+    if (this.highlightDirty) {
+      this.highlightDirty = false;
+      return this.highlightRects;
+    }
+    return [];
+  }
+
+  getInterestedEventTypes(): ReadonlySet<string> {
+    return INTERESTED_EVENT_TYPES;
   }
 
   handleEvent(event: KeyboardEvent | MouseEvent): void {
     if (event instanceof KeyboardEvent && event.type === 'keydown' && !this.confirmed) {
-      if (event.key === 'ArrowLeft' && this.cursorPos > 0) {
-        this.cursorPos -= 1;
-      } else if (event.key === 'ArrowRight' && this.cursorPos < this.characterOptions.length - 1) {
-        this.cursorPos += 1;
+      if (event.key === 'ArrowLeft' || event.key === 'ArrowRight') {
+        const step = event.key === 'ArrowLeft' ? -1 : 1;
+        const newPos = Math.min(this.characterOptions.length - 1, Math.max(0, this.cursorPos + step));
+        // Pressing against an edge changes nothing, so keep the cached frame
+        if (newPos !== this.cursorPos) {
+          this.cursorPos = newPos;
+          this.highlightDirty = true;
+        }
       } else if (event.key === 'Enter' || event.key === ' ') {
         // Select character
         this.selectedCharacter = this.characterOptions[this.cursorPos];
         this.confirmed = true;
+        // Box color and bottom message both change
+        this.needsFullRedraw = true;
         // Transition to house/village scene
         if (this.onChangeScene) {
           this.onChangeScene('house_village');
@@ -67,70 +191,21 @@ export class CharacterSelectionScene {
     }
   }
 
-  update(_deltaTime: number): void {
-    // No update logic needed
-  }
-
   render(ctx: CanvasRenderingContext2D): void {
-    // Clear with background color
-    ctx.fillStyle = `rgb(${Config.BG_COLOR.join(',')})`;
-    ctx.fillRect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
-
-    // Title
-    ctx.fillStyle = `rgb(${Config.BLACK.join(',')})`;
-    ctx.font = this.fontLarge;
-    ctx.textAlign = 'center';
-    ctx.textBaseline = 'top';
-    ctx.fillText('Choose Your Character', Config.SCREEN_WIDTH / 2, 80);
-
-    // Draw character options
-    for (let i = 0; i < this.characterOptions.length; i++) {
-      const character = this.characterOptions[i];
-      const boxX = character.x - 60;
-      const boxY = character.y - 80;
-      const boxWidth = 120;
-      const boxHeight = 120;
-
-      // Highlight selected
-      if (i === this.cursorPos) {
-        ctx.strokeStyle = this.confirmed
-          ? `rgb(${Config.GREEN.join(',')})`
-          : `rgb(${Config.WHITE.join(',')})`;
-        ctx.lineWidth = 4;
-        ctx.strokeRect(boxX, boxY, boxWidth, boxHeight);
-      }
-
-      // Character placeholder (colored circle)
-      ctx.fillStyle = character.color;
-      ctx.beginPath();
-      ctx.ellipse(character.x, character.y, 40, 40, 0, 0, 2 * Math.PI);
-      ctx.fill();
+    // Everything that never changes is a single blit
+    ctx.drawImage(this.staticLayer, 0, 0);
 
-      // Character name
-      ctx.fillStyle = `rgb(${Config.BLACK.join(',')})`;
-      ctx.font = this.fontMedium;
-      ctx.textAlign = 'center';
-      ctx.textBaseline = 'top';
-      ctx.fillText(character.name, character.x, character.y + 60);
-    }
+    // Highlight selected
+    const box = this.characterOptions[this.cursorPos].boxRect;
+    ctx.strokeStyle = this.confirmed ? Colors.GREEN : Colors.WHITE;
+    ctx.lineWidth = 4;
+    ctx.strokeRect(box.x, box.y, box.width, box.height);
 
     // Instructions or confirmation message
-    ctx.font = this.fontMedium;
-    ctx.textBaseline = 'top';
-    if (this.confirmed) {
-      ctx.fillStyle = `rgb(${Config.GREEN.join(',')})`;
-      ctx.fillText(
-        `You chose ${this.selectedCharacter!.name}!`,
-        Config.SCREEN_WIDTH / 2,
-        Config.SCREEN_HEIGHT - 40
-      );
+    if (this.confirmed && this.selectedCharacter) {
+      drawTextSprite(ctx, this.selectedCharacter.confirmText, CENTER_X, FOOTER_Y);
     } else {
-      ctx.fillStyle = `rgb(${Config.DARK_GRAY.join(',')})`;
-      ctx.fillText(
-        'Use Arrow Keys to select, Enter to confirm',
-        Config.SCREEN_WIDTH / 2,
-        Config.SCREEN_HEIGHT - 40
-      );
+      drawTextSprite(ctx, this.instructionsText, CENTER_X, FOOTER_Y);
     }
   }
 }
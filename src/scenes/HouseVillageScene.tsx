@@ -3,12 +3,156 @@
  * Map exploration with scrolling camera, character movement, Lugia sequence, and dialog
  */
 
-import { Config } from '../config';
-import { SpriteSheet, AnimatedSprite, loadImage } from '../utils';
+import { Colors, Config } from '../config';
+import {
+  SpriteSheet,
+  AnimatedSprite,
+  TextCache,
+  TextOutline,
+  TextSprite,
+  drawTextSprite,
+  pointInRect,
+  Rect,
+  renderTextSprite,
+  scaleImageTo,
+} from '../utils';
 import { audioManager } from '../audio_manager';
+import { loadPokemonFont } from '../font_loader';
+import { loadCachedAnimatedGif, loadCachedImage } from '../image_cache';
 
 type LugiaState = 'hidden' | 'flying_in' | 'animating' | 'stopped';
 type FadeState = 'none' | 'fading' | 'faded';
+// Battle dialog text: Lugia's line, the crossfade, then Venusaur's line
+type BattleTextState = 'lugia' | 'transitioning' | 'venusaur';
+type MoveDirection = 'up' | 'down' | 'left' | 'right';
+
+interface BattleTextLine {
+  canvas: HTMLCanvasElement;
+  offsetX: number;
+  offsetY: number;
+}
+
+interface BattleTextLayout {
+  font: string;
+  lugia: [BattleTextLine, BattleTextLine];
+  venusaur: [BattleTextLine, BattleTextLine];
+  line1Offset: number; // From the top of the battle dialog
+  line2Offset: number;
+}
+
+const UI_FONT = '19px "Pokemon Pixel Font", Arial, sans-serif'; // 80% of 24px base
+const MENU_FONT = '24px "Pokemon Pixel Font", Arial, sans-serif';
+const TEXT_OUTLINE: TextOutline = { color: 'rgb(255, 255, 255)', width: 4 };
+
+// Image and sprite URLs, built once per module rather than on every scene load
+const IMAGE_PATHS = {
+  map: `${Config.IMAGES_PATH}/map_background.png`,
+  character: `${Config.SPRITES_PATH}/character_red.png`,
+  lugia: `${Config.SPRITES_PATH}/lugia.png`,
+  dialog: `${Config.IMAGES_PATH}/dialog.png`,
+  exclamation: `${Config.IMAGES_PATH}/exclamation.png`,
+  fightingBackground: `${Config.IMAGES_PATH}/fighting_background.png`,
+  battleDialog: `${Config.IMAGES_PATH}/battle_dialog.png`,
+  battleGrass: `${Config.IMAGES_PATH}/battle_grass.png`,
+  battleLugiaStat: `${Config.IMAGES_PATH}/battle_lugia_stat.png`,
+  battleWater: `${Config.IMAGES_PATH}/battle_water.png`,
+  battleVenuStat: `${Config.IMAGES_PATH}/battle_venu_stat.png`,
+  fightUI: `${Config.IMAGES_PATH}/fight_ui.png`,
+  bagScreen: `${Config.IMAGES_PATH}/screen-bag.png`,
+  partyScreen: `${Config.IMAGES_PATH}/screen-party.jpg`,
+  combatUI: `${Config.IMAGES_PATH}/combat-ui.png`,
+  attackPulse: `${Config.IMAGES_PATH}/attack_pulse.png`,
+  attackPulseEnd: `${Config.IMAGES_PATH}/attack_pulse_end.png`,
+  battleTrainer: `${Config.SPRITES_PATH}/battle_trainer.png`,
+  battleLugiaGif: `${Config.SPRITES_PATH}/battle_lugia.gif`,
+  battleVenuGif: `${Config.SPRITES_PATH}/battle_venu.gif`,
+} as const;
+
+// Music tracks, resolved once so switching tracks never rebuilds the URL
+const MUSIC_PATHS = {
+  map: `${Config.SOUNDS_PATH}/mtmoon.wav`,
+  battle: `${Config.SOUNDS_PATH}/battle.wav`,
+} as const;
+
+// Bag screen USE button: 96x21, 8px from the right and 22px from the bottom
+const BAG_USE_BUTTON_RECT: Rect = {
+  x: Config.SCREEN_WIDTH - 8 - 96,
+  y: Config.SCREEN_HEIGHT - 22 - 21,
+  width: 96,
+  height: 21,
+};
+
+// Health bars, fixed size as per the Python version
+const HEALTH_BAR_WIDTH = 96;
+const HEALTH_BAR_HEIGHT = 6;
+
+// Attack sequence phases, indices into the attackPhase* arrays
+const ATTACK_PULSE = 0;
+const ATTACK_PULSE_END = 1;
+const ATTACK_PHASE_COUNT = 2;
+
+// Map cells are 32px; positions are never negative, so a shift floors them to cells
+const GRID_SIZE = 32;
+const GRID_SHIFT = 5;
+
+// Gap the player is kept from the map edges, in pixels
+const PLAYER_MAP_MARGIN = 10;
+
+// Battle menu cells, indices into battleMenuOptions and battleMenuCellRects
+const MENU_FIGHT = 0;
+const MENU_BAG = 1;
+const MENU_POKEMON = 2;
+const MENU_RUN = 3;
+
+// Battle slide-ins whose speeds are balanced against each other
+const SLIDE_GRASS = 0;
+const SLIDE_POKEMONSTAT = 1;
+const SLIDE_WATER = 2;
+const SLIDE_TRAINER = 3;
+const SLIDE_COUNT = 4;
+
+// Step a sliding coordinate toward its target by at most speed, landing exactly on it
+function slideToward(current: number, target: number, speed: number): number {
+  return current < target ? Math.min(current + speed, target) : Math.max(current - speed, target);
+}
+
+// Step every active slide in one pass; returns whether all active slides have landed
+function stepSlides(x: Float64Array, target: Float64Array, speed: Float64Array, active: Uint8Array): boolean {
+  let settled = true;
+  for (let i = 0; i < x.length; i++) {
+    if (!active[i]) continue;
+    x[i] = slideToward(x[i], target[i], speed[i]);
+    if (x[i] !== target[i]) settled = false;
+  }
+  return settled;
+}
+
+// Exclamation bounce (-20 * sin over half a period) in whole pixels, sampled once
+const EXCLAMATION_BOUNCE_STEPS = 64;
+const EXCLAMATION_BOUNCE = Int8Array.from({ length: EXCLAMATION_BOUNCE_STEPS + 1 }, (_, i) =>
+  Math.round(-20 * Math.sin((i / EXCLAMATION_BOUNCE_STEPS) * Math.PI))
+);
+
+// Keys drive the map, clicks drive dialogs and menus; pointer moves only matter
+// while a hoverable battle UI is on screen
+const INTERESTED_EVENT_TYPES: ReadonlySet<string> = new Set(['keydown', 'keyup', 'mousedown']);
+const HOVER_EVENT_TYPES: ReadonlySet<string> = new Set(['keydown', 'keyup', 'mousedown', 'mousemove']);
+
+// Arrow keys and WASD resolved with one map lookup instead of chained key comparisons
+const MOVE_KEYS: ReadonlyMap<string, MoveDirection> = new Map<string, MoveDirection>([
+  ['ArrowUp', 'up'],
+  ['w', 'up'],
+  ['W', 'up'],
+  ['ArrowDown', 'down'],
+  ['s', 'down'],
+  ['S', 'down'],
+  ['ArrowLeft', 'left'],
+  ['a', 'left'],
+  ['A', 'left'],
+  ['ArrowRight', 'right'],
+  ['d', 'right'],
+  ['D', 'right'],
+]);
 
 export class HouseVillageScene {
   // Walkable areas configuration
@@ -21,6 +165,10 @@ export class HouseVillageScene {
     [17, 9],
     [18, 9],
   ];
+  // Rectangles and cells above flattened into one byte per 32px cell (row-major)
+  private walkableGrid: Uint8Array = new Uint8Array(0);
+  private walkableGridCols = 0;
+  private walkableGridRows = 0;
 
   // Speed adjustments
   private lugiaAnimationSpeed = 0.1;
@@ -39,10 +187,25 @@ export class HouseVillageScene {
   private playerWorldY = 0;
   private cameraX = 0;
   private cameraY = 0;
+  // Largest camera offsets that keep the view on the map, fixed once the map loads
+  private maxCameraX = Math.max(0, this.mapWidth - Config.SCREEN_WIDTH);
+  private maxCameraY = Math.max(0, this.mapHeight - Config.SCREEN_HEIGHT);
   private playerWidth = 32;
   private playerHeight = 42;
+  // Furthest the player's top-left may go while staying PLAYER_MAP_MARGIN inside the map
+  private maxPlayerX = this.mapWidth - this.playerWidth - PLAYER_MAP_MARGIN;
+  private maxPlayerY = this.mapHeight - this.playerHeight - PLAYER_MAP_MARGIN;
   private characterSprite: AnimatedSprite | null = null;
 
+  // Dirty tracking: scrolling, fades and dialog motion repaint the whole screen;
+  // otherwise only the player/exclamation and Lugia regions are redrawn
+  private fullRedrawNeeded = true;
+  private playerDirty = false;
+  private lastPlayerRegion: Rect | null = null;
+  private lugiaDirty = false;
+  private lastLugiaRegion: Rect | null = null;
+  private playerWasMoving = false;
+
   // Movement state
   private movingUp = false;
   private movingDown = false;
@@ -52,18 +215,25 @@ export class HouseVillageScene {
   
   // Exclamation mark popup
   private exclamationImage: HTMLImageElement | null = null;
+  // Image size read once at load; both stay 0 without the image
+  private exclamationWidth = 0;
+  private exclamationHeight = 0;
   private exclamationVisible = false;
   private exclamationTimer = 0;
   private exclamationDuration = 500; // milliseconds
   private exclamationY = 0; // Y offset for animation
 
   // Lugia
-  private lugiaSprites: HTMLImageElement[] = [];
+  // Frames are drawn straight out of the sheet (one row, lugiaFrameCount columns)
+  private lugiaSheet: SpriteSheet | null = null;
+  private lugiaFrameCount = 0;
   private lugiaCurrentFrame = 0;
   private lugiaAnimationTime = 0;
   private lugiaState: LugiaState = 'hidden';
   private lugiaTargetX = 0;
   private lugiaTargetY = 0;
+  // Walkable-grid cell indices (cellY * cols + cellX) below Lugia that start the encounter
+  private lugiaTriggerCells: Set<number> = new Set();
   private lugiaX = 0;
   private lugiaY = -200;
   private lugiaAnimationComplete = false;
@@ -71,14 +241,32 @@ export class HouseVillageScene {
 
   // Dialog
   private dialogImage: HTMLImageElement | null = null;
+  // Placement derived from the dialog image size, fixed once it loads
+  private dialogX = 0;
+  private dialogTargetY = Config.SCREEN_HEIGHT - 56;
+  private dialogTextOffsetY = 0;
   private dialogVisible = false;
   private dialogSlideY = Config.SCREEN_HEIGHT;
   private dialogFullyVisible = false;
   private dialogText = '';
   private dialogFont: string = '32px "Pokemon Pixel Font", Arial, sans-serif';
 
+  // Rasterized strings, reused across frames; cleared whenever the fonts change
+  private textCache = new TextCache();
+  private battleTextLayout: BattleTextLayout | null = null;
+
   // Battle
-  private fightingBackground: HTMLImageElement | null = null;
+  // Scaled to the screen once at load, so every draw of it is unscaled
+  private fightingBackground: HTMLImageElement | HTMLCanvasElement | null = null;
+  // Background, grass and water at their resting positions, composited once the
+  // intro slide-ins finish and the trainer has left
+  private battleBackdrop: HTMLCanvasElement | null = null;
+  // Renderer per fade state: the map (fading out included) until fully faded, then the battle
+  private renderers: Record<FadeState, (ctx: CanvasRenderingContext2D) => void> = {
+    none: (ctx) => this.renderMap(ctx),
+    fading: (ctx) => this.renderMap(ctx),
+    faded: (ctx) => this.renderBattle(ctx),
+  };
   private fadeState: FadeState = 'none';
   private fadeAlpha = 0;
   private dialogPauseTimer = 0;
@@ -89,48 +277,53 @@ export class HouseVillageScene {
   private battleDialog: HTMLImageElement | null = null;
   private battleDialogX = 0;
   private battleDialogY = 0;
+  private battleDialogCenterY = 0; // Baseline for single-line messages in the dialog
   private battleDialogAlpha = 0;
   private battleDialogVisible = false;
   private battleGrass: HTMLImageElement | null = null;
-  private battleGrassLeftX = 0;
   private battleGrassY = 0;
-  private battleGrassLeftTargetX = 0;
   private battleGrassVisible = false;
-  private battleGrassSpeed = 5;
   private battlePokemonstat: HTMLImageElement | null = null;
-  private battlePokemonstatX = 0;
   private battlePokemonstatY = 0;
-  private battlePokemonstatTargetX = 0;
   private battlePokemonstatVisible = false;
-  private battlePokemonstatSpeed = 5;
   private battleWater: HTMLImageElement | null = null;
-  private battleWaterX = 0;
   private battleWaterY = 0;
-  private battleWaterTargetX = 0;
   private battleWaterVisible = false;
-  private battleWaterSpeed = 5;
-  private battleTrainerSprites: HTMLImageElement[] = [];
-  private battleTrainerX = 0;
+  private battleTrainerSheet: SpriteSheet | null = null;
+  private battleTrainerFrameCount = 0;
   private battleTrainerY = 0;
-  private battleTrainerTargetX = 0;
   private battleTrainerCurrentFrame = 0;
   private battleTrainerAnimationTime = 0;
   private battleTrainerVisible = false;
   private battleTrainerCanAnimate = false;
   private battleTrainerSlideOut = false;
   private battleTrainerAlpha = 255;
-  private battleTrainerSpeed = 5;
+  // Slide-in positions, resting targets and per-frame speeds, indexed by SLIDE_*
+  private slideX = new Float64Array(SLIDE_COUNT);
+  private slideTargetX = new Float64Array(SLIDE_COUNT);
+  private slideSpeed = new Float64Array(SLIDE_COUNT).fill(5);
+  // 1 while the slide is on screen and heading for its target, refreshed every frame
+  private slideActive = new Uint8Array(SLIDE_COUNT);
+  // Scratch space for calculateBattleSpeeds, indexed by SLIDE_*
+  private battleSlideDistances = new Float64Array(SLIDE_COUNT);
   private allBattleElementsSlidIn = false;
   private battleLugiaGif: HTMLImageElement | null = null;
   private battleLugiaX = 0;
   private battleLugiaY = 0;
   private battleLugiaTargetX = 0;
   private battleLugiaVisible = false;
+  // GIF frames are drawn from their natural size into these, fixed once the GIF loads
+  private battleLugiaDrawWidth = 232;
+  private battleLugiaDrawHeight = 0;
   private battleVenuGif: HTMLImageElement | null = null;
+  private battleGifsRequested = false;
+  private battleMenuAssetsRequested = false;
   private battleVenuX = 0;
   private battleVenuY = 0;
   private battleVenuTargetY = 0;
   private battleVenuVisible = false;
+  private battleVenuDrawWidth = 214;
+  private battleVenuDrawHeight = 0;
   private ballPoofPlayed = false;
   private battleVenuStat: HTMLImageElement | null = null;
   private battleVenuStatX = 0;
@@ -140,7 +333,7 @@ export class HouseVillageScene {
   // Battle text
   private battleTextLugiaAlpha = 255;
   private battleTextVenusaurAlpha = 0;
-  private battleTextFading = false;
+  private battleTextState: BattleTextState = 'lugia';
 
   // Health bars
   private lugiaMaxHP = 100;
@@ -148,22 +341,38 @@ export class HouseVillageScene {
   private venusaurMaxHP = 100;
   private venusaurCurrentHP = 100;
   private healthBarVisible = false;
+  // Bar positions relative to their stat panels, fixed once the panels load
+  private lugiaHealthBarOffsetX = 0;
+  private lugiaHealthBarOffsetY = 0;
+  private venusaurHealthBarOffsetX = 0;
+  private venusaurHealthBarOffsetY = 0;
 
   // Battle menu UI
   private battleMenuUI: HTMLImageElement | null = null;
   private battleMenuVisible = false;
   private battleMenuCursorPos = 0; // 0=Fight, 1=Bag, 2=Pokemon, 3=Run
   private battleMenuOptions = ['FIGHT', 'BAG', 'POKEMON', 'RUN']; // All caps like Python version
+  // Action for each option, keyed by MENU_* like battleMenuOptions
+  private battleMenuActions: Record<number, () => void> = {
+    [MENU_FIGHT]: () => this.selectFight(),
+    [MENU_BAG]: () => this.selectBag(),
+    [MENU_POKEMON]: () => this.selectPokemon(),
+    [MENU_RUN]: () => this.selectRun(),
+  };
   private battleMenuHoveredOption: number | null = null;
   private battleMenuX = 0;
   private battleMenuY = 0;
   private battleMenuOptionWidth = 0;
   private battleMenuOptionHeight = 0;
   private battleMenuPadding = 12; // Padding like Python version
+  // The 2x2 option cells (FIGHT, BAG, POKEMON, RUN), fixed once the menu image loads
+  private battleMenuCellRects: Rect[] = [];
+  // The four option labels rasterized together in menu coordinates
+  private battleMenuLabelLayer: HTMLCanvasElement | null = null;
   
-  // Menu screens
-  private bagScreenImage: HTMLImageElement | null = null;
-  private pokemonScreenImage: HTMLImageElement | null = null;
+  // Menu screens, pre-scaled to the screen with their 95% opacity baked in
+  private bagScreenImage: HTMLCanvasElement | null = null;
+  private pokemonScreenImage: HTMLCanvasElement | null = null;
   private bagScreenVisible = false;
   private pokemonScreenVisible = false;
   
@@ -188,28 +397,35 @@ export class HouseVillageScene {
   private combatUIRightCellHeight = 0;
   private combatUILeftGridContentWidth = 0;
   private combatUIRightGridContentWidth = 0;
+  private combatUILeftGridRect: Rect = { x: 0, y: 0, width: 0, height: 0 };
+  // Panel top and right grid left edge on screen (the panel spans the full width from x = 0)
+  private combatUIY = 0;
+  private combatUIRightGridX = 0;
   private combatUIHoveredCell: { gridSide: 'left' | 'right'; row: number; col: number } | null = null;
+  // Moves as parallel arrays indexed by grid cell (row * cols + col); a move with no
+  // PP left is greyed out and denied
   private combatUIMoveLabels = ['Context Recall', 'Syntax Slash', 'Debug Dash', 'Prompt Pulse'];
-  private combatUIMoveDetails: { [key: string]: { pp: number; pp_max: number; type: string } } = {
-    'Context Recall': { pp: 0, pp_max: 20, type: 'Psychic' },
-    'Syntax Slash': { pp: 0, pp_max: 10, type: 'Steel' },
-    'Debug Dash': { pp: 0, pp_max: 15, type: 'Steel' },
-    'Prompt Pulse': { pp: 1, pp_max: 5, type: 'Psychic' }
-  };
+  private combatUIMoveLabelTexts = this.combatUIMoveLabels.map((label) => label.toUpperCase());
+  private combatUIMovePP = [0, 0, 0, 1];
+  private combatUIMovePPMax = [20, 10, 15, 5];
+  private combatUIMoveTypes = ['Psychic', 'Steel', 'Steel', 'Psychic'];
+  // Move labels plus the "PP" and "TYPE/" headings, which never change once the grid is
+  // laid out, rasterized together so the panel's text is one blit instead of six
+  private combatUILabelLayer: HTMLCanvasElement | null = null;
   
   // Attack sequence
   private attackPulseImage: HTMLImageElement | null = null;
   private attackPulseEndImage: HTMLImageElement | null = null;
   private attackSequenceActive = false;
   private attackPulseVisible = false;
-  private attackPulseAlpha = 0;
   private attackPulseScale = 0.5;
-  private attackPulseTimer = 0;
-  private attackPulseDuration = 1000; // milliseconds
   private attackPulseEndVisible = false;
-  private attackPulseEndAlpha = 0;
-  private attackPulseEndTimer = 0;
-  private attackPulseEndDuration = 500;
+  private attackPulseEndX = 0;
+  private attackPulseEndY = 0;
+  // Timed fade-out phases as parallel arrays indexed by ATTACK_PULSE / ATTACK_PULSE_END
+  private attackPhaseTimers = new Float32Array(ATTACK_PHASE_COUNT);
+  private attackPhaseDurations = Float32Array.of(1000, 500); // milliseconds
+  private attackPhaseAlphas = new Float32Array(ATTACK_PHASE_COUNT);
 
   // Audio
   private musicVolume = 0.3;
@@ -223,134 +439,148 @@ export class HouseVillageScene {
 
   constructor(onChangeScene?: (sceneName: string) => void) {
     this.onChangeScene = onChangeScene;
+    this.buildWalkableGrid();
     this.loadAssets();
   }
 
+  private buildWalkableGrid(): void {
+    const cols = Math.floor(this.mapWidth / GRID_SIZE);
+    const rows = Math.floor(this.mapHeight / GRID_SIZE);
+    const grid = new Uint8Array(cols * rows);
+
+    const mark = (cellX: number, cellY: number) => {
+      if (cellX >= 0 && cellX < cols && cellY >= 0 && cellY < rows) {
+        grid[cellY * cols + cellX] = 1;
+      }
+    };
+    for (const [minX, minY, maxX, maxY] of this.walkableRectangles) {
+      for (let cellY = minY; cellY <= maxY; cellY++) {
+        for (let cellX = minX; cellX <= maxX; cellX++) {
+          mark(cellX, cellY);
+        }
+      }
+    }
+    for (const [cellX, cellY] of this.walkableCells) {
+      mark(cellX, cellY);
+    }
+
+    this.walkableGrid = grid;
+    this.walkableGridCols = cols;
+    this.walkableGridRows = rows;
+  }
+
+  private buildLugiaTriggerCells(): void {
+    // The row of cells directly below Lugia's 132px sprite
+    const leftCellX = Math.floor(this.lugiaTargetX / GRID_SIZE);
+    const rightCellX = Math.floor((this.lugiaTargetX + 132) / GRID_SIZE);
+    const bottomCellY = Math.floor((this.lugiaTargetY + 132) / GRID_SIZE);
+
+    this.lugiaTriggerCells.clear();
+    for (let cellX = leftCellX; cellX <= rightCellX; cellX++) {
+      this.lugiaTriggerCells.add(bottomCellY * this.walkableGridCols + cellX);
+    }
+  }
+
+  private isWalkableCell(cellX: number, cellY: number): boolean {
+    return (
+      cellX >= 0 &&
+      cellX < this.walkableGridCols &&
+      cellY >= 0 &&
+      cellY < this.walkableGridRows &&
+      this.walkableGrid[cellY * this.walkableGridCols + cellX] === 1
+    );
+  }
+
   private async loadAssets(): Promise<void> {
     try {
-      // Font should already be loaded by font_loader, but check anyway
-      if (document.fonts.check('32px "Pokemon Pixel Font"')) {
-        this.fontLoaded = true;
-      } else {
-        // Try to load if not already loaded
-        try {
-          const fontFace = new FontFace(
-            'Pokemon Pixel Font',
-            `url(${Config.FONTS_PATH}/pokemon_pixel_font.ttf)`
-          );
-          await fontFace.load();
-          document.fonts.add(fontFace);
-          this.fontLoaded = true;
-        } catch (error) {
-          console.warn('Unable to load Pokemon pixel font, using fallback:', error);
-          this.dialogFont = '32px Arial, sans-serif';
-        }
+      // Shared with App's startup load, so this normally resolves immediately
+      if (!(await loadPokemonFont())) {
+        console.warn('Unable to load Pokemon pixel font, using fallback');
+        this.dialogFont = '32px Arial, sans-serif';
       }
+      this.textCache.clear();
+      this.battleTextLayout = null;
+
+      // None of the images depend on each other, so fetch and decode them concurrently
+      const [
+        mapImage,
+        characterImg,
+        lugiaImg,
+        dialogImage,
+        exclamationImage,
+        fightingBackground,
+        battleDialog,
+        battleGrass,
+        battlePokemonstat,
+        battleWater,
+        battleVenuStat,
+        battleMenuUI,
+        trainerImg,
+      ] = await Promise.all([
+        loadCachedImage(IMAGE_PATHS.map),
+        loadCachedImage(IMAGE_PATHS.character),
+        loadCachedImage(IMAGE_PATHS.lugia),
+        loadCachedImage(IMAGE_PATHS.dialog),
+        loadCachedImage(IMAGE_PATHS.exclamation),
+        loadCachedImage(IMAGE_PATHS.fightingBackground),
+        loadCachedImage(IMAGE_PATHS.battleDialog),
+        loadCachedImage(IMAGE_PATHS.battleGrass),
+        loadCachedImage(IMAGE_PATHS.battleLugiaStat),
+        loadCachedImage(IMAGE_PATHS.battleWater),
+        loadCachedImage(IMAGE_PATHS.battleVenuStat),
+        loadCachedImage(IMAGE_PATHS.fightUI),
+        loadCachedImage(IMAGE_PATHS.battleTrainer),
+      ]);
 
       // Load map
-      this.mapImage = await loadImage(`${Config.IMAGES_PATH}/map_background.png`);
+      this.mapImage = mapImage;
       this.mapWidth = this.mapImage.width;
       this.mapHeight = this.mapImage.height;
+      this.maxCameraX = Math.max(0, this.mapWidth - Config.SCREEN_WIDTH);
+      this.maxCameraY = Math.max(0, this.mapHeight - Config.SCREEN_HEIGHT);
+      this.maxPlayerX = this.mapWidth - this.playerWidth - PLAYER_MAP_MARGIN;
+      this.maxPlayerY = this.mapHeight - this.playerHeight - PLAYER_MAP_MARGIN;
+      this.updateCamera();
+      this.buildWalkableGrid();
 
       // Load character sprite
-      const characterImg = await loadImage(`${Config.SPRITES_PATH}/character_red.png`);
       const characterSheet = new SpriteSheet(characterImg, 32, 42);
       this.characterSprite = new AnimatedSprite(characterSheet, 4);
 
       // Load Lugia sprites
-      const lugiaImg = await loadImage(`${Config.SPRITES_PATH}/lugia.png`);
-      const lugiaSheet = new SpriteSheet(lugiaImg, 132, 132);
-      const numFrames = Math.floor(lugiaImg.width / 132);
-      for (let i = 0; i < numFrames; i++) {
-        const sprite = lugiaSheet.getSpriteAsCanvas(0, i);
-        if (sprite) {
-          const img = new Image();
-          img.src = sprite.toDataURL();
-          await new Promise((resolve) => {
-            img.onload = resolve;
-          });
-          this.lugiaSprites.push(img);
-        }
-      }
+      this.lugiaSheet = new SpriteSheet(lugiaImg, 132, 132);
+      this.lugiaFrameCount = this.lugiaSheet.getFrameCount();
 
       // Calculate Lugia position
-      const lugiaTargetCellX = Math.floor(this.mapWidth / 32) / 2 - 3;
-      const lugiaTargetCellY = Math.floor(this.mapHeight / 32) / 4 - 5;
+      const lugiaTargetCellX = Math.floor(this.mapWidth / GRID_SIZE) / 2 - 3;
+      const lugiaTargetCellY = Math.floor(this.mapHeight / GRID_SIZE) / 4 - 5;
       const [lugiaPixelX, lugiaPixelY] = this.cellToPixel(lugiaTargetCellX, lugiaTargetCellY);
       this.lugiaTargetX = lugiaPixelX + 16;
       this.lugiaTargetY = lugiaPixelY;
       this.lugiaX = this.lugiaTargetX;
-
-      // Load dialog
-      this.dialogImage = await loadImage(`${Config.IMAGES_PATH}/dialog.png`);
-
-      // Load exclamation mark
-      this.exclamationImage = await loadImage(`${Config.IMAGES_PATH}/exclamation.png`);
-
-      // Load fighting background
-      this.fightingBackground = await loadImage(`${Config.IMAGES_PATH}/fighting_background.png`);
-
-      // Load battle UI
-      this.battleDialog = await loadImage(`${Config.IMAGES_PATH}/battle_dialog.png`);
-      this.battleGrass = await loadImage(`${Config.IMAGES_PATH}/battle_grass.png`);
-      this.battlePokemonstat = await loadImage(`${Config.IMAGES_PATH}/battle_lugia_stat.png`);
-      this.battleWater = await loadImage(`${Config.IMAGES_PATH}/battle_water.png`);
-      this.battleVenuStat = await loadImage(`${Config.IMAGES_PATH}/battle_venu_stat.png`);
-      this.battleMenuUI = await loadImage(`${Config.IMAGES_PATH}/fight_ui.png`);
-      this.bagScreenImage = await loadImage(`${Config.IMAGES_PATH}/screen-bag.png`).catch(() => null);
-      this.pokemonScreenImage = await loadImage(`${Config.IMAGES_PATH}/screen-party.jpg`).catch(() => null);
-      this.combatUI = await loadImage(`${Config.IMAGES_PATH}/combat-ui.png`).catch(() => null);
-      this.attackPulseImage = await loadImage(`${Config.IMAGES_PATH}/attack_pulse.png`).catch(() => null);
-      this.attackPulseEndImage = await loadImage(`${Config.IMAGES_PATH}/attack_pulse_end.png`).catch(() => null);
+      this.buildLugiaTriggerCells();
+
+      this.dialogImage = dialogImage;
+      this.dialogX = (Config.SCREEN_WIDTH - dialogImage.width) / 2;
+      this.dialogTargetY = Config.SCREEN_HEIGHT - dialogImage.height;
+      this.dialogTextOffsetY = (dialogImage.height - 32) / 2;
+      this.exclamationImage = exclamationImage;
+      this.exclamationWidth = exclamationImage.width;
+      this.exclamationHeight = exclamationImage.height;
+      this.fightingBackground = scaleImageTo(fightingBackground, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+
+      // Battle UI
+      this.battleDialog = battleDialog;
+      this.battleGrass = battleGrass;
+      this.battlePokemonstat = battlePokemonstat;
+      this.battleWater = battleWater;
+      this.battleVenuStat = battleVenuStat;
+      this.battleMenuUI = battleMenuUI;
+      this.setupBattleMenuLayout();
 
       // Load battle trainer
-      const trainerImg = await loadImage(`${Config.SPRITES_PATH}/battle_trainer.png`);
-      const trainerSheet = new SpriteSheet(trainerImg, 180, 128);
-      const numTrainerFrames = Math.floor(trainerImg.width / 180);
-      for (let i = 0; i < numTrainerFrames; i++) {
-        const sprite = trainerSheet.getSpriteAsCanvas(0, i);
-        if (sprite) {
-          const img = new Image();
-          img.src = sprite.toDataURL();
-          await new Promise((resolve) => {
-            img.onload = resolve;
-          });
-          this.battleTrainerSprites.push(img);
-        }
-      }
-
-      // Load battle Lugia GIF - keep visible but off-screen so browser animates it
-      // GIFs need to be visible (not display:none) and have proper dimensions to animate
-      const battleLugiaImg = document.createElement('img');
-      battleLugiaImg.style.position = 'fixed';
-      battleLugiaImg.style.left = '-2000px';
-      battleLugiaImg.style.top = '0';
-      battleLugiaImg.style.width = '232px'; // Actual display width
-      battleLugiaImg.style.height = 'auto';
-      battleLugiaImg.style.opacity = '0.01'; // Nearly invisible but still "visible" to browser
-      document.body.appendChild(battleLugiaImg);
-      await new Promise((resolve, reject) => {
-        battleLugiaImg.onload = resolve;
-        battleLugiaImg.onerror = reject;
-        battleLugiaImg.src = `${Config.SPRITES_PATH}/battle_lugia.gif`;
-      });
-      this.battleLugiaGif = battleLugiaImg;
-
-      // Load battle Venusaur GIF - keep visible but off-screen so browser animates it
-      const battleVenuImg = document.createElement('img');
-      battleVenuImg.style.position = 'fixed';
-      battleVenuImg.style.left = '-2000px';
-      battleVenuImg.style.top = '0';
-      battleVenuImg.style.width = '214px'; // Actual display width
-      battleVenuImg.style.height = 'auto';
-      battleVenuImg.style.opacity = '0.01'; // Nearly invisible but still "visible" to browser
-      document.body.appendChild(battleVenuImg);
-      await new Promise((resolve, reject) => {
-        battleVenuImg.onload = resolve;
-        battleVenuImg.onerror = reject;
-        battleVenuImg.src = `${Config.SPRITES_PATH}/battle_venu.gif`;
-      });
-      this.battleVenuGif = battleVenuImg;
+      this.battleTrainerSheet = new SpriteSheet(trainerImg, 180, 128);
+      this.battleTrainerFrameCount = this.battleTrainerSheet.getFrameCount();
 
       // Set up battle positions
       this.setupBattlePositions();
@@ -360,23 +590,74 @@ export class HouseVillageScene {
     } catch (error) {
       console.error('Error loading assets:', error);
     }
+    this.fullRedrawNeeded = true;
+  }
+
+  private loadBattleMenuAssets(): void {
+    // Screens and effects behind the battle menu; none of them are needed until the
+    // battle is underway, and each one is optional
+    if (this.battleMenuAssetsRequested) return;
+    this.battleMenuAssetsRequested = true;
+
+    const optionalImage = (src: string) => loadCachedImage(src).catch(() => null);
+    Promise.all([
+      optionalImage(IMAGE_PATHS.bagScreen),
+      optionalImage(IMAGE_PATHS.partyScreen),
+      optionalImage(IMAGE_PATHS.combatUI),
+      optionalImage(IMAGE_PATHS.attackPulse),
+      optionalImage(IMAGE_PATHS.attackPulseEnd),
+    ]).then(([bagScreenImage, pokemonScreenImage, combatUI, attackPulseImage, attackPulseEndImage]) => {
+      this.bagScreenImage = this.bakeScreenOverlay(bagScreenImage);
+      this.pokemonScreenImage = this.bakeScreenOverlay(pokemonScreenImage);
+      this.combatUI = combatUI;
+      this.setupCombatUILayout();
+      this.attackPulseImage = attackPulseImage;
+      this.attackPulseEndImage = attackPulseEndImage;
+      if (attackPulseEndImage) {
+        // Centered on screen
+        this.attackPulseEndX = Config.SCREEN_WIDTH / 2 - attackPulseEndImage.width / 2;
+        this.attackPulseEndY = Config.SCREEN_HEIGHT / 2 - attackPulseEndImage.height / 2;
+      }
+    });
+  }
+
+  private loadBattleGifs(): void {
+    // Animated GIFs have to live in the DOM to keep animating, and the browser keeps
+    // decoding them while they do, so they are only added once a battle is coming
+    if (this.battleGifsRequested) return;
+    this.battleGifsRequested = true;
+
+    Promise.all([
+      loadCachedAnimatedGif(IMAGE_PATHS.battleLugiaGif, 232),
+      loadCachedAnimatedGif(IMAGE_PATHS.battleVenuGif, 214),
+    ])
+      .then(([battleLugiaGif, battleVenuGif]) => {
+        this.battleLugiaGif = battleLugiaGif;
+        this.battleVenuGif = battleVenuGif;
+        this.setupBattleGifPositions();
+      })
+      .catch((error) => {
+        console.warn('Unable to load battle GIFs:', error);
+      });
   }
 
   private async loadAudio(): Promise<void> {
     try {
       // Load map music
-      await audioManager.loadMusic(`${Config.SOUNDS_PATH}/mtmoon.wav`, true);
+      await audioManager.loadMusic(MUSIC_PATHS.map, true);
       this.mapMusicLoaded = true;
 
-      // Load sound effects
-      await audioManager.loadSoundEffect('collision', `${Config.SOUNDS_PATH}/SFX_COLLISION.wav`);
-      await audioManager.loadSoundEffect('press_ab', `${Config.SOUNDS_PATH}/SFX_PRESS_AB.wav`);
-      await audioManager.loadSoundEffect('ball_toss', `${Config.SOUNDS_PATH}/SFX_BALL_TOSS.wav`);
-      await audioManager.loadSoundEffect('ball_poof', `${Config.SOUNDS_PATH}/SFX_BALL_POOF.wav`);
-      await audioManager.loadSoundEffect('denied', `${Config.SOUNDS_PATH}/SFX_DENIED.wav`);
-      await audioManager.loadSoundEffect('cry_17', `${Config.SOUNDS_PATH}/SFX_CRY_17.wav`);
-      await audioManager.loadSoundEffect('spore', `${Config.SOUNDS_PATH}/spore.wav`);
-      await audioManager.loadSoundEffect('spike_cannon', `${Config.SOUNDS_PATH}/spikecannon.wav`);
+      // Sound effects are preloaded without awaiting them, so scene startup doesn't
+      // wait on eight WAV downloads
+      audioManager.registerSoundEffect('collision', `${Config.SOUNDS_PATH}/SFX_COLLISION.wav`);
+      audioManager.registerSoundEffect('press_ab', `${Config.SOUNDS_PATH}/SFX_PRESS_AB.wav`);
+      audioManager.registerSoundEffect('ball_toss', `${Config.SOUNDS_PATH}/SFX_BALL_TOSS.wav`);
+      audioManager.registerSoundEffect('ball_poof', `${Config.SOUNDS_PATH}/SFX_BALL_POOF.wav`);
+      audioManager.registerSoundEffect('denied', `${Config.SOUNDS_PATH}/SFX_DENIED.wav`);
+      audioManager.registerSoundEffect('cry_17', `${Config.SOUNDS_PATH}/SFX_CRY_17.wav`);
+      audioManager.registerSoundEffect('spore', `${Config.SOUNDS_PATH}/spore.wav`);
+      audioManager.registerSoundEffect('spike_cannon', `${Config.SOUNDS_PATH}/spikecannon.wav`);
+      audioManager.preloadSoundEffects();
 
       // Set volumes
       audioManager.setMusicVolume(this.musicVolume);
@@ -391,46 +672,64 @@ export class HouseVillageScene {
 
     // Battle dialog
     this.battleDialogX = (Config.SCREEN_WIDTH - this.battleDialog.width) / 2;
+    // The dialog's top edge anchors everything stacked above it
     this.battleDialogY = Config.SCREEN_HEIGHT - this.battleDialog.height;
+    this.battleDialogCenterY = this.battleDialogY + this.battleDialog.height / 2;
 
     // Battle grass
-    this.battleGrassLeftX = -this.battleGrass.width;
-    if (this.battleDialog) {
-      this.battleGrassY = Config.SCREEN_HEIGHT - this.battleDialog.height - this.battleGrass.height;
-    }
-    this.battleGrassLeftTargetX = 0;
+    this.slideX[SLIDE_GRASS] = -this.battleGrass.width;
+    this.battleGrassY = this.battleDialogY - this.battleGrass.height;
+    this.slideTargetX[SLIDE_GRASS] = 0;
 
     // Battle trainer
-    if (this.battleTrainerSprites.length > 0) {
-      this.battleTrainerX = Config.SCREEN_WIDTH;
-      if (this.battleDialog) {
-        this.battleTrainerY = Config.SCREEN_HEIGHT - this.battleDialog.height - 128;
-      }
-      this.battleTrainerTargetX = 0;
+    if (this.battleTrainerFrameCount > 0) {
+      this.slideX[SLIDE_TRAINER] = Config.SCREEN_WIDTH;
+      this.battleTrainerY = this.battleDialogY - 128;
+      this.slideTargetX[SLIDE_TRAINER] = 0;
     }
 
     // Battle pokemonstat
-    this.battlePokemonstatX = -this.battlePokemonstat.width;
-    this.battlePokemonstatTargetX = 0;
+    this.slideX[SLIDE_POKEMONSTAT] = -this.battlePokemonstat.width;
+    this.slideTargetX[SLIDE_POKEMONSTAT] = 0;
     this.battlePokemonstatY = 0;
+    // Lugia health bar: 26px from the panel's right, 18px from its bottom
+    this.lugiaHealthBarOffsetX = this.battlePokemonstat.width - HEALTH_BAR_WIDTH - 26;
+    this.lugiaHealthBarOffsetY = this.battlePokemonstat.height - 18 - HEALTH_BAR_HEIGHT;
 
     // Battle water
-    this.battleWaterX = Config.SCREEN_WIDTH;
-    this.battleWaterTargetX = Config.SCREEN_WIDTH - this.battleWater.width;
-    if (this.battlePokemonstat) {
-      this.battleWaterY = this.battlePokemonstat.height;
+    this.slideX[SLIDE_WATER] = Config.SCREEN_WIDTH;
+    this.slideTargetX[SLIDE_WATER] = Config.SCREEN_WIDTH - this.battleWater.width;
+    this.battleWaterY = this.battlePokemonstat.height;
+
+    this.setupBattleGifPositions();
+
+    // Battle Venusaur stat
+    if (this.battleVenuStat) {
+      this.battleVenuStatX = Config.SCREEN_WIDTH - this.battleVenuStat.width;
+      // Venusaur health bar: 16px from the panel's right, 34px from its bottom
+      this.venusaurHealthBarOffsetX = this.battleVenuStat.width - HEALTH_BAR_WIDTH - 16;
+      this.venusaurHealthBarOffsetY = this.battleVenuStat.height - 34 - HEALTH_BAR_HEIGHT;
+      this.battleVenuStatY = this.battleDialogY - this.battleVenuStat.height;
     }
 
+    // Calculate slide speeds
+    this.calculateBattleSpeeds();
+  }
+
+  private setupBattleGifPositions(): void {
     // Battle Lugia
     if (this.battleLugiaGif && this.battleWater) {
       this.battleLugiaX = Config.SCREEN_WIDTH;
-      const waterCenterX = this.battleWaterTargetX + this.battleWater.width / 2;
+      const waterCenterX = this.slideTargetX[SLIDE_WATER] + this.battleWater.width / 2;
       const lugiaTargetWidth = 232; // Scaled width
       const lugiaScaleFactor = lugiaTargetWidth / this.battleLugiaGif.width;
       const lugiaScaledHeight = this.battleLugiaGif.height * lugiaScaleFactor;
       this.battleLugiaTargetX = waterCenterX - lugiaTargetWidth / 2;
       this.battleLugiaY = this.battleWaterY + this.battleWater.height - lugiaScaledHeight;
     }
+    if (this.battleLugiaGif) {
+      this.battleLugiaDrawHeight = this.getGifDrawHeight(this.battleLugiaGif, this.battleLugiaDrawWidth);
+    }
 
     // Battle Venusaur
     if (this.battleVenuGif) {
@@ -439,128 +738,155 @@ export class HouseVillageScene {
       const venuScaleFactor = venuTargetWidth / this.battleVenuGif.width;
       const venuScaledHeight = this.battleVenuGif.height * venuScaleFactor;
       if (this.battleDialog) {
-        this.battleVenuTargetY = Config.SCREEN_HEIGHT - this.battleDialog.height - venuScaledHeight + 40; // Decrease Y by 40px (was +80, now +40)
+        this.battleVenuTargetY = this.battleDialogY - venuScaledHeight + 40; // Decrease Y by 40px (was +80, now +40)
       }
       this.battleVenuX = 0;
+      this.battleVenuDrawHeight = this.getGifDrawHeight(this.battleVenuGif, this.battleVenuDrawWidth);
     }
+  }
 
-    // Battle Venusaur stat
-    if (this.battleVenuStat) {
-      this.battleVenuStatX = Config.SCREEN_WIDTH - this.battleVenuStat.width;
-      if (this.battleDialog) {
-        this.battleVenuStatY = Config.SCREEN_HEIGHT - this.battleDialog.height - this.battleVenuStat.height;
+  private getGifDrawHeight(gif: HTMLImageElement, drawWidth: number): number {
+    // Use natural dimensions to avoid stretching
+    const naturalWidth = gif.naturalWidth || gif.width;
+    const naturalHeight = gif.naturalHeight || gif.height;
+    return naturalHeight * (drawWidth / naturalWidth);
+  }
+
+  private setupBattleMenuLayout(): void {
+    if (!this.battleMenuUI) return;
+
+    // Position menu touching bottom right corner (no padding, like Python)
+    this.battleMenuX = Config.SCREEN_WIDTH - this.battleMenuUI.width;
+    this.battleMenuY = Config.SCREEN_HEIGHT - this.battleMenuUI.height;
+
+    // Calculate cell dimensions with padding (like Python version)
+    const usableWidth = this.battleMenuUI.width - (this.battleMenuPadding * 2);
+    const usableHeight = this.battleMenuUI.height - (this.battleMenuPadding * 2);
+    this.battleMenuOptionWidth = usableWidth / 2;
+    this.battleMenuOptionHeight = usableHeight / 2;
+
+    // Grid layout: [0=FIGHT (top-left), 1=BAG (top-right)] [2=POKEMON (bottom-left), 3=RUN (bottom-right)]
+    this.battleMenuCellRects = [0, 1, 2, 3].map((i) => ({
+      x: this.battleMenuX + this.battleMenuPadding + (i % 2) * this.battleMenuOptionWidth,
+      y: this.battleMenuY + this.battleMenuPadding + Math.floor(i / 2) * this.battleMenuOptionHeight,
+      width: this.battleMenuOptionWidth,
+      height: this.battleMenuOptionHeight,
+    }));
+  }
+
+  private setupCombatUILayout(): void {
+    if (!this.combatUI) return;
+
+    // Grid dimensions depend only on the panel image, so work them out once at load
+    // rather than every time Fight is picked
+    const usableWidth = this.combatUI.width - (this.combatUIPadding * 2);
+    const usableHeight = this.combatUI.height - (this.combatUIPadding * 2);
+    // Left grid: 2x2 for moves
+    this.combatUILeftGridContentWidth = usableWidth / 2; // Left half
+    this.combatUILeftCellWidth = this.combatUILeftGridContentWidth / this.combatUILeftGridCols;
+    this.combatUILeftCellHeight = usableHeight / this.combatUILeftGridRows;
+    // Right grid: 2x2 for PP and Type info
+    this.combatUIRightGridContentWidth = usableWidth / 2; // Right half
+    this.combatUIRightCellWidth = this.combatUIRightGridContentWidth / this.combatUIRightGridCols;
+    this.combatUIRightCellHeight = usableHeight / this.combatUIRightGridRows;
+    // Anchored to the bottom of the screen
+    this.combatUIY = Config.SCREEN_HEIGHT - this.combatUI.height;
+    this.combatUIRightGridX = this.combatUI.width - this.combatUIPadding - this.combatUIRightGridContentWidth;
+    // Move grid hit area
+    this.combatUILeftGridRect = {
+      x: this.combatUIPadding,
+      y: this.combatUIY + this.combatUIPadding,
+      width: this.combatUILeftGridContentWidth,
+      height: this.combatUILeftGridRows * this.combatUILeftCellHeight,
+    };
+  }
+
+  private getBattleMenuCellAt(x: number, y: number): number | null {
+    for (let i = 0; i < this.battleMenuCellRects.length; i++) {
+      if (pointInRect(x, y, this.battleMenuCellRects[i])) {
+        return i;
       }
     }
-
-    // Calculate slide speeds
-    this.calculateBattleSpeeds();
+    return null;
   }
 
   private calculateBattleSpeeds(): void {
-    const distances: Record<string, number> = {};
-    let maxDistance = 0;
-
+    // Scale each slide's speed by its share of the longest distance so every element
+    // arrives on the same frame; missing elements keep a distance of 0
+    const distances = this.battleSlideDistances;
+    distances.fill(0);
     if (this.battleGrass) {
-      const dist = Math.abs(this.battleGrassLeftTargetX - this.battleGrassLeftX);
-      distances['grass'] = dist;
-      maxDistance = Math.max(maxDistance, dist);
+      distances[SLIDE_GRASS] = Math.abs(this.slideTargetX[SLIDE_GRASS] - this.slideX[SLIDE_GRASS]);
     }
-
     if (this.battlePokemonstat) {
-      const dist = Math.abs(this.battlePokemonstatTargetX - this.battlePokemonstatX);
-      distances['pokemonstat'] = dist;
-      maxDistance = Math.max(maxDistance, dist);
+      distances[SLIDE_POKEMONSTAT] = Math.abs(this.slideTargetX[SLIDE_POKEMONSTAT] - this.slideX[SLIDE_POKEMONSTAT]);
     }
-
     if (this.battleWater) {
-      const dist = Math.abs(this.battleWaterTargetX - this.battleWaterX);
-      distances['water'] = dist;
-      maxDistance = Math.max(maxDistance, dist);
+      distances[SLIDE_WATER] = Math.abs(this.slideTargetX[SLIDE_WATER] - this.slideX[SLIDE_WATER]);
     }
-
-    if (this.battleTrainerSprites.length > 0) {
-      const dist = Math.abs(this.battleTrainerTargetX - this.battleTrainerX);
-      distances['trainer'] = dist;
-      maxDistance = Math.max(maxDistance, dist);
+    if (this.battleTrainerFrameCount > 0) {
+      distances[SLIDE_TRAINER] = Math.abs(this.slideTargetX[SLIDE_TRAINER] - this.slideX[SLIDE_TRAINER]);
     }
 
-    if (maxDistance > 0) {
-      if (distances['grass'] && distances['grass'] > 0) {
-        this.battleGrassSpeed = (distances['grass'] / maxDistance) * this.battleSlideSpeedBase;
-      }
-      if (distances['pokemonstat'] && distances['pokemonstat'] > 0) {
-        this.battlePokemonstatSpeed = (distances['pokemonstat'] / maxDistance) * this.battleSlideSpeedBase;
-      }
-      if (distances['water'] && distances['water'] > 0) {
-        this.battleWaterSpeed = (distances['water'] / maxDistance) * this.battleSlideSpeedBase;
-      }
-      if (distances['trainer'] && distances['trainer'] > 0) {
-        this.battleTrainerSpeed = (distances['trainer'] / maxDistance) * this.battleSlideSpeedBase;
+    const maxDistance = Math.max(...distances);
+    if (maxDistance <= 0) return;
+
+    for (let i = 0; i < SLIDE_COUNT; i++) {
+      if (distances[i] > 0) {
+        this.slideSpeed[i] = (distances[i] / maxDistance) * this.battleSlideSpeedBase;
       }
     }
   }
 
   private cellToPixel(cellX: number, cellY: number): [number, number] {
-    const gridSize = 32;
-    return [cellX * gridSize, cellY * gridSize];
+    return [cellX * GRID_SIZE, cellY * GRID_SIZE];
   }
 
   private handleBattleMenuSelection(option: number): void {
-    switch (option) {
-      case 0: // Fight
-        // Show combat UI instead of starting attack directly
-        if (this.combatUI) {
-          this.combatUIVisible = true;
-          audioManager.playSoundEffect('press_ab');
-          // Calculate combat UI grid dimensions
-          if (this.combatUI) {
-            const usableWidth = this.combatUI.width - (this.combatUIPadding * 2);
-            const usableHeight = this.combatUI.height - (this.combatUIPadding * 2);
-            // Left grid: 2x2 for moves
-            this.combatUILeftGridContentWidth = usableWidth / 2; // Left half
-            this.combatUILeftCellWidth = this.combatUILeftGridContentWidth / this.combatUILeftGridCols;
-            this.combatUILeftCellHeight = usableHeight / this.combatUILeftGridRows;
-            // Right grid: 2x2 for PP and Type info
-            this.combatUIRightGridContentWidth = usableWidth / 2; // Right half
-            this.combatUIRightCellWidth = this.combatUIRightGridContentWidth / this.combatUIRightGridCols;
-            this.combatUIRightCellHeight = usableHeight / this.combatUIRightGridRows;
-          }
-        }
-        break;
-      case 1: // Bag
-        if (this.bagScreenImage) {
-          this.bagScreenVisible = true;
-          this.battleMenuSelectedCell = 1; // Keep Bag highlighted
-          audioManager.playSoundEffect('press_ab');
-        }
-        break;
-      case 2: // Pokemon
-        if (this.pokemonScreenImage) {
-          this.pokemonScreenVisible = true;
-          this.battleMenuSelectedCell = 2; // Keep Pokemon highlighted
-          audioManager.playSoundEffect('press_ab');
-        }
-        break;
-      case 3: // Run
-        if (this.runTextVisible) {
-          // Clicking again deselects
-          this.runTextVisible = false;
-          this.battleMenuSelectedCell = null;
-        } else {
-          // Show "Venusaur can't run away!" text
-          this.runTextVisible = true;
-          this.runTextAlpha = 255;
-          this.battleMenuSelectedCell = 3; // Keep Run highlighted
-          audioManager.playSoundEffect('denied');
-        }
-        break;
+    this.battleMenuActions[option]?.();
+  }
+
+  private selectFight(): void {
+    // Show combat UI instead of starting attack directly
+    if (this.combatUI) {
+      this.combatUIVisible = true;
+      audioManager.playSoundEffect('press_ab');
+    }
+  }
+
+  private selectBag(): void {
+    if (this.bagScreenImage) {
+      this.bagScreenVisible = true;
+      this.battleMenuSelectedCell = MENU_BAG; // Keep Bag highlighted
+      audioManager.playSoundEffect('press_ab');
+    }
+  }
+
+  private selectPokemon(): void {
+    if (this.pokemonScreenImage) {
+      this.pokemonScreenVisible = true;
+      this.battleMenuSelectedCell = MENU_POKEMON; // Keep Pokemon highlighted
+      audioManager.playSoundEffect('press_ab');
+    }
+  }
+
+  private selectRun(): void {
+    if (this.runTextVisible) {
+      // Clicking again deselects
+      this.runTextVisible = false;
+      this.battleMenuSelectedCell = null;
+    } else {
+      // Show "Venusaur can't run away!" text
+      this.runTextVisible = true;
+      this.runTextAlpha = 255;
+      this.battleMenuSelectedCell = MENU_RUN; // Keep Run highlighted
+      audioManager.playSoundEffect('denied');
     }
   }
 
   onEnter(): void {
-    const gridSize = 32;
-    this.playerWorldX = 15 * gridSize + gridSize / 2;
-    this.playerWorldY = 6 * gridSize + gridSize / 2;
+    this.playerWorldX = 15 * GRID_SIZE + GRID_SIZE / 2;
+    this.playerWorldY = 6 * GRID_SIZE + GRID_SIZE / 2;
     this.updateCamera();
     this.movingUp = false;
     this.movingDown = false;
@@ -570,55 +896,131 @@ export class HouseVillageScene {
 
     // Start map music
     if (this.mapMusicLoaded) {
-      audioManager.playMusic(`${Config.SOUNDS_PATH}/mtmoon.wav`, true);
+      audioManager.playMusic(MUSIC_PATHS.map, true);
       this.battleMusicStarted = false;
     }
   }
 
+  // Map and encounter state, restored on every restart
+  private resetMapState(): void {
+    this.lugiaState = 'hidden';
+    this.lugiaY = -200;
+    this.lugiaAnimationComplete = false;
+    this.lugiaCryFinished = false;
+    this.dialogVisible = false;
+    this.dialogFullyVisible = false;
+    this.dialogSlideY = Config.SCREEN_HEIGHT;
+    this.fadeState = 'none';
+    this.fadeAlpha = 0;
+  }
+
+  // Battle state only changes once the fade into battle begins, so a restart from
+  // the map can skip it
+  private resetBattleState(): void {
+    this.battleAnimationsStarted = false;
+    // Text messages
+    this.runTextVisible = false;
+    this.runTextAlpha = 255;
+    this.fullHPTextVisible = false;
+    this.fullHPTextAlpha = 255;
+    this.battleMenuSelectedCell = null;
+    // Hover trackers use null as "nothing under the pointer"
+    this.battleMenuHoveredOption = null;
+    this.combatUIHoveredCell = null;
+    this.combatUIVisible = false;
+    this.ballPoofPlayed = false;
+    this.battleMenuVisible = false;
+    this.battleMenuCursorPos = 0;
+    this.allBattleElementsSlidIn = false;
+    this.attackSequenceActive = false;
+    this.attackPulseVisible = false;
+    this.attackPulseEndVisible = false;
+  }
+
+  getInterestedEventTypes(): ReadonlySet<string> {
+    const hoverable =
+      this.fadeState === 'faded' &&
+      (this.combatUIVisible || this.battleMenuVisible) &&
+      !this.bagScreenVisible &&
+      !this.pokemonScreenVisible;
+    return hoverable ? HOVER_EVENT_TYPES : INTERESTED_EVENT_TYPES;
+  }
+
+  getDirtyRects(): Rect[] | null {
+    // The battle screen is made of animated GIFs, so it always repaints in full
+    if (this.fullRedrawNeeded || this.fadeState !== 'none') {
+      this.fullRedrawNeeded = false;
+      this.playerDirty = false;
+      this.lugiaDirty = false;
+      this.lastPlayerRegion = this.getPlayerRegion();
+      this.lastLugiaRegion = this.getLugiaRegion();
+      return null;
+    }
+
+    // With the camera still, repaint only where a moving sprite was and now is
+    const rects: Rect[] = [];
+    if (this.playerDirty) {
+      this.playerDirty = false;
+      const region = this.getPlayerRegion();
+      rects.push(this.lastPlayerRegion ?? region, region);
+      this.lastPlayerRegion = region;
+    }
+    if (this.lugiaDirty) {
+      this.lugiaDirty = false;
+      const region = this.getLugiaRegion();
+      rects.push(this.lastLugiaRegion ?? region, region);
+      this.lastLugiaRegion = region;
+    }
+    return rects;
+  }
+
+  private getPlayerRegion(): Rect {
+    // Player sprite plus headroom for the bouncing exclamation mark, padded a pixel
+    // on each side to cover fractional positions
+    const exclamationHeight = this.exclamationImage ? this.exclamationHeight + 25 : 0;
+    const width = Math.max(this.playerWidth, this.exclamationWidth);
+    const x = this.playerWorldX - this.cameraX + (this.playerWidth - width) / 2;
+    const y = this.playerWorldY - this.cameraY - exclamationHeight;
+    return {
+      x: Math.floor(x) - 1,
+      y: Math.floor(y) - 1,
+      width: Math.ceil(width) + 2,
+      height: Math.ceil(this.playerHeight + exclamationHeight) + 2,
+    };
+  }
+
+  private getLugiaRegion(): Rect {
+    const x = this.lugiaX - this.cameraX;
+    const y = this.lugiaY - this.cameraY;
+    return { x: Math.floor(x) - 1, y: Math.floor(y) - 1, width: 134, height: 134 };
+  }
+
   handleEvent(event: KeyboardEvent | MouseEvent): void {
+    // Only input that changes the whole screen asks for a full repaint; movement goes
+    // through the player region update() marks. Battle-screen input (menus, bag,
+    // hover) needs nothing extra, since getDirtyRects repaints in full once fading.
     // Mark user interaction for audio
     if (!this.userHasInteracted) {
       this.userHasInteracted = true;
       if (this.mapMusicLoaded && !this.battleMusicStarted) {
-        audioManager.playMusic(`${Config.SOUNDS_PATH}/mtmoon.wav`, true);
+        audioManager.playMusic(MUSIC_PATHS.map, true);
       }
     }
 
     if (event instanceof KeyboardEvent) {
+      const move = MOVE_KEYS.get(event.key);
       if (event.type === 'keydown') {
         if (event.key === 'r' || event.key === 'R') {
-          this.onEnter();
-          this.lugiaState = 'hidden';
-          this.lugiaY = -200;
-          this.lugiaAnimationComplete = false;
-          this.dialogVisible = false;
-          this.dialogFullyVisible = false;
-          this.dialogSlideY = Config.SCREEN_HEIGHT;
-          this.fadeState = 'none';
-          this.fadeAlpha = 0;
-          this.battleAnimationsStarted = false;
-          
-          // Reset text messages
-          this.runTextVisible = false;
-          this.runTextAlpha = 255;
-          this.fullHPTextVisible = false;
-          this.fullHPTextAlpha = 255;
-          this.battleMenuSelectedCell = null;
-          this.combatUIVisible = false;
-          this.ballPoofPlayed = false;
-          this.battleMenuVisible = false;
-          this.battleMenuCursorPos = 0;
-          this.lugiaCryFinished = false;
-          this.allBattleElementsSlidIn = false;
-          this.attackSequenceActive = false;
-          this.attackPulseVisible = false;
-          this.attackPulseEndVisible = false;
-          // Stop any playing music and restart map music
+          const battleReached = this.fadeState !== 'none';
+          // Stop whatever is playing first, so onEnter's map music starts over from the
+          // top with a single load instead of being started and then restarted
           audioManager.stopMusic();
-          if (this.mapMusicLoaded) {
-            audioManager.playMusic(`${Config.SOUNDS_PATH}/mtmoon.wav`, true);
-            this.battleMusicStarted = false;
+          this.onEnter();
+          this.resetMapState();
+          if (battleReached) {
+            this.resetBattleState();
           }
+          this.fullRedrawNeeded = true;
           return;
         }
 
@@ -630,25 +1032,25 @@ export class HouseVillageScene {
 
         // Battle menu navigation
         if (this.battleMenuVisible && this.fadeState === 'faded') {
-          if (event.key === 'ArrowUp' || event.key === 'w' || event.key === 'W') {
+          if (move === 'up') {
             if (this.battleMenuCursorPos === 2 || this.battleMenuCursorPos === 3) {
               this.battleMenuCursorPos -= 2;
               audioManager.playSoundEffect('press_ab');
             }
             return;
-          } else if (event.key === 'ArrowDown' || event.key === 's' || event.key === 'S') {
+          } else if (move === 'down') {
             if (this.battleMenuCursorPos === 0 || this.battleMenuCursorPos === 1) {
               this.battleMenuCursorPos += 2;
               audioManager.playSoundEffect('press_ab');
             }
             return;
-          } else if (event.key === 'ArrowLeft' || event.key === 'a' || event.key === 'A') {
+          } else if (move === 'left') {
             if (this.battleMenuCursorPos === 1 || this.battleMenuCursorPos === 3) {
               this.battleMenuCursorPos -= 1;
               audioManager.playSoundEffect('press_ab');
             }
             return;
-          } else if (event.key === 'ArrowRight' || event.key === 'd' || event.key === 'D') {
+          } else if (move === 'right') {
             if (this.battleMenuCursorPos === 0 || this.battleMenuCursorPos === 2) {
               this.battleMenuCursorPos += 1;
               audioManager.playSoundEffect('press_ab');
@@ -659,7 +1061,7 @@ export class HouseVillageScene {
             audioManager.playSoundEffect('press_ab');
             this.handleBattleMenuSelection(this.battleMenuCursorPos);
             return;
-          } else if (event.key === 'Escape' || event.key === 'Escape') {
+          } else if (event.key === 'Escape') {
             // Close bag/pokemon screens
             if (this.bagScreenVisible) {
               this.bagScreenVisible = false;
@@ -674,86 +1076,78 @@ export class HouseVillageScene {
           }
         }
 
-        if (event.key === 'ArrowUp' || event.key === 'w' || event.key === 'W') {
+        // Auto-repeat keydowns for a held key would only re-set the same flags
+        if (event.repeat) {
+          return;
+        }
+
+        if (move === 'up') {
           this.movingUp = true;
           this.currentDirection = 1;
-        } else if (event.key === 'ArrowDown' || event.key === 's' || event.key === 'S') {
+        } else if (move === 'down') {
           this.movingDown = true;
           this.currentDirection = 0;
-        } else if (event.key === 'ArrowLeft' || event.key === 'a' || event.key === 'A') {
+        } else if (move === 'left') {
           this.movingLeft = true;
           this.currentDirection = 3;
-        } else if (event.key === 'ArrowRight' || event.key === 'd' || event.key === 'D') {
+        } else if (move === 'right') {
           this.movingRight = true;
           this.currentDirection = 2;
         }
+        if (move) {
+          // The sprite may turn to face the key even where it cannot step
+          this.playerDirty = true;
+        }
         this.keys.add(event.key);
       } else if (event.type === 'keyup') {
-        if (event.key === 'ArrowUp' || event.key === 'w' || event.key === 'W') {
+        if (move === 'up') {
           this.movingUp = false;
-        } else if (event.key === 'ArrowDown' || event.key === 's' || event.key === 'S') {
+        } else if (move === 'down') {
           this.movingDown = false;
-        } else if (event.key === 'ArrowLeft' || event.key === 'a' || event.key === 'A') {
+        } else if (move === 'left') {
           this.movingLeft = false;
-        } else if (event.key === 'ArrowRight' || event.key === 'd' || event.key === 'D') {
+        } else if (move === 'right') {
           this.movingRight = false;
         }
         this.keys.delete(event.key);
       }
     } else if (event instanceof MouseEvent) {
-      // Mark user interaction
-      if (!this.userHasInteracted) {
-        this.userHasInteracted = true;
-        if (this.mapMusicLoaded && !this.battleMusicStarted) {
-          audioManager.playMusic(`${Config.SOUNDS_PATH}/mtmoon.wav`, true);
-        }
-      }
-
       if (event.type === 'mousedown') {
+        // Clicks open and close menus, overlays and texts, or start the fade into battle
+        this.fullRedrawNeeded = true;
+
+        // Every hit-test below works in canvas pixels, so convert once per click
+        const point = this.toCanvasPoint(event);
+
         // Handle combat UI clicks (for Prompt Pulse)
         if (this.combatUIVisible && this.combatUI && !this.bagScreenVisible && !this.pokemonScreenVisible) {
-          const canvas = (event.target as HTMLElement).closest('canvas') as HTMLCanvasElement;
-          if (canvas) {
-            const rect = canvas.getBoundingClientRect();
-            const scaleX = canvas.width / rect.width;
-            const scaleY = canvas.height / rect.height;
-            const x = (event.clientX - rect.left) * scaleX;
-            const y = (event.clientY - rect.top) * scaleY;
-            
-            const combatUIX = 0;
-            const combatUIY = Config.SCREEN_HEIGHT - this.combatUI.height;
-            const leftGridX = combatUIX + this.combatUIPadding;
-            const leftGridY = combatUIY + this.combatUIPadding;
+          if (point) {
+            const [x, y] = point;
             
             // Check if click is on left grid (moves)
-            if (x >= leftGridX && x <= leftGridX + this.combatUILeftGridContentWidth &&
-                y >= leftGridY && y <= leftGridY + (this.combatUILeftGridRows * this.combatUILeftCellHeight)) {
-              const relativeX = x - leftGridX;
-              const relativeY = y - leftGridY;
+            if (pointInRect(x, y, this.combatUILeftGridRect)) {
+              const relativeX = x - this.combatUILeftGridRect.x;
+              const relativeY = y - this.combatUILeftGridRect.y;
+              // pointInRect already bounds the offsets to the grid, so no clamp is needed
               const col = Math.floor(relativeX / this.combatUILeftCellWidth);
               const row = Math.floor(relativeY / this.combatUILeftCellHeight);
-              const clampedCol = Math.max(0, Math.min(col, 1));
-              const clampedRow = Math.max(0, Math.min(row, 1));
-              const moveIndex = clampedRow * this.combatUILeftGridCols + clampedCol;
+              const moveIndex = row * this.combatUILeftGridCols + col;
               
               if (moveIndex < this.combatUIMoveLabels.length) {
-                const moveName = this.combatUIMoveLabels[moveIndex];
-                
                 // Play denied sound for greyed out moves, press AB for Prompt Pulse
-                if (moveName === 'Context Recall' || moveName === 'Syntax Slash' || moveName === 'Debug Dash') {
+                if (this.combatUIMovePP[moveIndex] === 0) {
                   audioManager.playSoundEffect('denied');
-                } else if (moveName === 'Prompt Pulse') {
+                } else {
                   audioManager.playSoundEffect('press_ab');
                   // Start attack sequence
                   if (!this.attackSequenceActive && this.attackPulseImage) {
                     this.attackSequenceActive = true;
                     this.attackPulseVisible = true;
-                    this.attackPulseAlpha = 255;
                     this.attackPulseScale = 0.5;
-                    this.attackPulseTimer = 0;
                     this.attackPulseEndVisible = false;
-                    this.attackPulseEndAlpha = 0;
-                    this.attackPulseEndTimer = 0;
+                    this.attackPhaseTimers.fill(0);
+                    this.attackPhaseAlphas[ATTACK_PULSE] = 255;
+                    this.attackPhaseAlphas[ATTACK_PULSE_END] = 0;
                     this.combatUIVisible = false; // Hide combat UI when attack starts
                     audioManager.playSoundEffect('spore'); // Play attack sound
                   }
@@ -766,40 +1160,15 @@ export class HouseVillageScene {
         
         // Handle battle menu clicks (accounting for padding like Python version)
         if (this.battleMenuVisible && this.fadeState === 'faded' && !this.bagScreenVisible && !this.pokemonScreenVisible && !this.combatUIVisible) {
-          const canvas = (event.target as HTMLElement).closest('canvas') as HTMLCanvasElement;
-          if (canvas) {
-            const rect = canvas.getBoundingClientRect();
-            const scaleX = canvas.width / rect.width;
-            const scaleY = canvas.height / rect.height;
-            const x = (event.clientX - rect.left) * scaleX;
-            const y = (event.clientY - rect.top) * scaleY;
+          if (point) {
+            const [x, y] = point;
             
-            // Check if click is within menu bounds
-            if (x >= this.battleMenuX && x <= this.battleMenuX + this.battleMenuUI!.width &&
-                y >= this.battleMenuY && y <= this.battleMenuY + this.battleMenuUI!.height) {
-              // Calculate relative position accounting for padding (like Python)
-              const relativeX = x - this.battleMenuX - this.battleMenuPadding;
-              const relativeY = y - this.battleMenuY - this.battleMenuPadding;
-              const usableWidth = this.battleMenuUI!.width - (this.battleMenuPadding * 2);
-              const usableHeight = this.battleMenuUI!.height - (this.battleMenuPadding * 2);
-              
-              // Check if within usable area (excluding padding)
-              if (relativeX >= 0 && relativeX < usableWidth && relativeY >= 0 && relativeY < usableHeight) {
-                // Determine which cell (row, col) - Python uses (row, col) format
-                const col = Math.floor(relativeX / this.battleMenuOptionWidth);
-                const row = Math.floor(relativeY / this.battleMenuOptionHeight);
-                // Clamp to valid range
-                const clampedCol = Math.max(0, Math.min(col, 1));
-                const clampedRow = Math.max(0, Math.min(row, 1));
-                // Convert (row, col) to option index: row 0, col 0 = 0 (FIGHT), row 0, col 1 = 1 (BAG), row 1, col 0 = 2 (POKEMON), row 1, col 1 = 3 (RUN)
-                const clickedOption = clampedRow * 2 + clampedCol;
-                
-                if (clickedOption >= 0 && clickedOption < 4) {
-                  audioManager.playSoundEffect('press_ab');
-                  this.handleBattleMenuSelection(clickedOption);
-                  return;
-                }
-              }
+            // Options tile the menu inside its padding; clicks on the border miss
+            const clickedOption = this.getBattleMenuCellAt(x, y);
+            if (clickedOption !== null) {
+              audioManager.playSoundEffect('press_ab');
+              this.handleBattleMenuSelection(clickedOption);
+              return;
             }
           }
         }
@@ -818,27 +1187,16 @@ export class HouseVillageScene {
         
         // Handle bag screen USE button click
         if (this.bagScreenVisible && this.bagScreenImage) {
-          const canvas = (event.target as HTMLElement).closest('canvas') as HTMLCanvasElement;
-          if (canvas) {
-            const rect = canvas.getBoundingClientRect();
-            const scaleX = canvas.width / rect.width;
-            const scaleY = canvas.height / rect.height;
-            const x = (event.clientX - rect.left) * scaleX;
-            const y = (event.clientY - rect.top) * scaleY;
+          if (point) {
+            const [x, y] = point;
             
             // Check if click is on USE button (bottom right area)
-            const textBoxWidth = 96;
-            const textBoxHeight = 21;
-            const textBoxX = Config.SCREEN_WIDTH - 8 - textBoxWidth;
-            const textBoxY = Config.SCREEN_HEIGHT - 22 - textBoxHeight;
-            
-            if (x >= textBoxX && x <= textBoxX + textBoxWidth &&
-                y >= textBoxY && y <= textBoxY + textBoxHeight) {
+            if (pointInRect(x, y, BAG_USE_BUTTON_RECT)) {
               // USE button clicked - show full HP message
               this.fullHPTextVisible = true;
               this.fullHPTextAlpha = 255;
               this.bagScreenVisible = false;
-              this.battleMenuSelectedCell = 1; // Keep Bag highlighted
+              this.battleMenuSelectedCell = MENU_BAG; // Keep Bag highlighted
               audioManager.playSoundEffect('denied');
               return;
             }
@@ -863,99 +1221,77 @@ export class HouseVillageScene {
           }
         }
       } else if (event.type === 'mousemove') {
+        // Hover only matters on the battle screen with no full-screen overlay open,
+        // so every other pointer move is dropped with one check
+        if (this.fadeState !== 'faded' || this.bagScreenVisible || this.pokemonScreenVisible) return;
+        const point = this.toCanvasPoint(event);
+        if (!point) {
+          // Pointer left the canvas, so nothing is hovered any more
+          this.combatUIHoveredCell = null;
+          this.battleMenuHoveredOption = null;
+          return;
+        }
+        const [x, y] = point;
+
         // Handle mouse hover for combat UI
-        if (this.combatUIVisible && this.combatUI && !this.bagScreenVisible && !this.pokemonScreenVisible) {
-          const canvas = (event.target as HTMLElement).closest('canvas') as HTMLCanvasElement;
-          if (canvas) {
-            const rect = canvas.getBoundingClientRect();
-            const scaleX = canvas.width / rect.width;
-            const scaleY = canvas.height / rect.height;
-            const x = (event.clientX - rect.left) * scaleX;
-            const y = (event.clientY - rect.top) * scaleY;
-            
-            const combatUIX = 0;
-            const combatUIY = Config.SCREEN_HEIGHT - this.combatUI.height;
-            const leftGridX = combatUIX + this.combatUIPadding;
-            const leftGridY = combatUIY + this.combatUIPadding;
-            
-            // Check if mouse is on left grid (moves)
-            if (x >= leftGridX && x <= leftGridX + this.combatUILeftGridContentWidth &&
-                y >= leftGridY && y <= leftGridY + (this.combatUILeftGridRows * this.combatUILeftCellHeight)) {
-              const relativeX = x - leftGridX;
-              const relativeY = y - leftGridY;
-              const col = Math.floor(relativeX / this.combatUILeftCellWidth);
-              const row = Math.floor(relativeY / this.combatUILeftCellHeight);
-              const clampedCol = Math.max(0, Math.min(col, 1));
-              const clampedRow = Math.max(0, Math.min(row, 1));
-              this.combatUIHoveredCell = { gridSide: 'left', row: clampedRow, col: clampedCol };
-            } else {
-              this.combatUIHoveredCell = null;
-            }
+        if (this.combatUIVisible && this.combatUI) {
+          // Check if mouse is on left grid (moves)
+          if (pointInRect(x, y, this.combatUILeftGridRect)) {
+            const relativeX = x - this.combatUILeftGridRect.x;
+            const relativeY = y - this.combatUILeftGridRect.y;
+            const col = Math.floor(relativeX / this.combatUILeftCellWidth);
+            const row = Math.floor(relativeY / this.combatUILeftCellHeight);
+            this.combatUIHoveredCell = { gridSide: 'left', row, col };
+          } else {
+            this.combatUIHoveredCell = null;
           }
-        }
-        
-        // Handle mouse hover for battle menu (accounting for padding like Python version)
-        if (this.battleMenuVisible && this.fadeState === 'faded' && !this.bagScreenVisible && !this.pokemonScreenVisible && !this.combatUIVisible) {
-          const canvas = (event.target as HTMLElement).closest('canvas') as HTMLCanvasElement;
-          if (canvas) {
-            const rect = canvas.getBoundingClientRect();
-            const scaleX = canvas.width / rect.width;
-            const scaleY = canvas.height / rect.height;
-            const x = (event.clientX - rect.left) * scaleX;
-            const y = (event.clientY - rect.top) * scaleY;
-            
-            // Check if mouse is within menu bounds
-            if (x >= this.battleMenuX && x <= this.battleMenuX + this.battleMenuUI!.width &&
-                y >= this.battleMenuY && y <= this.battleMenuY + this.battleMenuUI!.height) {
-              // Calculate relative position accounting for padding (like Python)
-              const relativeX = x - this.battleMenuX - this.battleMenuPadding;
-              const relativeY = y - this.battleMenuY - this.battleMenuPadding;
-              const usableWidth = this.battleMenuUI!.width - (this.battleMenuPadding * 2);
-              const usableHeight = this.battleMenuUI!.height - (this.battleMenuPadding * 2);
-              
-              // Check if within usable area (excluding padding)
-              if (relativeX >= 0 && relativeX < usableWidth && relativeY >= 0 && relativeY < usableHeight) {
-                // Determine which cell (row, col) - Python uses (row, col) format
-                const col = Math.floor(relativeX / this.battleMenuOptionWidth);
-                const row = Math.floor(relativeY / this.battleMenuOptionHeight);
-                // Clamp to valid range
-                const clampedCol = Math.max(0, Math.min(col, 1));
-                const clampedRow = Math.max(0, Math.min(row, 1));
-                // Convert (row, col) to option index
-                const hoveredOption = clampedRow * 2 + clampedCol;
-                
-                if (hoveredOption >= 0 && hoveredOption < 4) {
-                  this.battleMenuHoveredOption = hoveredOption;
-                  this.battleMenuCursorPos = hoveredOption;
-                } else {
-                  this.battleMenuHoveredOption = null;
-                }
-              } else {
-                this.battleMenuHoveredOption = null;
-              }
-            } else {
-              this.battleMenuHoveredOption = null;
-            }
+        } else if (this.battleMenuVisible) {
+          // Handle mouse hover for battle menu (accounting for padding like Python version)
+          const hoveredOption = this.getBattleMenuCellAt(x, y);
+          this.battleMenuHoveredOption = hoveredOption;
+          if (hoveredOption !== null) {
+            this.battleMenuCursorPos = hoveredOption;
           }
         }
       }
     }
   }
 
+  private toCanvasPoint(event: MouseEvent): [number, number] | null {
+    // Client coordinates to canvas pixels; the canvas is displayed scaled up
+    const canvas = (event.target as HTMLElement).closest('canvas');
+    if (!canvas) return null;
+    const rect = canvas.getBoundingClientRect();
+    return [
+      (event.clientX - rect.left) * (canvas.width / rect.width),
+      (event.clientY - rect.top) * (canvas.height / rect.height),
+    ];
+  }
+
   private updateCamera(): void {
     const targetCameraX = this.playerWorldX - Config.SCREEN_WIDTH / 2;
     const targetCameraY = this.playerWorldY - Config.SCREEN_HEIGHT / 2;
 
-    const minCameraX = 0;
-    const maxCameraX = Math.max(0, this.mapWidth - Config.SCREEN_WIDTH);
-    const minCameraY = 0;
-    const maxCameraY = Math.max(0, this.mapHeight - Config.SCREEN_HEIGHT);
-
-    this.cameraX = Math.max(minCameraX, Math.min(targetCameraX, maxCameraX));
-    this.cameraY = Math.max(minCameraY, Math.min(targetCameraY, maxCameraY));
+    // Whole pixels, so the map's visible window is copied 1:1 instead of resampled
+    this.cameraX = Math.round(Math.max(0, Math.min(targetCameraX, this.maxCameraX)));
+    this.cameraY = Math.round(Math.max(0, Math.min(targetCameraY, this.maxCameraY)));
   }
 
   update(deltaTime: number): void {
+    // Speeds are tuned per 60fps frame; scale every time-based ramp by the same factor
+    const frameScale = deltaTime / 16.67;
+    const prevCameraX = this.cameraX;
+    const prevCameraY = this.cameraY;
+    const prevPlayerX = this.playerWorldX;
+    const prevPlayerY = this.playerWorldY;
+    const prevLugiaY = this.lugiaY;
+    const prevLugiaFrame = this.lugiaCurrentFrame;
+    const prevLugiaState = this.lugiaState;
+    const prevDialogVisible = this.dialogVisible;
+    const prevDialogSlideY = this.dialogSlideY;
+    const prevExclamationVisible = this.exclamationVisible;
+    let playerAnimating = false;
+
     // Stop player movement when dialog is visible
     if (this.dialogVisible || (this.lugiaState !== 'hidden' && !this.lugiaAnimationComplete)) {
       // Player cannot move
@@ -984,39 +1320,19 @@ export class HouseVillageScene {
         let newX = this.playerWorldX + dx;
         let newY = this.playerWorldY + dy;
 
-        const margin = 10;
-        newX = Math.max(margin, Math.min(newX, this.mapWidth - this.playerWidth - margin));
-        newY = Math.max(margin, Math.min(newY, this.mapHeight - this.playerHeight - margin));
+        newX = Math.max(PLAYER_MAP_MARGIN, Math.min(newX, this.maxPlayerX));
+        newY = Math.max(PLAYER_MAP_MARGIN, Math.min(newY, this.maxPlayerY));
 
-        const gridSize = 32;
         const playerCenterX = newX + this.playerWidth / 2;
         const playerCenterY = newY + this.playerHeight / 2;
-        const playerCellX = Math.floor(playerCenterX / gridSize);
-        const playerCellY = Math.floor(playerCenterY / gridSize);
+        const playerCellX = playerCenterX >> GRID_SHIFT;
+        const playerCellY = playerCenterY >> GRID_SHIFT;
 
-        let isWalkable = false;
-
-        // Check rectangles
-        for (const [minX, minY, maxX, maxY] of this.walkableRectangles) {
-          if (playerCellX >= minX && playerCellX <= maxX && playerCellY >= minY && playerCellY <= maxY) {
-            isWalkable = true;
-            break;
-          }
-        }
-
-        // Check individual cells
-        if (!isWalkable) {
-          for (const [cellX, cellY] of this.walkableCells) {
-            if (playerCellX === cellX && playerCellY === cellY) {
-              isWalkable = true;
-              break;
-            }
-          }
-        }
-
-        if (isWalkable) {
+        if (this.isWalkableCell(playerCellX, playerCellY)) {
           this.playerWorldX = newX;
           this.playerWorldY = newY;
+          // The camera only follows the player, so it only needs updating on a move
+          this.updateCamera();
         } else {
           // Play collision sound when hitting border
           audioManager.playSoundEffect('collision');
@@ -1025,30 +1341,30 @@ export class HouseVillageScene {
       }
     }
 
-    this.updateCamera();
-
     // Update animation
     if (this.characterSprite) {
       const canMove = this.lugiaState === 'hidden' || this.lugiaAnimationComplete;
       const isMoving = (this.movingUp || this.movingDown || this.movingLeft || this.movingRight) && canMove;
+      // A sprite that just stopped still needs one redraw to reset to its idle frame
+      playerAnimating = isMoving || this.playerWasMoving;
+      this.playerWasMoving = isMoving;
       this.characterSprite.update(this.currentDirection, isMoving, deltaTime);
     }
 
-    // Check if player is under Lugia
-    const gridSize = 32;
-    const lugiaLeftCellX = Math.floor(this.lugiaTargetX / gridSize);
-    const lugiaRightCellX = Math.floor((this.lugiaTargetX + 132) / gridSize);
-    const lugiaBottomY = this.lugiaTargetY + 132;
-    const lugiaBottomCellY = Math.floor(lugiaBottomY / gridSize);
-
-    const playerCellX = Math.floor((this.playerWorldX + this.playerWidth / 2) / gridSize);
-    const playerCellY = Math.floor((this.playerWorldY + this.playerHeight / 2) / gridSize);
-
-    const underLugia = lugiaLeftCellX <= playerCellX && playerCellX <= lugiaRightCellX && playerCellY === lugiaBottomCellY;
+    // Check if player is under Lugia (only matters until the encounter starts)
+    let underLugia = false;
+    if (this.lugiaState === 'hidden') {
+      const playerCellX = (this.playerWorldX + this.playerWidth / 2) >> GRID_SHIFT;
+      const playerCellY = (this.playerWorldY + this.playerHeight / 2) >> GRID_SHIFT;
+      underLugia = this.lugiaTriggerCells.has(playerCellY * this.walkableGridCols + playerCellX);
+    }
 
     // Update Lugia state machine
     if (this.lugiaState === 'hidden' && underLugia) {
       this.lugiaState = 'flying_in';
+      // The battle follows the encounter, so start fetching its GIFs and menu assets now
+      this.loadBattleGifs();
+      this.loadBattleMenuAssets();
       // Show exclamation mark when encountering Lugia
       if (!this.exclamationVisible) {
         this.exclamationVisible = true;
@@ -1066,14 +1382,14 @@ export class HouseVillageScene {
         this.lugiaCurrentFrame = 0;
       }
     } else if (this.lugiaState === 'animating') {
-      if (this.lugiaSprites.length > 0) {
-        this.lugiaAnimationTime += this.lugiaAnimationSpeed * (deltaTime / 16.67);
+      if (this.lugiaFrameCount > 0) {
+        this.lugiaAnimationTime += this.lugiaAnimationSpeed * frameScale;
         if (this.lugiaAnimationTime >= 1.0) {
           this.lugiaAnimationTime = 0;
           this.lugiaCurrentFrame += 1;
 
-          if (this.lugiaCurrentFrame >= this.lugiaSprites.length) {
-            this.lugiaCurrentFrame = this.lugiaSprites.length - 1;
+          if (this.lugiaCurrentFrame >= this.lugiaFrameCount) {
+            this.lugiaCurrentFrame = this.lugiaFrameCount - 1;
             this.lugiaState = 'stopped';
             this.lugiaAnimationComplete = true;
             // Play Lugia cry sound immediately when animation completes
@@ -1082,9 +1398,10 @@ export class HouseVillageScene {
             const cryAudio = audioManager.playSoundEffect('cry_17');
             // Track when cry finishes
             if (cryAudio) {
+              // The element is reused for later plays, so listen for this one only
               cryAudio.addEventListener('ended', () => {
                 this.lugiaCryFinished = true;
-              });
+              }, { once: true });
             } else {
               // Fallback: if audio fails to load, wait 1.5 seconds
               setTimeout(() => {
@@ -1095,8 +1412,8 @@ export class HouseVillageScene {
         }
       }
     } else if (this.lugiaState === 'stopped') {
-      if (this.lugiaSprites.length > 0) {
-        this.lugiaCurrentFrame = this.lugiaSprites.length - 1;
+      if (this.lugiaFrameCount > 0) {
+        this.lugiaCurrentFrame = this.lugiaFrameCount - 1;
       }
     }
 
@@ -1105,8 +1422,8 @@ export class HouseVillageScene {
       this.exclamationTimer += deltaTime;
       // Animate exclamation mark bouncing up
       if (this.exclamationTimer < this.exclamationDuration) {
-        const progress = this.exclamationTimer / this.exclamationDuration;
-        this.exclamationY = -20 * Math.sin(progress * Math.PI); // Bounce animation
+        const step = Math.floor((this.exclamationTimer / this.exclamationDuration) * EXCLAMATION_BOUNCE_STEPS);
+        this.exclamationY = EXCLAMATION_BOUNCE[step]; // Bounce animation
       } else {
         this.exclamationVisible = false;
         this.exclamationTimer = 0;
@@ -1124,8 +1441,7 @@ export class HouseVillageScene {
 
     // Update dialog slide animation
     if (this.dialogVisible) {
-      const dialogHeight = this.dialogImage ? this.dialogImage.height : 56;
-      const dialogTargetY = Config.SCREEN_HEIGHT - dialogHeight;
+      const dialogTargetY = this.dialogTargetY;
 
       if (this.dialogSlideY > dialogTargetY) {
         this.dialogSlideY -= this.dialogSlideSpeed;
@@ -1169,11 +1485,10 @@ export class HouseVillageScene {
 
     // Handle fade transition
     if (this.fadeState === 'fading') {
-      this.fadeAlpha += this.fadeSpeed * (deltaTime / 16.67);
+      this.fadeAlpha += this.fadeSpeed * frameScale;
       if (this.fadeAlpha >= 255) {
         this.fadeAlpha = 255;
         this.fadeState = 'faded';
-        this.fadeComplete = true;
         if (!this.battleAnimationsStarted) {
           this.battleAnimationsStarted = true;
           this.battleDialogVisible = true;
@@ -1187,11 +1502,9 @@ export class HouseVillageScene {
             this.battleVenuStatVisible = true;
           }
 
-          // Start battle music (this will stop map music automatically)
+          // Start battle music once; switching tracks stops the map music
           if (!this.battleMusicStarted) {
-            // Stop map music before starting battle music
-            audioManager.stopMusic();
-            audioManager.playMusic(`${Config.SOUNDS_PATH}/battle.wav`, true);
+            audioManager.playMusic(MUSIC_PATHS.battle, true);
             this.battleMusicStarted = true;
             // Play battle start sound effect immediately
             audioManager.playSoundEffect('cry_17');
@@ -1202,108 +1515,44 @@ export class HouseVillageScene {
       }
     }
 
-    // Update battle UI animations
-    if (this.fadeState === 'fading') {
-      if (this.battleDialogVisible && this.battleDialog) {
-        // Fade in dialog as screen fades
-        this.battleDialogAlpha = Math.min(255, Math.floor(this.fadeAlpha));
-      }
-    }
-
+    // Update battle UI animations. The battle dialog needs no per-frame alpha ramp:
+    // the battle view is only drawn once fully faded, and the fade completion above
+    // already made the dialog opaque.
     if (this.fadeState === 'faded') {
-      if (this.battleDialogVisible && this.battleDialog) {
-        // Ensure dialog is fully visible after fade completes
-        this.battleDialogAlpha = 255;
-      }
-
-      // Battle grass
-      if (this.battleGrassVisible && this.battleGrass) {
-        if (this.battleGrassLeftX < this.battleGrassLeftTargetX) {
-          this.battleGrassLeftX += this.battleGrassSpeed;
-          if (this.battleGrassLeftX >= this.battleGrassLeftTargetX) {
-            this.battleGrassLeftX = this.battleGrassLeftTargetX;
-          }
-        }
-      }
-
-      // Battle pokemonstat
-      if (this.battlePokemonstatVisible && this.battlePokemonstat) {
-        if (this.battlePokemonstatX < this.battlePokemonstatTargetX) {
-          this.battlePokemonstatX += this.battlePokemonstatSpeed;
-          if (this.battlePokemonstatX >= this.battlePokemonstatTargetX) {
-            this.battlePokemonstatX = this.battlePokemonstatTargetX;
-          }
-        }
-      }
-
-      // Battle water
-      if (this.battleWaterVisible && this.battleWater) {
-        if (this.battleWaterX > this.battleWaterTargetX) {
-          this.battleWaterX -= this.battleWaterSpeed;
-          if (this.battleWaterX <= this.battleWaterTargetX) {
-            this.battleWaterX = this.battleWaterTargetX;
-          }
-        }
-      }
-
-      // Battle Lugia
+      // Slide each element toward its resting position (Lugia rides in with the water).
+      // Once the trainer turns to leave it moves past its target, so stop pulling it back
+      const active = this.slideActive;
+      active[SLIDE_GRASS] = this.battleGrassVisible && this.battleGrass ? 1 : 0;
+      active[SLIDE_POKEMONSTAT] = this.battlePokemonstatVisible && this.battlePokemonstat ? 1 : 0;
+      active[SLIDE_WATER] = this.battleWaterVisible && this.battleWater ? 1 : 0;
+      active[SLIDE_TRAINER] =
+        this.battleTrainerVisible && this.battleTrainerFrameCount > 0 && !this.battleTrainerSlideOut ? 1 : 0;
+      const allSlidIn = stepSlides(this.slideX, this.slideTargetX, this.slideSpeed, active);
+
+      // Browser handles GIF animation automatically when drawn from img element
       if (this.battleLugiaVisible && this.battleLugiaGif) {
-        if (this.battleLugiaX > this.battleLugiaTargetX) {
-          this.battleLugiaX -= this.battleWaterSpeed;
-          if (this.battleLugiaX <= this.battleLugiaTargetX) {
-            this.battleLugiaX = this.battleLugiaTargetX;
-          }
-        }
-        // Browser handles GIF animation automatically when drawn from img element
+        this.battleLugiaX = slideToward(this.battleLugiaX, this.battleLugiaTargetX, this.slideSpeed[SLIDE_WATER]);
       }
 
       // Battle trainer
-      if (this.battleTrainerVisible && this.battleTrainerSprites.length > 0) {
-        if (this.battleTrainerX > this.battleTrainerTargetX) {
-          this.battleTrainerX -= this.battleTrainerSpeed;
-          if (this.battleTrainerX <= this.battleTrainerTargetX) {
-            this.battleTrainerX = this.battleTrainerTargetX;
-          }
-        }
-
-        let allAnimationsComplete = true;
-        if (this.battleGrassVisible && this.battleGrass) {
-          if (this.battleGrassLeftX !== this.battleGrassLeftTargetX) {
-            allAnimationsComplete = false;
-          }
-        }
-        if (this.battlePokemonstatVisible && this.battlePokemonstat) {
-          if (this.battlePokemonstatX !== this.battlePokemonstatTargetX) {
-            allAnimationsComplete = false;
-          }
-        }
-        if (this.battleWaterVisible && this.battleWater) {
-          if (this.battleWaterX !== this.battleWaterTargetX) {
-            allAnimationsComplete = false;
-          }
-        }
-        if (this.battleTrainerX !== this.battleTrainerTargetX) {
-          allAnimationsComplete = false;
-        }
-
-        if (allAnimationsComplete && !this.allBattleElementsSlidIn) {
+      if (this.battleTrainerVisible && this.battleTrainerFrameCount > 0) {
+        if (allSlidIn && !this.allBattleElementsSlidIn) {
           this.allBattleElementsSlidIn = true;
           this.battleTrainerCanAnimate = true;
         }
 
         // Only animate trainer and throw ball after all elements have slid in
-        if (this.allBattleElementsSlidIn && this.battleTrainerCanAnimate && this.battleTrainerX === this.battleTrainerTargetX && !this.battleTrainerSlideOut) {
-          this.battleTrainerAnimationTime += this.battleTrainerAnimationSpeed * (deltaTime / 16.67);
+        if (this.allBattleElementsSlidIn && this.battleTrainerCanAnimate && this.slideX[SLIDE_TRAINER] === this.slideTargetX[SLIDE_TRAINER] && !this.battleTrainerSlideOut) {
+          this.battleTrainerAnimationTime += this.battleTrainerAnimationSpeed * frameScale;
           if (this.battleTrainerAnimationTime >= 1.0) {
             this.battleTrainerAnimationTime = 0;
-            if (this.battleTrainerCurrentFrame < this.battleTrainerSprites.length - 1) {
+            if (this.battleTrainerCurrentFrame < this.battleTrainerFrameCount - 1) {
               this.battleTrainerCurrentFrame += 1;
             } else {
               // Trainer throws pokeball - play ball toss sound
               audioManager.playSoundEffect('ball_toss');
               this.battleVenuVisible = true;
-              if (!this.battleTextFading) {
-                this.battleTextFading = true;
+              if (this.battleTextState === 'lugia') {
                 this.battleTextState = 'transitioning';
               }
               this.battleTrainerSlideOut = true;
@@ -1314,15 +1563,15 @@ export class HouseVillageScene {
 
         if (this.battleTrainerSlideOut) {
           const trainerSlideOutTarget = -180;
-          if (this.battleTrainerX > trainerSlideOutTarget) {
-            this.battleTrainerX -= this.battleTrainerSpeed;
-            const totalSlideDistance = Math.abs(this.battleTrainerTargetX - trainerSlideOutTarget);
-            const currentSlideDistance = Math.abs(this.battleTrainerX - this.battleTrainerTargetX);
+          if (this.slideX[SLIDE_TRAINER] > trainerSlideOutTarget) {
+            this.slideX[SLIDE_TRAINER] -= this.slideSpeed[SLIDE_TRAINER];
+            const totalSlideDistance = Math.abs(this.slideTargetX[SLIDE_TRAINER] - trainerSlideOutTarget);
+            const currentSlideDistance = Math.abs(this.slideX[SLIDE_TRAINER] - this.slideTargetX[SLIDE_TRAINER]);
             const fadeProgress = Math.min(1.0, currentSlideDistance / totalSlideDistance);
             this.battleTrainerAlpha = Math.floor(255 * (1.0 - fadeProgress));
           }
 
-          if (this.battleTrainerX <= trainerSlideOutTarget || this.battleTrainerAlpha <= 0) {
+          if (this.slideX[SLIDE_TRAINER] <= trainerSlideOutTarget || this.battleTrainerAlpha <= 0) {
             this.battleTrainerAlpha = 0;
             this.battleTrainerVisible = false;
           }
@@ -1332,7 +1581,7 @@ export class HouseVillageScene {
       // Battle Venusaur
       if (this.battleVenuVisible && this.battleVenuGif) {
         if (this.battleVenuY > this.battleVenuTargetY) {
-          this.battleVenuY -= this.battleTrainerSpeed;
+          this.battleVenuY -= this.slideSpeed[SLIDE_TRAINER];
           if (this.battleVenuY <= this.battleVenuTargetY) {
             this.battleVenuY = this.battleVenuTargetY;
             // Play ball poof sound when Venusaur appears (pokeball opens)
@@ -1352,15 +1601,16 @@ export class HouseVillageScene {
       }
 
       // Handle text fade transition
-      if (this.battleTextFading) {
+      if (this.battleTextState === 'transitioning') {
+        // Lugia's text fades out, then Venusaur's fades in, sharing one step size
+        const textFadeStep = this.battleTextFadeSpeed * frameScale;
         if (this.battleTextLugiaAlpha > 0) {
-          this.battleTextLugiaAlpha = Math.max(0, this.battleTextLugiaAlpha - this.battleTextFadeSpeed * (deltaTime / 16.67));
+          this.battleTextLugiaAlpha = Math.max(0, this.battleTextLugiaAlpha - textFadeStep);
         }
         if (this.battleTextLugiaAlpha === 0 && this.battleTextVenusaurAlpha < 255) {
-          this.battleTextVenusaurAlpha = Math.min(255, this.battleTextVenusaurAlpha + this.battleTextFadeSpeed * (deltaTime / 16.67));
+          this.battleTextVenusaurAlpha = Math.min(255, this.battleTextVenusaurAlpha + textFadeStep);
           if (this.battleTextVenusaurAlpha >= 255) {
             this.battleTextState = 'venusaur';
-            this.battleTextFading = false;
             // Show battle menu when Venusaur text is fully visible
             this.battleMenuVisible = true;
           }
@@ -1370,20 +1620,18 @@ export class HouseVillageScene {
       // Update attack sequence
       if (this.attackSequenceActive) {
         if (this.attackPulseVisible) {
-          this.attackPulseTimer += deltaTime;
-          const progress = Math.min(1.0, this.attackPulseTimer / this.attackPulseDuration);
+          const progress = this.advanceAttackPhase(ATTACK_PULSE, deltaTime);
           
-          // Pulse animation: scale up and fade
+          // Pulse animation: scale up (the phase step fades it)
           this.attackPulseScale = 0.5 + (progress * 1.5); // Scale from 0.5 to 2.0
-          this.attackPulseAlpha = 255 * (1.0 - progress); // Fade out
           
           if (progress >= 1.0) {
             this.attackPulseVisible = false;
             // Show pulse end effect
             if (this.attackPulseEndImage) {
               this.attackPulseEndVisible = true;
-              this.attackPulseEndAlpha = 255;
-              this.attackPulseEndTimer = 0;
+              this.attackPhaseAlphas[ATTACK_PULSE_END] = 255;
+              this.attackPhaseTimers[ATTACK_PULSE_END] = 0;
               // Play impact sound
               audioManager.playSoundEffect('spike_cannon');
             } else {
@@ -1394,11 +1642,8 @@ export class HouseVillageScene {
         }
         
         if (this.attackPulseEndVisible) {
-          this.attackPulseEndTimer += deltaTime;
-          const progress = Math.min(1.0, this.attackPulseEndTimer / this.attackPulseEndDuration);
-          
           // Fade out end effect
-          this.attackPulseEndAlpha = 255 * (1.0 - progress);
+          const progress = this.advanceAttackPhase(ATTACK_PULSE_END, deltaTime);
           
           if (progress >= 1.0) {
             this.attackPulseEndVisible = false;
@@ -1409,6 +1654,43 @@ export class HouseVillageScene {
         }
       }
     }
+
+    // Work out how much of the screen this step changed
+    if (
+      this.cameraX !== prevCameraX ||
+      this.cameraY !== prevCameraY ||
+      this.fadeState !== 'none' ||
+      this.dialogVisible !== prevDialogVisible ||
+      this.dialogSlideY !== prevDialogSlideY
+    ) {
+      this.fullRedrawNeeded = true;
+    } else {
+      if (
+        this.playerWorldX !== prevPlayerX ||
+        this.playerWorldY !== prevPlayerY ||
+        playerAnimating ||
+        this.exclamationVisible ||
+        prevExclamationVisible
+      ) {
+        this.playerDirty = true;
+      }
+      if (
+        this.lugiaY !== prevLugiaY ||
+        this.lugiaCurrentFrame !== prevLugiaFrame ||
+        this.lugiaState !== prevLugiaState
+      ) {
+        this.lugiaDirty = true;
+      }
+    }
+  }
+
+  private advanceAttackPhase(phase: number, deltaTime: number): number {
+    // Every phase fades out linearly over its duration; returns progress in [0, 1]
+    const timer = this.attackPhaseTimers[phase] + deltaTime;
+    this.attackPhaseTimers[phase] = timer;
+    const progress = Math.min(1.0, timer / this.attackPhaseDurations[phase]);
+    this.attackPhaseAlphas[phase] = 255 * (1.0 - progress);
+    return progress;
   }
 
   private startEndScene(): void {
@@ -1436,584 +1718,518 @@ export class HouseVillageScene {
     }
   }
 
+  private drawText(
+    ctx: CanvasRenderingContext2D,
+    text: string,
+    font: string,
+    color: string,
+    x: number,
+    y: number,
+    align: CanvasTextAlign = 'left',
+    baseline: CanvasTextBaseline = 'top',
+    outline?: TextOutline
+  ): void {
+    drawTextSprite(ctx, this.textCache.get(text, font, color, align, baseline, outline), x, y);
+  }
+
+  private bakeScreenOverlay(image: HTMLImageElement | null): HTMLCanvasElement | null {
+    if (!image) return null;
+
+    // Scale and fade once at load so drawing the overlay is a plain 1:1 copy
+    // rather than a scaled blit modulated by globalAlpha every frame
+    const canvas = document.createElement('canvas');
+    canvas.width = Config.SCREEN_WIDTH;
+    canvas.height = Config.SCREEN_HEIGHT;
+    const ctx = canvas.getContext('2d');
+    if (!ctx) return null;
+
+    ctx.globalAlpha = 0.95;
+    ctx.drawImage(image, 0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+    return canvas;
+  }
+
+  private getBattleMenuLabelLayer(): HTMLCanvasElement | null {
+    if (this.battleMenuLabelLayer || !this.battleMenuUI) return this.battleMenuLabelLayer;
+
+    const canvas = document.createElement('canvas');
+    canvas.width = this.battleMenuUI.width;
+    canvas.height = this.battleMenuUI.height;
+    const ctx = canvas.getContext('2d');
+    if (!ctx) return null;
+
+    // Text labels for each option in 2x2 grid order: FIGHT, BAG, POKEMON, RUN
+    // Black text, font size matching the Python version, centered in each cell
+    for (let i = 0; i < 4; i++) {
+      const cell = this.battleMenuCellRects[i];
+      const cellCenterX = cell.x - this.battleMenuX + (cell.width / 2);
+      const cellCenterY = cell.y - this.battleMenuY + (cell.height / 2);
+      this.drawText(ctx, this.battleMenuOptions[i], MENU_FONT, 'rgb(0, 0, 0)', cellCenterX, cellCenterY, 'center', 'middle');
+    }
+
+    this.battleMenuLabelLayer = canvas;
+    return canvas;
+  }
+
+  private getCombatUILabelLayer(): HTMLCanvasElement | null {
+    if (this.combatUILabelLayer || !this.combatUI) return this.combatUILabelLayer;
+
+    const canvas = document.createElement('canvas');
+    canvas.width = this.combatUI.width;
+    canvas.height = this.combatUI.height;
+    const ctx = canvas.getContext('2d');
+    if (!ctx) return null;
+
+    // Laid out in panel coordinates; the panel sits at a whole-pixel offset, so the
+    // text lands exactly where drawing it on screen would put it
+    for (let row = 0; row < this.combatUILeftGridRows; row++) {
+      for (let col = 0; col < this.combatUILeftGridCols; col++) {
+        const moveIndex = row * this.combatUILeftGridCols + col;
+        if (moveIndex < this.combatUIMoveLabels.length) {
+          const cellCenterX = this.combatUIPadding + (col * this.combatUILeftCellWidth) + (this.combatUILeftCellWidth / 2);
+          const cellCenterY = this.combatUIPadding + (row * this.combatUILeftCellHeight) + (this.combatUILeftCellHeight / 2);
+
+          // Determine text color (grey for moves out of PP, black for Prompt Pulse)
+          const color = this.combatUIMovePP[moveIndex] === 0
+            ? 'rgb(128, 128, 128)' // Grey
+            : 'rgb(0, 0, 0)'; // Black
+
+          // Draw text with white outline for visibility
+          const text = this.combatUIMoveLabelTexts[moveIndex];
+          this.drawText(ctx, text, UI_FONT, color, cellCenterX, cellCenterY, 'center', 'middle', TEXT_OUTLINE);
+        }
+      }
+    }
+
+    // "PP" and "TYPE/" labels (left aligned, 8px from left, center height)
+    const labelX = this.combatUI.width - this.combatUIPadding - this.combatUIRightGridContentWidth + 8;
+    const topCellCenterY = this.combatUIPadding + (this.combatUIRightCellHeight / 2);
+    const bottomCellCenterY = this.combatUIPadding + this.combatUIRightCellHeight + (this.combatUIRightCellHeight / 2);
+    this.drawText(ctx, 'PP', UI_FONT, 'rgb(0, 0, 0)', labelX, topCellCenterY, 'left', 'middle', TEXT_OUTLINE);
+    this.drawText(ctx, 'TYPE/', UI_FONT, 'rgb(0, 0, 0)', labelX, bottomCellCenterY, 'left', 'middle', TEXT_OUTLINE);
+
+    this.combatUILabelLayer = canvas;
+    return canvas;
+  }
+
+  private getBattleBackdrop(): HTMLCanvasElement | null {
+    if (this.battleBackdrop || !this.fightingBackground) return this.battleBackdrop;
+
+    const canvas = document.createElement('canvas');
+    canvas.width = Config.SCREEN_WIDTH;
+    canvas.height = Config.SCREEN_HEIGHT;
+    // Opaque like the screen it replaces, so drawing it needs no per-pixel blending
+    const ctx = canvas.getContext('2d', { alpha: false });
+    if (!ctx) return null;
+
+    ctx.fillStyle = Colors.BG_COLOR;
+    ctx.fillRect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+    ctx.drawImage(this.fightingBackground, 0, 0);
+    if (this.battleGrassVisible && this.battleGrass) {
+      ctx.drawImage(this.battleGrass, this.slideTargetX[SLIDE_GRASS], this.battleGrassY);
+    }
+    if (this.battleWaterVisible && this.battleWater) {
+      ctx.drawImage(this.battleWater, this.slideTargetX[SLIDE_WATER], this.battleWaterY);
+    }
+    this.battleBackdrop = canvas;
+    return canvas;
+  }
+
+  private getBattleTextLayout(dialogHeight: number): BattleTextLayout {
+    if (this.battleTextLayout && this.battleTextLayout.font === this.dialogFont) {
+      return this.battleTextLayout;
+    }
+
+    // The battle lines are fixed strings, so measure and rasterize them once per font
+    const measureCtx = document.createElement('canvas').getContext('2d');
+    const maxTextWidth = Config.SCREEN_WIDTH / 2;
+    const font = this.dialogFont;
+    const buildLine = (text: string): [BattleTextLine, number] => {
+      if (!measureCtx) {
+        const sprite: TextSprite = renderTextSprite(text, font, 'rgb(255, 255, 255)');
+        return [{ canvas: sprite.canvas, offsetX: -sprite.anchorX, offsetY: -sprite.anchorY }, 0];
+      }
+      measureCtx.font = font;
+      const metrics = measureCtx.measureText(text);
+      let width = metrics.width;
+      let height = metrics.actualBoundingBoxAscent + metrics.actualBoundingBoxDescent;
+
+      // Scale down if needed (like original)
+      if (width > maxTextWidth) {
+        const scaleFactor = maxTextWidth / width;
+        width *= scaleFactor;
+        height *= scaleFactor;
+        const canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        const lineCtx = canvas.getContext('2d');
+        if (lineCtx) {
+          lineCtx.font = font;
+          lineCtx.fillStyle = 'rgb(255, 255, 255)';
+          lineCtx.fillText(text, 0, height * 0.8);
+        }
+        return [{ canvas, offsetX: 0, offsetY: 0 }, height];
+      }
+
+      const sprite = renderTextSprite(text, font, 'rgb(255, 255, 255)');
+      return [{ canvas: sprite.canvas, offsetX: -sprite.anchorX, offsetY: -sprite.anchorY }, height];
+    };
+
+    const [lugiaLine1, lugiaLine1Height] = buildLine('A wild Bugia');
+    const [lugiaLine2, lugiaLine2Height] = buildLine('appeared!');
+    const [venusaurLine1] = buildLine('What should');
+    const [venusaurLine2] = buildLine('Venusaur do?');
+
+    // Both messages share the line positions derived from the Lugia text
+    const totalTextHeight = lugiaLine1Height + lugiaLine2Height;
+    const line1Offset = (dialogHeight - totalTextHeight) / 2;
+    this.battleTextLayout = {
+      font,
+      lugia: [lugiaLine1, lugiaLine2],
+      venusaur: [venusaurLine1, venusaurLine2],
+      line1Offset,
+      line2Offset: line1Offset + lugiaLine1Height,
+    };
+    return this.battleTextLayout;
+  }
+
+  private drawBattleTextLine(ctx: CanvasRenderingContext2D, line: BattleTextLine, x: number, y: number): void {
+    ctx.drawImage(line.canvas, Math.round(x + line.offsetX), Math.round(y + line.offsetY));
+  }
+
   render(ctx: CanvasRenderingContext2D): void {
-    // If fully faded, show battle screen
-    if (this.fadeState === 'faded' && this.fightingBackground) {
+    // One lookup per frame picks the map or battle renderer
+    this.renderers[this.fadeState](ctx);
+  }
+
+  private renderBattle(ctx: CanvasRenderingContext2D): void {
+    // Shown once fully faded; without a battle background keep drawing the map
+    if (!this.fightingBackground) {
+      this.renderMap(ctx);
+      return;
+    }
+
+    // Once everything below the Lugia GIF has stopped moving it is one blit
+    const backdrop = this.allBattleElementsSlidIn && !this.battleTrainerVisible ? this.getBattleBackdrop() : null;
+    if (backdrop) {
+      ctx.drawImage(backdrop, 0, 0);
+    } else {
       // Draw fighting background
-      ctx.drawImage(this.fightingBackground, 0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+      ctx.drawImage(this.fightingBackground, 0, 0);
 
       // Draw battle UI elements
       if (this.battleGrassVisible && this.battleGrass) {
-        ctx.drawImage(this.battleGrass, this.battleGrassLeftX, this.battleGrassY);
+        ctx.drawImage(this.battleGrass, this.slideX[SLIDE_GRASS], this.battleGrassY);
       }
 
-      if (this.battleTrainerVisible && this.battleTrainerSprites.length > 0 && this.battleTrainerAlpha > 0) {
-        const frame = Math.min(this.battleTrainerCurrentFrame, this.battleTrainerSprites.length - 1);
-        const trainerSprite = this.battleTrainerSprites[frame];
-        // During battle (fadeState === 'faded'), always render at 100% opacity
-        if (this.fadeState === 'faded') {
-          ctx.drawImage(trainerSprite, this.battleTrainerX, this.battleTrainerY);
-        } else {
-          // Only use alpha during fade transitions
-          ctx.globalAlpha = this.battleTrainerAlpha / 255;
-          ctx.drawImage(trainerSprite, this.battleTrainerX, this.battleTrainerY);
-          ctx.globalAlpha = 1.0;
-        }
+      if (this.battleTrainerVisible && this.battleTrainerFrameCount > 0 && this.battleTrainerAlpha > 0) {
+        const frame = Math.min(this.battleTrainerCurrentFrame, this.battleTrainerFrameCount - 1);
+        // The battle view is only drawn once fully faded, so the trainer is always opaque here
+        this.battleTrainerSheet?.drawSprite(ctx, 0, frame, this.slideX[SLIDE_TRAINER], this.battleTrainerY);
       }
 
       if (this.battleWaterVisible && this.battleWater) {
-        ctx.drawImage(this.battleWater, this.battleWaterX, this.battleWaterY);
+        ctx.drawImage(this.battleWater, this.slideX[SLIDE_WATER], this.battleWaterY);
       }
+    }
 
-      if (this.battleLugiaVisible && this.battleLugiaGif) {
-        // Use natural dimensions to avoid stretching, scale to 232px width
-        const targetWidth = 232;
-        const naturalWidth = this.battleLugiaGif.naturalWidth || this.battleLugiaGif.width;
-        const naturalHeight = this.battleLugiaGif.naturalHeight || this.battleLugiaGif.height;
-        const scaleFactor = targetWidth / naturalWidth;
-        const scaledHeight = naturalHeight * scaleFactor;
-        // Draw the animated GIF - browser handles animation automatically
-        // Draw from img element directly to keep animation going, use natural dimensions
-        ctx.imageSmoothingEnabled = false; // Pixel-perfect rendering
-        ctx.drawImage(this.battleLugiaGif, 0, 0, naturalWidth, naturalHeight, this.battleLugiaX, this.battleLugiaY, targetWidth, scaledHeight);
-        ctx.imageSmoothingEnabled = true;
-      }
+    if (this.battleLugiaVisible && this.battleLugiaGif) {
+      // Draw the animated GIF - browser handles animation automatically
+      // Draw from img element directly to keep animation going, scaled to the size fixed at load
+      ctx.imageSmoothingEnabled = false; // Pixel-perfect rendering
+      ctx.drawImage(this.battleLugiaGif, this.battleLugiaX, this.battleLugiaY, this.battleLugiaDrawWidth, this.battleLugiaDrawHeight);
+      ctx.imageSmoothingEnabled = true;
+    }
 
-      if (this.battlePokemonstatVisible && this.battlePokemonstat) {
-        ctx.drawImage(this.battlePokemonstat, this.battlePokemonstatX, this.battlePokemonstatY);
+    if (this.battlePokemonstatVisible && this.battlePokemonstat) {
+      ctx.drawImage(this.battlePokemonstat, this.slideX[SLIDE_POKEMONSTAT], this.battlePokemonstatY);
+      
+      // Draw Lugia health bar (green bar on the stat image)
+      if (this.healthBarVisible) {
+        const healthBarX = this.slideX[SLIDE_POKEMONSTAT] + this.lugiaHealthBarOffsetX;
+        const healthBarY = this.battlePokemonstatY + this.lugiaHealthBarOffsetY;
         
-        // Draw Lugia health bar (green bar on the stat image)
-        if (this.healthBarVisible && this.battlePokemonstat) {
-          // Health bar position relative to stat image
-          // 26px from right, 18px from bottom of container
-          const statImage = this.battlePokemonstat;
-          const healthBarWidth = 96; // Fixed width as per Python version
-          const healthBarHeight = 6; // Fixed height as per Python version
-          const healthBarX = this.battlePokemonstatX + statImage.width - healthBarWidth - 26; // 26px from right
-          const healthBarY = this.battlePokemonstatY + statImage.height - 18 - healthBarHeight; // 18px from bottom
-          
-          // Draw green health bar (current HP / max HP) - no border, color #70F8A8
-          const healthPercentage = Math.max(0, Math.min(1, this.lugiaCurrentHP / this.lugiaMaxHP));
-          const healthBarFillWidth = healthBarWidth * healthPercentage;
-          if (healthBarFillWidth > 0) {
-            ctx.fillStyle = '#70F8A8'; // Light green color from Python version
-            ctx.fillRect(healthBarX, healthBarY, healthBarFillWidth, healthBarHeight);
-          }
+        // Draw green health bar (current HP / max HP) - no border, color #70F8A8
+        const healthPercentage = Math.max(0, Math.min(1, this.lugiaCurrentHP / this.lugiaMaxHP));
+        const healthBarFillWidth = HEALTH_BAR_WIDTH * healthPercentage;
+        if (healthBarFillWidth > 0) {
+          ctx.fillStyle = '#70F8A8'; // Light green color from Python version
+          ctx.fillRect(healthBarX, healthBarY, healthBarFillWidth, HEALTH_BAR_HEIGHT);
         }
       }
+    }
 
-      if (this.battleVenuVisible && this.battleVenuGif) {
-        // Use natural dimensions to avoid stretching, scale to 214px width
-        const targetWidth = 214;
-        const naturalWidth = this.battleVenuGif.naturalWidth || this.battleVenuGif.width;
-        const naturalHeight = this.battleVenuGif.naturalHeight || this.battleVenuGif.height;
-        const scaleFactor = targetWidth / naturalWidth;
-        const scaledHeight = naturalHeight * scaleFactor;
-        // Draw the animated GIF - browser handles animation automatically
-        // Draw from img element directly to keep animation going, use natural dimensions
-        ctx.imageSmoothingEnabled = false; // Pixel-perfect rendering
-        ctx.drawImage(this.battleVenuGif, 0, 0, naturalWidth, naturalHeight, this.battleVenuX, this.battleVenuY, targetWidth, scaledHeight);
-        ctx.imageSmoothingEnabled = true;
-      }
+    if (this.battleVenuVisible && this.battleVenuGif) {
+      // Draw the animated GIF - browser handles animation automatically
+      // Draw from img element directly to keep animation going, scaled to the size fixed at load
+      ctx.imageSmoothingEnabled = false; // Pixel-perfect rendering
+      ctx.drawImage(this.battleVenuGif, this.battleVenuX, this.battleVenuY, this.battleVenuDrawWidth, this.battleVenuDrawHeight);
+      ctx.imageSmoothingEnabled = true;
+    }
 
-      if (this.battleVenuStatVisible && this.battleVenuStat) {
-        ctx.drawImage(this.battleVenuStat, this.battleVenuStatX, this.battleVenuStatY);
+    if (this.battleVenuStatVisible && this.battleVenuStat) {
+      ctx.drawImage(this.battleVenuStat, this.battleVenuStatX, this.battleVenuStatY);
+      
+      // Draw Venusaur health bar (green bar on the stat image)
+      if (this.healthBarVisible) {
+        const healthBarX = this.battleVenuStatX + this.venusaurHealthBarOffsetX;
+        const healthBarY = this.battleVenuStatY + this.venusaurHealthBarOffsetY;
         
-        // Draw Venusaur health bar (green bar on the stat image)
-        if (this.healthBarVisible && this.battleVenuStat) {
-          // Health bar position relative to stat image
-          // 16px from right, 34px from bottom of container
-          const statImage = this.battleVenuStat;
-          const healthBarWidth = 96; // Fixed width as per Python version
-          const healthBarHeight = 6; // Fixed height as per Python version
-          const healthBarX = this.battleVenuStatX + statImage.width - healthBarWidth - 16; // 16px from right
-          const healthBarY = this.battleVenuStatY + statImage.height - 34 - healthBarHeight; // 34px from bottom
-          
-          // Draw green health bar (current HP / max HP) - no border, color #70F8A8
-          const healthPercentage = Math.max(0, Math.min(1, this.venusaurCurrentHP / this.venusaurMaxHP));
-          const healthBarFillWidth = healthBarWidth * healthPercentage;
-          if (healthBarFillWidth > 0) {
-            ctx.fillStyle = '#70F8A8'; // Light green color from Python version
-            ctx.fillRect(healthBarX, healthBarY, healthBarFillWidth, healthBarHeight);
-          }
+        // Draw green health bar (current HP / max HP) - no border, color #70F8A8
+        const healthPercentage = Math.max(0, Math.min(1, this.venusaurCurrentHP / this.venusaurMaxHP));
+        const healthBarFillWidth = HEALTH_BAR_WIDTH * healthPercentage;
+        if (healthBarFillWidth > 0) {
+          ctx.fillStyle = '#70F8A8'; // Light green color from Python version
+          ctx.fillRect(healthBarX, healthBarY, healthBarFillWidth, HEALTH_BAR_HEIGHT);
         }
       }
+    }
 
-      // Draw battle dialog
-      if (this.battleDialogVisible && this.battleDialog) {
-        // During battle (fadeState === 'faded'), always render at 100% opacity
-        if (this.fadeState === 'faded') {
-          ctx.drawImage(this.battleDialog, this.battleDialogX, this.battleDialogY);
-        } else {
-          // Only use alpha during fade transitions
-          ctx.globalAlpha = this.battleDialogAlpha / 255;
-          ctx.drawImage(this.battleDialog, this.battleDialogX, this.battleDialogY);
-          ctx.globalAlpha = 1.0;
-        }
-
-        // Draw battle dialog text
-        if (this.battleDialogAlpha >= 255) {
-          ctx.fillStyle = 'rgb(255, 255, 255)'; // White text
-          ctx.font = this.dialogFont;
-          ctx.textAlign = 'left';
-          ctx.textBaseline = 'top';
-          const textX = 32;
-          const dialogHeight = this.battleDialog.height;
-          const maxTextWidth = Config.SCREEN_WIDTH / 2;
-
-          // Lugia text
-          const lugiaLine1 = 'A wild Bugia';
-          const lugiaLine2 = 'appeared!';
-          
-          // Measure text
-          ctx.font = this.dialogFont;
-          const lugiaLine1Metrics = ctx.measureText(lugiaLine1);
-          const lugiaLine2Metrics = ctx.measureText(lugiaLine2);
-          
-          // Scale down if needed (like original)
-          let lugiaLine1Width = lugiaLine1Metrics.width;
-          let lugiaLine1Height = lugiaLine1Metrics.actualBoundingBoxAscent + lugiaLine1Metrics.actualBoundingBoxDescent;
-          let lugiaLine2Width = lugiaLine2Metrics.width;
-          let lugiaLine2Height = lugiaLine2Metrics.actualBoundingBoxAscent + lugiaLine2Metrics.actualBoundingBoxDescent;
-          
-          if (lugiaLine1Width > maxTextWidth) {
-            const scaleFactor = maxTextWidth / lugiaLine1Width;
-            lugiaLine1Width *= scaleFactor;
-            lugiaLine1Height *= scaleFactor;
-          }
-          if (lugiaLine2Width > maxTextWidth) {
-            const scaleFactor = maxTextWidth / lugiaLine2Width;
-            lugiaLine2Width *= scaleFactor;
-            lugiaLine2Height *= scaleFactor;
-          }
-          
-          const totalTextHeight = lugiaLine1Height + lugiaLine2Height;
-          const line1Y = this.battleDialogY + (dialogHeight - totalTextHeight) / 2;
-          const line2Y = line1Y + lugiaLine1Height;
-
-          // Draw Lugia text with fade
-          if (this.battleTextLugiaAlpha > 0) {
-            ctx.globalAlpha = this.battleTextLugiaAlpha / 255;
-            if (lugiaLine1Width !== lugiaLine1Metrics.width) {
-              // Need to scale - create a temporary canvas
-              const tempCanvas = document.createElement('canvas');
-              const tempCtx = tempCanvas.getContext('2d');
-              if (tempCtx) {
-                tempCanvas.width = lugiaLine1Width;
-                tempCanvas.height = lugiaLine1Height;
-                tempCtx.font = this.dialogFont;
-                tempCtx.fillStyle = 'rgb(255, 255, 255)';
-                tempCtx.fillText(lugiaLine1, 0, lugiaLine1Height * 0.8);
-                ctx.drawImage(tempCanvas, textX, line1Y);
-              }
-            } else {
-              ctx.fillText(lugiaLine1, textX, line1Y);
-            }
-            if (lugiaLine2Width !== lugiaLine2Metrics.width) {
-              const tempCanvas = document.createElement('canvas');
-              const tempCtx = tempCanvas.getContext('2d');
-              if (tempCtx) {
-                tempCanvas.width = lugiaLine2Width;
-                tempCanvas.height = lugiaLine2Height;
-                tempCtx.font = this.dialogFont;
-                tempCtx.fillStyle = 'rgb(255, 255, 255)';
-                tempCtx.fillText(lugiaLine2, 0, lugiaLine2Height * 0.8);
-                ctx.drawImage(tempCanvas, textX, line2Y);
-              }
-            } else {
-              ctx.fillText(lugiaLine2, textX, line2Y);
-            }
-          }
+    // Draw battle dialog
+    if (this.battleDialogVisible && this.battleDialog) {
+      // Always opaque during battle, no globalAlpha blend needed
+      ctx.drawImage(this.battleDialog, this.battleDialogX, this.battleDialogY);
 
-          // Venusaur text
-          const venusaurLine1 = 'What should';
-          const venusaurLine2 = 'Venusaur do?';
-          
-          const venusaurLine1Metrics = ctx.measureText(venusaurLine1);
-          const venusaurLine2Metrics = ctx.measureText(venusaurLine2);
-          
-          let venusaurLine1Width = venusaurLine1Metrics.width;
-          let venusaurLine1Height = venusaurLine1Metrics.actualBoundingBoxAscent + venusaurLine1Metrics.actualBoundingBoxDescent;
-          let venusaurLine2Width = venusaurLine2Metrics.width;
-          let venusaurLine2Height = venusaurLine2Metrics.actualBoundingBoxAscent + venusaurLine2Metrics.actualBoundingBoxDescent;
-          
-          if (venusaurLine1Width > maxTextWidth) {
-            const scaleFactor = maxTextWidth / venusaurLine1Width;
-            venusaurLine1Width *= scaleFactor;
-            venusaurLine1Height *= scaleFactor;
-          }
-          if (venusaurLine2Width > maxTextWidth) {
-            const scaleFactor = maxTextWidth / venusaurLine2Width;
-            venusaurLine2Width *= scaleFactor;
-            venusaurLine2Height *= scaleFactor;
-          }
+      // Draw battle dialog text
+      if (this.battleDialogAlpha >= 255) {
+        const layout = this.getBattleTextLayout(this.battleDialog.height);
+        const textX = 32;
+        const line1Y = this.battleDialogY + layout.line1Offset;
+        const line2Y = this.battleDialogY + layout.line2Offset;
 
-          // Draw Venusaur text with fade
-          if (this.battleTextVenusaurAlpha > 0) {
-            ctx.globalAlpha = this.battleTextVenusaurAlpha / 255;
-            if (venusaurLine1Width !== venusaurLine1Metrics.width) {
-              const tempCanvas = document.createElement('canvas');
-              const tempCtx = tempCanvas.getContext('2d');
-              if (tempCtx) {
-                tempCanvas.width = venusaurLine1Width;
-                tempCanvas.height = venusaurLine1Height;
-                tempCtx.font = this.dialogFont;
-                tempCtx.fillStyle = 'rgb(255, 255, 255)';
-                tempCtx.fillText(venusaurLine1, 0, venusaurLine1Height * 0.8);
-                ctx.drawImage(tempCanvas, textX, line1Y);
-              }
-            } else {
-              ctx.fillText(venusaurLine1, textX, line1Y);
-            }
-            if (venusaurLine2Width !== venusaurLine2Metrics.width) {
-              const tempCanvas = document.createElement('canvas');
-              const tempCtx = tempCanvas.getContext('2d');
-              if (tempCtx) {
-                tempCanvas.width = venusaurLine2Width;
-                tempCanvas.height = venusaurLine2Height;
-                tempCtx.font = this.dialogFont;
-                tempCtx.fillStyle = 'rgb(255, 255, 255)';
-                tempCtx.fillText(venusaurLine2, 0, venusaurLine2Height * 0.8);
-                ctx.drawImage(tempCanvas, textX, line2Y);
-              }
-            } else {
-              ctx.fillText(venusaurLine2, textX, line2Y);
-            }
-          }
+        // Draw Lugia text with fade
+        if (this.battleTextLugiaAlpha > 0) {
+          ctx.globalAlpha = this.battleTextLugiaAlpha / 255;
+          this.drawBattleTextLine(ctx, layout.lugia[0], textX, line1Y);
+          this.drawBattleTextLine(ctx, layout.lugia[1], textX, line2Y);
+        }
 
-          ctx.globalAlpha = 1.0;
+        // Draw Venusaur text with fade
+        if (this.battleTextVenusaurAlpha > 0) {
+          ctx.globalAlpha = this.battleTextVenusaurAlpha / 255;
+          this.drawBattleTextLine(ctx, layout.venusaur[0], textX, line1Y);
+          this.drawBattleTextLine(ctx, layout.venusaur[1], textX, line2Y);
         }
-      }
 
-      // Draw text messages (Run and Full HP) - above battle dialog
-      if (this.runTextVisible && this.battleDialog && this.battleTextVenusaurAlpha >= 255) {
-        ctx.globalAlpha = this.runTextAlpha / 255;
-        ctx.fillStyle = 'rgb(255, 255, 255)';
-        ctx.font = this.dialogFont;
-        ctx.textAlign = 'left';
-        ctx.textBaseline = 'middle';
-        const textX = 32;
-        const textY = this.battleDialogY + (this.battleDialog.height / 2);
-        ctx.fillText("Venusaur can't run away!", textX, textY);
         ctx.globalAlpha = 1.0;
       }
+    }
+
+    // Draw text messages (Run and Full HP) - above battle dialog
+    if (this.runTextVisible && this.battleDialog && this.battleTextVenusaurAlpha >= 255) {
+      ctx.globalAlpha = this.runTextAlpha / 255;
+      const textX = 32;
+      const textY = this.battleDialogCenterY;
+      this.drawText(ctx, "Venusaur can't run away!", this.dialogFont, 'rgb(255, 255, 255)', textX, textY, 'left', 'middle');
+      ctx.globalAlpha = 1.0;
+    }
+    
+    if (this.fullHPTextVisible && this.battleDialog && this.battleTextVenusaurAlpha >= 255) {
+      ctx.globalAlpha = this.fullHPTextAlpha / 255;
+      const textX = 32;
+      const textY = this.battleDialogCenterY;
+      this.drawText(ctx, 'Your Cursorsaur already has full HP!', this.dialogFont, 'rgb(255, 255, 255)', textX, textY, 'left', 'middle');
+      ctx.globalAlpha = 1.0;
+    }
+
+    // Draw bag/pokemon screens on top of everything
+    if (this.bagScreenVisible && this.bagScreenImage) {
+      ctx.drawImage(this.bagScreenImage, 0, 0);
       
-      if (this.fullHPTextVisible && this.battleDialog && this.battleTextVenusaurAlpha >= 255) {
-        ctx.globalAlpha = this.fullHPTextAlpha / 255;
-        ctx.fillStyle = 'rgb(255, 255, 255)';
-        ctx.font = this.dialogFont;
-        ctx.textAlign = 'left';
-        ctx.textBaseline = 'middle';
-        const textX = 32;
-        const textY = this.battleDialogY + (this.battleDialog.height / 2);
-        ctx.fillText("Your Cursorsaur already has full HP!", textX, textY);
-        ctx.globalAlpha = 1.0;
-      }
+      // Draw "USE" button in bag screen (bottom right area)
+      // Position: 22px from bottom, 8px from right, 96x21
+      const textBoxWidth = 96;
+      const textBoxHeight = 21;
+      const textBoxX = Config.SCREEN_WIDTH - 8 - textBoxWidth;
+      const textBoxY = Config.SCREEN_HEIGHT - 22 - textBoxHeight;
+      
+      // Draw "USE" text (center aligned, white)
+      this.drawText(
+        ctx,
+        'USE',
+        UI_FONT,
+        'rgb(255, 255, 255)',
+        textBoxX + textBoxWidth / 2,
+        textBoxY + textBoxHeight / 2,
+        'center',
+        'middle'
+      );
+    } else if (this.pokemonScreenVisible && this.pokemonScreenImage) {
+      ctx.drawImage(this.pokemonScreenImage, 0, 0);
+      
+      // Draw "BACK" button in pokemon screen (bottom right area)
+      // Position: 22px from bottom, 8px from right, 96x21
+      const textBoxWidth = 96;
+      const textBoxHeight = 21;
+      const textBoxX = Config.SCREEN_WIDTH - 8 - textBoxWidth;
+      const textBoxY = Config.SCREEN_HEIGHT - 22 - textBoxHeight;
+      
+      // Draw "BACK" text (center aligned, white)
+      this.drawText(
+        ctx,
+        'BACK',
+        UI_FONT,
+        'rgb(255, 255, 255)',
+        textBoxX + textBoxWidth / 2,
+        textBoxY + textBoxHeight / 2,
+        'center',
+        'middle'
+      );
+    }
 
-      // Draw bag/pokemon screens on top of everything
-      if (this.bagScreenVisible && this.bagScreenImage) {
-        ctx.globalAlpha = 0.95;
-        ctx.drawImage(this.bagScreenImage, 0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
-        ctx.globalAlpha = 1.0;
-        
-        // Draw "USE" button in bag screen (bottom right area)
-        // Position: 22px from bottom, 8px from right, 96x21
-        const textBoxWidth = 96;
-        const textBoxHeight = 21;
-        const textBoxX = Config.SCREEN_WIDTH - 8 - textBoxWidth;
-        const textBoxY = Config.SCREEN_HEIGHT - 22 - textBoxHeight;
+    // Draw combat UI (shown when Fight is clicked, above battle menu)
+    if (this.combatUIVisible && this.combatUI && !this.bagScreenVisible && !this.pokemonScreenVisible) {
+      const combatUIX = 0; // Full width at bottom
+      const combatUIY = this.combatUIY;
+      
+      ctx.drawImage(this.combatUI, combatUIX, combatUIY);
+      
+      // Left grid: Draw move labels and hover highlights
+      const leftGridX = combatUIX + this.combatUIPadding;
+      const leftGridY = combatUIY + this.combatUIPadding;
+      
+      // Draw hover highlight on left grid
+      if (this.combatUIHoveredCell && this.combatUIHoveredCell.gridSide === 'left') {
+        const { row, col } = this.combatUIHoveredCell;
+        const cellX = leftGridX + (col * this.combatUILeftCellWidth);
+        const cellY = leftGridY + (row * this.combatUILeftCellHeight);
         
-        // Draw "USE" text (center aligned, white)
-        ctx.fillStyle = 'rgb(255, 255, 255)';
-        ctx.font = '19px "Pokemon Pixel Font", Arial, sans-serif';
-        ctx.textAlign = 'center';
-        ctx.textBaseline = 'middle';
-        ctx.fillText('USE', textBoxX + textBoxWidth / 2, textBoxY + textBoxHeight / 2);
-      } else if (this.pokemonScreenVisible && this.pokemonScreenImage) {
-        ctx.globalAlpha = 0.95;
-        ctx.drawImage(this.pokemonScreenImage, 0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+        ctx.globalAlpha = 128 / 255; // Light blue with transparency
+        ctx.fillStyle = 'rgb(173, 216, 230)';
+        ctx.fillRect(cellX, cellY, this.combatUILeftCellWidth, this.combatUILeftCellHeight);
         ctx.globalAlpha = 1.0;
-        
-        // Draw "BACK" button in pokemon screen (bottom right area)
-        // Position: 22px from bottom, 8px from right, 96x21
-        const textBoxWidth = 96;
-        const textBoxHeight = 21;
-        const textBoxX = Config.SCREEN_WIDTH - 8 - textBoxWidth;
-        const textBoxY = Config.SCREEN_HEIGHT - 22 - textBoxHeight;
-        
-        // Draw "BACK" text (center aligned, white)
-        ctx.fillStyle = 'rgb(255, 255, 255)';
-        ctx.font = '19px "Pokemon Pixel Font", Arial, sans-serif';
-        ctx.textAlign = 'center';
-        ctx.textBaseline = 'middle';
-        ctx.fillText('BACK', textBoxX + textBoxWidth / 2, textBoxY + textBoxHeight / 2);
       }
-
-      // Draw combat UI (shown when Fight is clicked, above battle menu)
-      if (this.combatUIVisible && this.combatUI && !this.bagScreenVisible && !this.pokemonScreenVisible) {
-        const combatUIX = 0; // Full width at bottom
-        const combatUIY = Config.SCREEN_HEIGHT - this.combatUI.height;
-        
-        ctx.drawImage(this.combatUI, combatUIX, combatUIY);
-        
-        // Left grid: Draw move labels and hover highlights
-        const leftGridX = combatUIX + this.combatUIPadding;
-        const leftGridY = combatUIY + this.combatUIPadding;
-        
-        // Draw hover highlight on left grid
-        if (this.combatUIHoveredCell && this.combatUIHoveredCell.gridSide === 'left') {
-          const { row, col } = this.combatUIHoveredCell;
-          const cellX = leftGridX + (col * this.combatUILeftCellWidth);
-          const cellY = leftGridY + (row * this.combatUILeftCellHeight);
-          
-          ctx.globalAlpha = 128 / 255; // Light blue with transparency
-          ctx.fillStyle = 'rgb(173, 216, 230)';
-          ctx.fillRect(cellX, cellY, this.combatUILeftCellWidth, this.combatUILeftCellHeight);
-          ctx.globalAlpha = 1.0;
-        }
-        
-        // Draw move labels in left grid
-        ctx.fillStyle = 'rgb(0, 0, 0)';
-        ctx.font = '19px "Pokemon Pixel Font", Arial, sans-serif'; // 80% of 24px base
-        ctx.textAlign = 'center';
-        ctx.textBaseline = 'middle';
-        
-        for (let row = 0; row < this.combatUILeftGridRows; row++) {
-          for (let col = 0; col < this.combatUILeftGridCols; col++) {
-            const moveIndex = row * this.combatUILeftGridCols + col;
-            if (moveIndex < this.combatUIMoveLabels.length) {
-              const moveName = this.combatUIMoveLabels[moveIndex];
-              const cellX = leftGridX + (col * this.combatUILeftCellWidth);
-              const cellY = leftGridY + (row * this.combatUILeftCellHeight);
-              const cellCenterX = cellX + (this.combatUILeftCellWidth / 2);
-              const cellCenterY = cellY + (this.combatUILeftCellHeight / 2);
-              
-              // Determine text color (grey for first 3 moves, black for Prompt Pulse)
-              if (moveName === 'Context Recall' || moveName === 'Syntax Slash' || moveName === 'Debug Dash') {
-                ctx.fillStyle = 'rgb(128, 128, 128)'; // Grey
-              } else {
-                ctx.fillStyle = 'rgb(0, 0, 0)'; // Black
-              }
-              
-              // Draw text with white outline for visibility
-              const text = moveName.toUpperCase();
-              const outlineWidth = 2;
-              
-              // Draw outline
-              ctx.strokeStyle = 'rgb(255, 255, 255)';
-              ctx.lineWidth = outlineWidth * 2;
-              ctx.strokeText(text, cellCenterX, cellCenterY);
-              
-              // Draw main text
-              ctx.fillText(text, cellCenterX, cellCenterY);
-            }
-          }
-        }
-        
-        // Right grid: Draw move details (updates based on left grid hover)
-        // Position in the far right cell grid (right half of combat UI)
-        const rightGridX = combatUIX + this.combatUI.width - this.combatUIPadding - this.combatUIRightGridContentWidth;
-        const rightGridY = combatUIY + this.combatUIPadding;
-        
-        // Get selected move from left grid hover
-        let selectedMove: string | null = null;
-        if (this.combatUIHoveredCell && this.combatUIHoveredCell.gridSide === 'left') {
-          const { row, col } = this.combatUIHoveredCell;
-          const moveIndex = row * this.combatUILeftGridCols + col;
-          if (moveIndex < this.combatUIMoveLabels.length) {
-            selectedMove = this.combatUIMoveLabels[moveIndex];
-          }
-        }
-        
-        // Draw right grid text
-        ctx.fillStyle = 'rgb(0, 0, 0)';
-        ctx.textAlign = 'left';
-        
-        if (selectedMove && selectedMove in this.combatUIMoveDetails) {
-          const moveDetails = this.combatUIMoveDetails[selectedMove];
-          
-          // Helper function to render text with white outline
-          const renderTextWithOutline = (text: string, x: number, y: number, _alignRight = false) => {
-            const outlineWidth = 2;
-            
-            // Draw outline (multiple passes)
-            ctx.strokeStyle = 'rgb(255, 255, 255)';
-            ctx.lineWidth = outlineWidth * 2;
-            ctx.strokeText(text, x, y);
-            
-            // Draw main text
-            ctx.fillText(text, x, y);
-          };
-          
-          // Top left cell: "PP" (left aligned, 8px from left, center height)
-          const topLeftCellX = rightGridX + 8;
-          const topLeftCellY = rightGridY;
-          const topLeftCellCenterY = topLeftCellY + (this.combatUIRightCellHeight / 2);
-          renderTextWithOutline('PP', topLeftCellX, topLeftCellCenterY);
-          
-          // Top right cell: "# / #" (right aligned, 8px from right, center height)
-          const topRightCellX = rightGridX + (2 * this.combatUIRightCellWidth) - 8;
-          const topRightCellY = rightGridY;
-          const topRightCellCenterY = topRightCellY + (this.combatUIRightCellHeight / 2);
-          const ppText = selectedMove === 'Prompt Pulse' 
-            ? `1 / ${moveDetails.pp_max}` 
-            : `0 / ${moveDetails.pp_max}`;
-          ctx.textAlign = 'right';
-          renderTextWithOutline(ppText, topRightCellX, topRightCellCenterY);
-          ctx.textAlign = 'left';
-          
-          // Bottom left cell: "TYPE/" (left aligned, 8px from left, center height)
-          const bottomLeftCellX = rightGridX + 8;
-          const bottomLeftCellY = rightGridY + this.combatUIRightCellHeight;
-          const bottomLeftCellCenterY = bottomLeftCellY + (this.combatUIRightCellHeight / 2);
-          renderTextWithOutline('TYPE/', bottomLeftCellX, bottomLeftCellCenterY);
-          
-          // Bottom right cell: "TYPENAME" (right aligned, 8px from right, center height)
-          const bottomRightCellX = rightGridX + (2 * this.combatUIRightCellWidth) - 8;
-          const bottomRightCellY = rightGridY + this.combatUIRightCellHeight;
-          const bottomRightCellCenterY = bottomRightCellY + (this.combatUIRightCellHeight / 2);
-          ctx.textAlign = 'right';
-          renderTextWithOutline(moveDetails.type, bottomRightCellX, bottomRightCellCenterY);
-          ctx.textAlign = 'left';
-        } else {
-          // No move selected, show default
-          const topLeftCellX = rightGridX + 8;
-          const topLeftCellY = rightGridY;
-          const topLeftCellCenterY = topLeftCellY + (this.combatUIRightCellHeight / 2);
-          const outlineWidth = 2;
-          ctx.strokeStyle = 'rgb(255, 255, 255)';
-          ctx.lineWidth = outlineWidth * 2;
-          ctx.strokeText('PP', topLeftCellX, topLeftCellCenterY);
-          ctx.fillText('PP', topLeftCellX, topLeftCellCenterY);
-          
-          const bottomLeftCellX = rightGridX + 8;
-          const bottomLeftCellY = rightGridY + this.combatUIRightCellHeight;
-          const bottomLeftCellCenterY = bottomLeftCellY + (this.combatUIRightCellHeight / 2);
-          ctx.strokeText('TYPE/', bottomLeftCellX, bottomLeftCellCenterY);
-          ctx.fillText('TYPE/', bottomLeftCellX, bottomLeftCellCenterY);
-        }
+      
+      // Move labels and right grid headings
+      const labelLayer = this.getCombatUILabelLayer();
+      if (labelLayer) {
+        ctx.drawImage(labelLayer, combatUIX, combatUIY);
       }
-
-      // Draw battle menu UI (on top, highest z-index, but hide when combat UI is visible)
-      // Position: bottom right, directly on top of whatever is there (highest z-index)
-      if (this.battleMenuVisible && this.battleMenuUI && !this.bagScreenVisible && !this.pokemonScreenVisible && !this.combatUIVisible) {
-        // Position menu touching bottom right corner (no padding, like Python)
-        // Should be on top of battle dialog and other elements
-        this.battleMenuX = Config.SCREEN_WIDTH - this.battleMenuUI.width;
-        this.battleMenuY = Config.SCREEN_HEIGHT - this.battleMenuUI.height;
-        
-        // Calculate cell dimensions with padding (like Python version)
-        const usableWidth = this.battleMenuUI.width - (this.battleMenuPadding * 2);
-        const usableHeight = this.battleMenuUI.height - (this.battleMenuPadding * 2);
-        this.battleMenuOptionWidth = usableWidth / 2;
-        this.battleMenuOptionHeight = usableHeight / 2;
-        
-        ctx.drawImage(this.battleMenuUI, this.battleMenuX, this.battleMenuY);
-
-        // Draw blue highlight on hovered/selected option (light blue like Python: 173, 216, 230, 128)
-        // Priority: selected cell (when text is showing) > hovered cell
-        let cellToHighlight: number | null = null;
-        if (this.battleMenuSelectedCell !== null) {
-          // Check if text is still showing for selected cell
-          if (this.battleMenuSelectedCell === 3 && (this.runTextVisible || this.runTextAlpha > 0)) {
-            cellToHighlight = this.battleMenuSelectedCell;
-          } else if (this.battleMenuSelectedCell === 1 && (this.fullHPTextVisible || this.fullHPTextAlpha > 0)) {
-            cellToHighlight = this.battleMenuSelectedCell;
-          } else {
-            // Text is gone, clear selection
-            this.battleMenuSelectedCell = null;
-          }
-        }
-        
-        if (cellToHighlight === null) {
-          cellToHighlight = this.battleMenuHoveredOption !== null ? this.battleMenuHoveredOption : this.battleMenuCursorPos;
+      
+      // Right grid: Draw move details (updates based on left grid hover)
+      // Position in the far right cell grid (right half of combat UI)
+      const rightGridX = combatUIX + this.combatUIRightGridX;
+      const rightGridY = combatUIY + this.combatUIPadding;
+      
+      // Get selected move from left grid hover
+      let selectedMove: number | null = null;
+      if (this.combatUIHoveredCell && this.combatUIHoveredCell.gridSide === 'left') {
+        const { row, col } = this.combatUIHoveredCell;
+        const moveIndex = row * this.combatUILeftGridCols + col;
+        if (moveIndex < this.combatUIMoveLabels.length) {
+          selectedMove = moveIndex;
         }
-        
-        const cellX = this.battleMenuX + this.battleMenuPadding + (cellToHighlight % 2) * this.battleMenuOptionWidth;
-        const cellY = this.battleMenuY + this.battleMenuPadding + Math.floor(cellToHighlight / 2) * this.battleMenuOptionHeight;
-        
-        // Draw light blue highlight rectangle (under text, like Python)
-        ctx.globalAlpha = 128 / 255; // 128 alpha like Python
-        ctx.fillStyle = 'rgb(173, 216, 230)'; // Light blue like Python version
-        ctx.fillRect(cellX, cellY, this.battleMenuOptionWidth, this.battleMenuOptionHeight);
-        ctx.globalAlpha = 1.0;
+      }
+      
+      // Draw right grid text
+      const renderTextWithOutline = (text: string, x: number, y: number, align: CanvasTextAlign = 'left') => {
+        this.drawText(ctx, text, UI_FONT, 'rgb(0, 0, 0)', x, y, align, 'middle', TEXT_OUTLINE);
+      };
+
+      const topCellCenterY = rightGridY + (this.combatUIRightCellHeight / 2);
+      const bottomCellCenterY = rightGridY + this.combatUIRightCellHeight + (this.combatUIRightCellHeight / 2);
+
+      if (selectedMove !== null) {
+        // Values (right aligned, 8px from right, center height)
+        const valueX = rightGridX + (2 * this.combatUIRightCellWidth) - 8;
+        const ppText = `${this.combatUIMovePP[selectedMove]} / ${this.combatUIMovePPMax[selectedMove]}`;
+        renderTextWithOutline(ppText, valueX, topCellCenterY, 'right');
+        renderTextWithOutline(this.combatUIMoveTypes[selectedMove], valueX, bottomCellCenterY, 'right');
+      }
+    }
 
-        // Draw cursor indicator (yellow arrow pointing left)
-        const cursorSize = 16;
-        const cursorX = this.battleMenuX + this.battleMenuPadding + (this.battleMenuCursorPos % 2) * this.battleMenuOptionWidth + this.battleMenuOptionWidth / 2 - cursorSize / 2;
-        const cursorY = this.battleMenuY + this.battleMenuPadding + Math.floor(this.battleMenuCursorPos / 2) * this.battleMenuOptionHeight + this.battleMenuOptionHeight / 2 - cursorSize / 2;
-        
-        ctx.fillStyle = 'rgb(255, 255, 0)';
-        ctx.fillRect(cursorX - 12, cursorY, 8, cursorSize);
-        
-        // Draw text labels for each option in 2x2 grid order: FIGHT, BAG, POKEMON, RUN
-        // Grid layout: [0=FIGHT (top-left), 1=BAG (top-right)] [2=POKEMON (bottom-left), 3=RUN (bottom-right)]
-        ctx.fillStyle = 'rgb(0, 0, 0)'; // Black text like Python version
-        ctx.font = '24px "Pokemon Pixel Font", Arial, sans-serif'; // Match Python font size
-        ctx.textAlign = 'center';
-        ctx.textBaseline = 'middle';
-        
-        // Draw each option text in correct grid position with padding
-        for (let i = 0; i < 4; i++) {
-          const col = i % 2; // 0 or 1
-          const row = Math.floor(i / 2); // 0 or 1
-          const cellX = this.battleMenuX + this.battleMenuPadding + (col * this.battleMenuOptionWidth);
-          const cellY = this.battleMenuY + this.battleMenuPadding + (row * this.battleMenuOptionHeight);
-          const cellCenterX = cellX + (this.battleMenuOptionWidth / 2);
-          const cellCenterY = cellY + (this.battleMenuOptionHeight / 2);
-          ctx.fillText(this.battleMenuOptions[i], cellCenterX, cellCenterY);
+    // Draw battle menu UI (on top, highest z-index, but hide when combat UI is visible)
+    // Position: bottom right, directly on top of whatever is there (highest z-index)
+    if (this.battleMenuVisible && this.battleMenuUI && !this.bagScreenVisible && !this.pokemonScreenVisible && !this.combatUIVisible) {
+      // Touches the bottom right corner, on top of battle dialog and other elements
+      ctx.drawImage(this.battleMenuUI, this.battleMenuX, this.battleMenuY);
+
+      // Draw blue highlight on hovered/selected option (light blue like Python: 173, 216, 230, 128)
+      // Priority: selected cell (when text is showing) > hovered cell
+      let cellToHighlight: number | null = null;
+      if (this.battleMenuSelectedCell !== null) {
+        // Check if text is still showing for selected cell
+        if (this.battleMenuSelectedCell === MENU_RUN && (this.runTextVisible || this.runTextAlpha > 0)) {
+          cellToHighlight = this.battleMenuSelectedCell;
+        } else if (this.battleMenuSelectedCell === MENU_BAG && (this.fullHPTextVisible || this.fullHPTextAlpha > 0)) {
+          cellToHighlight = this.battleMenuSelectedCell;
+        } else {
+          // Text is gone, clear selection
+          this.battleMenuSelectedCell = null;
         }
       }
       
-      // Draw attack pulse effects (on top of everything)
-      if (this.attackPulseVisible && this.attackPulseImage) {
-        const centerX = Config.SCREEN_WIDTH / 2;
-        const centerY = Config.SCREEN_HEIGHT / 2;
-        const pulseWidth = this.attackPulseImage.width * this.attackPulseScale;
-        const pulseHeight = this.attackPulseImage.height * this.attackPulseScale;
-        const pulseX = centerX - pulseWidth / 2;
-        const pulseY = centerY - pulseHeight / 2;
-        
-        ctx.globalAlpha = this.attackPulseAlpha / 255;
-        ctx.drawImage(this.attackPulseImage, pulseX, pulseY, pulseWidth, pulseHeight);
-        ctx.globalAlpha = 1.0;
+      if (cellToHighlight === null) {
+        cellToHighlight = this.battleMenuHoveredOption !== null ? this.battleMenuHoveredOption : this.battleMenuCursorPos;
       }
       
-      if (this.attackPulseEndVisible && this.attackPulseEndImage) {
-        const centerX = Config.SCREEN_WIDTH / 2;
-        const centerY = Config.SCREEN_HEIGHT / 2;
-        const endX = centerX - this.attackPulseEndImage.width / 2;
-        const endY = centerY - this.attackPulseEndImage.height / 2;
-        
-        ctx.globalAlpha = this.attackPulseEndAlpha / 255;
-        ctx.drawImage(this.attackPulseEndImage, endX, endY);
-        ctx.globalAlpha = 1.0;
-      }
+      const highlightCell = this.battleMenuCellRects[cellToHighlight];
+      
+      // Draw light blue highlight rectangle (under text, like Python)
+      ctx.globalAlpha = 128 / 255; // 128 alpha like Python
+      ctx.fillStyle = 'rgb(173, 216, 230)'; // Light blue like Python version
+      ctx.fillRect(highlightCell.x, highlightCell.y, highlightCell.width, highlightCell.height);
+      ctx.globalAlpha = 1.0;
 
-      return;
+      // Draw cursor indicator (yellow arrow pointing left)
+      const cursorSize = 16;
+      const cursorCell = this.battleMenuCellRects[this.battleMenuCursorPos];
+      const cursorX = cursorCell.x + cursorCell.width / 2 - cursorSize / 2;
+      const cursorY = cursorCell.y + cursorCell.height / 2 - cursorSize / 2;
+      
+      ctx.fillStyle = 'rgb(255, 255, 0)';
+      ctx.fillRect(cursorX - 12, cursorY, 8, cursorSize);
+      
+      // Option labels, drawn as one layer over the highlight and cursor
+      const labelLayer = this.getBattleMenuLabelLayer();
+      if (labelLayer) {
+        ctx.drawImage(labelLayer, this.battleMenuX, this.battleMenuY);
+      }
+    }
+    
+    // Draw attack pulse effects (on top of everything)
+    if (this.attackPulseVisible && this.attackPulseImage) {
+      const centerX = Config.SCREEN_WIDTH / 2;
+      const centerY = Config.SCREEN_HEIGHT / 2;
+      const pulseWidth = this.attackPulseImage.width * this.attackPulseScale;
+      const pulseHeight = this.attackPulseImage.height * this.attackPulseScale;
+      const pulseX = centerX - pulseWidth / 2;
+      const pulseY = centerY - pulseHeight / 2;
+      
+      ctx.globalAlpha = this.attackPhaseAlphas[ATTACK_PULSE] / 255;
+      ctx.drawImage(this.attackPulseImage, pulseX, pulseY, pulseWidth, pulseHeight);
+      ctx.globalAlpha = 1.0;
+    }
+    
+    if (this.attackPulseEndVisible && this.attackPulseEndImage) {
+      ctx.globalAlpha = this.attackPhaseAlphas[ATTACK_PULSE_END] / 255;
+      ctx.drawImage(this.attackPulseEndImage, this.attackPulseEndX, this.attackPulseEndY);
+      ctx.globalAlpha = 1.0;
     }
+  }
 
-    // Calculate fade opacity for current scene
-    let sceneOpacity = 1.0;
+  private renderMap(ctx: CanvasRenderingContext2D): void {
+    // The whole map layer fades out together, so set its opacity once for every
+    // element below rather than toggling it around each draw
     if (this.fadeState === 'fading') {
-      sceneOpacity = Math.max(0, 1.0 - this.fadeAlpha / 255);
+      ctx.globalAlpha = Math.max(0, 1.0 - this.fadeAlpha / 255);
     }
 
-    // Draw map
+    // Draw map (only the window under the camera, clipped to the image so
+    // small maps never sample outside their bounds)
     if (this.mapImage) {
-      ctx.globalAlpha = sceneOpacity;
+      const viewWidth = Math.min(Config.SCREEN_WIDTH, this.mapWidth - this.cameraX);
+      const viewHeight = Math.min(Config.SCREEN_HEIGHT, this.mapHeight - this.cameraY);
       ctx.drawImage(
         this.mapImage,
         this.cameraX,
         this.cameraY,
-        Config.SCREEN_WIDTH,
-        Config.SCREEN_HEIGHT,
+        viewWidth,
+        viewHeight,
         0,
         0,
-        Config.SCREEN_WIDTH,
-        Config.SCREEN_HEIGHT
+        viewWidth,
+        viewHeight
       );
-      ctx.globalAlpha = 1.0;
     }
 
     // Draw player
@@ -2023,7 +2239,6 @@ export class HouseVillageScene {
     if (this.characterSprite) {
       const currentSprite = this.characterSprite.getCurrentSprite();
       if (currentSprite) {
-        ctx.globalAlpha = sceneOpacity;
         ctx.imageSmoothingEnabled = false; // Disable smoothing for pixel art
         const spriteWidth = currentSprite.width;
         const spriteHeight = currentSprite.height;
@@ -2031,22 +2246,19 @@ export class HouseVillageScene {
         // Draw sprite at exact size (no scaling)
         ctx.drawImage(currentSprite, spriteX, playerScreenY, spriteWidth, spriteHeight);
         ctx.imageSmoothingEnabled = true; // Re-enable for other elements
-        ctx.globalAlpha = 1.0;
       }
     }
 
     // Draw exclamation mark popup above player head
     // Show during normal gameplay (not in battle) or when dialog is visible
     if (this.exclamationVisible && this.fadeState !== 'faded' && this.exclamationImage && !this.dialogVisible) {
-      const exclamationX = playerScreenX + this.playerWidth / 2 - this.exclamationImage.width / 2;
-      const exclamationY = playerScreenY + this.exclamationY - this.exclamationImage.height - 5;
-      ctx.globalAlpha = sceneOpacity;
+      const exclamationX = playerScreenX + this.playerWidth / 2 - this.exclamationWidth / 2;
+      const exclamationY = playerScreenY + this.exclamationY - this.exclamationHeight - 5;
       ctx.drawImage(this.exclamationImage, exclamationX, exclamationY);
-      ctx.globalAlpha = 1.0;
     }
 
     // Draw Lugia
-    if (this.lugiaState !== 'hidden' && this.lugiaSprites.length > 0) {
+    if (this.lugiaState !== 'hidden' && this.lugiaFrameCount > 0) {
       const lugiaScreenX = this.lugiaX - this.cameraX;
       const lugiaScreenY = this.lugiaY - this.cameraY;
 
@@ -2056,10 +2268,8 @@ export class HouseVillageScene {
         lugiaScreenY + 132 > 0 &&
         lugiaScreenY < Config.SCREEN_HEIGHT
       ) {
-        const frame = Math.min(this.lugiaCurrentFrame, this.lugiaSprites.length - 1);
-        ctx.globalAlpha = sceneOpacity;
-        ctx.drawImage(this.lugiaSprites[frame], lugiaScreenX, lugiaScreenY);
-        ctx.globalAlpha = 1.0;
+        const frame = Math.min(this.lugiaCurrentFrame, this.lugiaFrameCount - 1);
+        this.lugiaSheet?.drawSprite(ctx, 0, frame, lugiaScreenX, lugiaScreenY);
       }
     }
 
@@ -2067,29 +2277,24 @@ export class HouseVillageScene {
     if (this.dialogVisible && this.fadeState !== 'faded') {
       if (0 <= this.dialogSlideY && this.dialogSlideY < Config.SCREEN_HEIGHT) {
         if (this.dialogImage) {
-          const dialogX = (Config.SCREEN_WIDTH - this.dialogImage.width) / 2;
-          ctx.globalAlpha = sceneOpacity;
-          ctx.drawImage(this.dialogImage, dialogX, this.dialogSlideY);
+          ctx.drawImage(this.dialogImage, this.dialogX, this.dialogSlideY);
 
           if (this.dialogText) {
-            ctx.fillStyle = `rgb(${Config.BLACK.join(',')})`; // Black text
-            ctx.font = this.dialogFont;
-            ctx.textAlign = 'left';
-            ctx.textBaseline = 'top';
             const textX = 48;
-            const textY = this.dialogSlideY + (this.dialogImage.height - 32) / 2;
-            ctx.fillText(this.dialogText, textX, textY);
+            const textY = this.dialogSlideY + this.dialogTextOffsetY;
+            this.drawText(ctx, this.dialogText, this.dialogFont, Colors.BLACK, textX, textY);
           }
-          ctx.globalAlpha = 1.0;
         }
       }
     }
 
+    ctx.globalAlpha = 1.0;
+
     // Draw fade transition
     if (this.fadeState === 'fading' && this.fightingBackground) {
       const bgOpacity = Math.min(255, Math.floor(this.fadeAlpha)) / 255;
       ctx.globalAlpha = bgOpacity;
-      ctx.drawImage(this.fightingBackground, 0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
+      ctx.drawImage(this.fightingBackground, 0, 0);
       ctx.globalAlpha = 1.0;
     }
   }
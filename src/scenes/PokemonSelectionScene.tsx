@@ -3,7 +3,12 @@
  * Recreates the Pokemon selection screen
  */
 
-import { Config } from '../config';
+import { Colors, Config } from '../config';
+import { loadPokemonFont } from '../font_loader';
+import { Rect } from '../utils';
+
+// Only key presses drive this scene
+const INTERESTED_EVENT_TYPES: ReadonlySet<string> = new Set(['keydown']);
 
 export class PokemonSelectionScene {
   private selectedPokemon: { name: string; type: string; color: string; x: number; y: number } | null = null;
@@ -17,65 +22,83 @@ export class PokemonSelectionScene {
   private fontLarge: string = '48px "Pokemon Pixel Font", Arial, sans-serif';
   private fontMedium: string = '32px "Pokemon Pixel Font", Arial, sans-serif';
   private fontSmall: string = '24px "Pokemon Pixel Font", Arial, sans-serif';
-  private fontLoaded = false;
+
+  // Highlight boxes grown by half the 4px stroke, repainted when the cursor moves
+  private highlightRects: Rect[] = this.pokemonOptions.map((pokemon) => ({
+    x: pokemon.x - 62,
+    y: pokemon.y - 82,
+    width: 124,
+    height: 124,
+  }));
+
+  // Dirty tracking: a full repaint after entering, otherwise only the highlight boxes
+  private needsFullRedraw: boolean = true;
+  private highlightDirty: boolean = false;
 
   constructor() {
     this.loadFont();
   }
 
   private async loadFont(): Promise<void> {
-    // Font should already be loaded by font_loader, but check anyway
-    if (document.fonts.check('32px "Pokemon Pixel Font"')) {
-      this.fontLoaded = true;
-    } else {
-      try {
-        const fontFace = new FontFace(
-          'Pokemon Pixel Font',
-          `url(${Config.FONTS_PATH}/pokemon_pixel_font.ttf)`
-        );
-        await fontFace.load();
-        document.fonts.add(fontFace);
-        this.fontLoaded = true;
-      } catch (error) {
-        console.warn('Unable to load Pokemon pixel font, using fallback:', error);
-        this.fontLarge = '48px Arial, sans-serif';
-        this.fontMedium = '32px Arial, sans-serif';
-        this.fontSmall = '24px Arial, sans-serif';
-      }
+    // Shared with App's startup load, so this normally resolves immediately
+    if (!(await loadPokemonFont())) {
+      console.warn('Unable to load Pokemon pixel font, using fallback');
+      this.fontLarge = '48px Arial, sans-serif';
+      this.fontMedium = '32px Arial, sans-serif';
+      this.fontSmall = '24px Arial, sans-serif';
     }
+    this.needsFullRedraw = true;
   }
 
   onEnter(): void {
     this.selectedPokemon = null;
     this.cursorPos = 0;
     this.confirmed = false;
+    this.needsFullRedraw = true;
+  }
+
+  getDirtyRects(): Rect[] | null {
+    if (this.needsFullRedraw) {
+      this.needsFullRedraw = false;
+      this.highlightDirty = false;
+      return null;
+    }
+    if (this.highlightDirty) {
+      this.highlightDirty = false;
+      return this.highlightRects;
+    }
+    return [];
+  }
+
+  getInterestedEventTypes(): ReadonlySet<string> {
+    return INTERESTED_EVENT_TYPES;
   }
 
   handleEvent(event: KeyboardEvent | MouseEvent): void {
     if (event instanceof KeyboardEvent && event.type === 'keydown' && !this.confirmed) {
       if (event.key === 'ArrowLeft' && this.cursorPos > 0) {
         this.cursorPos -= 1;
+        this.highlightDirty = true;
       } else if (event.key === 'ArrowRight' && this.cursorPos < this.pokemonOptions.length - 1) {
         this.cursorPos += 1;
+        this.highlightDirty = true;
       } else if (event.key === 'Enter' || event.key === ' ') {
         // Select Pokemon
         this.selectedPokemon = this.pokemonOptions[this.cursorPos];
         this.confirmed = true;
+        // Box color and bottom message both change
+        this.needsFullRedraw = true;
       }
     }
   }
 
-  update(_deltaTime: number): void {
-    // No update logic needed
-  }
-
   render(ctx: CanvasRenderingContext2D): void {
     // Clear with background color
-    ctx.fillStyle = `rgb(${Config.BG_COLOR.join(',')})`;
+    ctx.fillStyle = Colors.BG_COLOR;
     ctx.fillRect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT);
 
     // Title
-    ctx.fillStyle = `rgb(${Config.BLACK.join(',')})`;
+    ctx.fillStyle = Colors.BLACK;
     ctx.font = this.fontLarge;
     ctx.textAlign = 'center';
     ctx.textBaseline = 'top';
@@ -92,8 +115,8 @@ export class PokemonSelectionScene {
       // Highlight selected
       if (i === this.cursorPos) {
         ctx.strokeStyle = this.confirmed
-          ? `rgb(${Config.GREEN.join(',')})`
-          : `rgb(${Config.WHITE.join(',')})`;
+          ? Colors.GREEN
+          : Colors.WHITE;
         ctx.lineWidth = 4;
         ctx.strokeRect(boxX, boxY, boxWidth, boxHeight);
       }
@@ -105,14 +128,14 @@ export class PokemonSelectionScene {
       ctx.fill();
 
       // Pokemon name
-      ctx.fillStyle = `rgb(${Config.BLACK.join(',')})`;
+      ctx.fillStyle = Colors.BLACK;
       ctx.font = this.fontMedium;
       ctx.textAlign = 'center';
       ctx.textBaseline = 'top';
       ctx.fillText(pokemon.name, pokemon.x, pokemon.y + 60);
 
       // Pokemon type
-      ctx.fillStyle = `rgb(${Config.DARK_GRAY.join(',')})`;
+      ctx.fillStyle = Colors.DARK_GRAY;
       ctx.font = this.fontSmall;
       ctx.fillText(pokemon.type, pokemon.x, pokemon.y + 85);
     }
@@ -121,14 +144,14 @@ export class PokemonSelectionScene {
     ctx.font = this.fontMedium;
     ctx.textBaseline = 'top';
     if (this.confirmed) {
-      ctx.fillStyle = `rgb(${Config.GREEN.join(',')})`;
+      ctx.fillStyle = Colors.GREEN;
       ctx.fillText(
         `You chose ${this.selectedPokemon!.name}!`,
         Config.SCREEN_WIDTH / 2,
         Config.SCREEN_HEIGHT - 40
       );
     } else {
-      ctx.fillStyle = `rgb(${Config.DARK_GRAY.join(',')})`;
+      ctx.fillStyle = Colors.DARK_GRAY;
       ctx.fillText(
         'Use Arrow Keys to select, Enter to confirm',
         Config.SCREEN_WIDTH / 2,
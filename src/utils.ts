@@ -4,12 +4,27 @@
 
 import { Config } from './config';
 
+export interface Rect {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+// Half-open test: the left/top edges are inside, the right/bottom edges are not,
+// so rects that tile a grid never both claim a point
+export function pointInRect(x: number, y: number, rect: Rect): boolean {
+  return x >= rect.x && x < rect.x + rect.width && y >= rect.y && y < rect.y + rect.height;
+}
+
 export class SpriteSheet {
   private image: HTMLImageElement;
   private spriteWidth: number;
   private spriteHeight: number;
   private cols: number;
   private rows: number;
+  // Sliced frames keyed by row * cols + col, so each frame is cut out of the sheet once
+  private frameCache: Map<number, HTMLCanvasElement> = new Map();
 
   constructor(
     image: HTMLImageElement,
@@ -37,45 +52,6 @@ export class SpriteSheet {
     this.rows = Math.floor(sheetHeight / spriteHeight);
   }
 
-  getSprite(row: number, col: number): HTMLImageElement | null {
-    const x = col * this.spriteWidth;
-    const y = row * this.spriteHeight;
-
-    // Check bounds
-    if (
-      x + this.spriteWidth <= this.image.width &&
-      y + this.spriteHeight <= this.image.height &&
-      x >= 0 &&
-      y >= 0
-    ) {
-      // Create a canvas to extract the sprite
-      const canvas = document.createElement('canvas');
-      canvas.width = this.spriteWidth;
-      canvas.height = this.spriteHeight;
-      const ctx = canvas.getContext('2d');
-      if (!ctx) return null;
-
-      ctx.drawImage(
-        this.image,
-        x,
-        y,
-        this.spriteWidth,
-        this.spriteHeight,
-        0,
-        0,
-        this.spriteWidth,
-        this.spriteHeight
-      );
-
-      // Convert canvas to image
-      const spriteImage = new Image();
-      spriteImage.src = canvas.toDataURL();
-      return spriteImage;
-    }
-
-    return null;
-  }
-
   getSpriteAsCanvas(row: number, col: number): HTMLCanvasElement | null {
     const x = col * this.spriteWidth;
     const y = row * this.spriteHeight;
@@ -87,6 +63,10 @@ export class SpriteSheet {
       x >= 0 &&
       y >= 0
     ) {
+      const key = row * this.cols + col;
+      const cached = this.frameCache.get(key);
+      if (cached) return cached;
+
       const canvas = document.createElement('canvas');
       canvas.width = this.spriteWidth;
       canvas.height = this.spriteHeight;
@@ -108,11 +88,31 @@ export class SpriteSheet {
         this.spriteHeight
       );
 
+      this.frameCache.set(key, canvas);
       return canvas;
     }
 
     return null;
   }
+
+  getFrameCount(): number {
+    return this.cols;
+  }
+
+  drawSprite(ctx: CanvasRenderingContext2D, row: number, col: number, x: number, y: number): void {
+    // Copy the frame straight out of the sheet, so no per-frame canvas is ever sliced
+    ctx.drawImage(
+      this.image,
+      col * this.spriteWidth,
+      row * this.spriteHeight,
+      this.spriteWidth,
+      this.spriteHeight,
+      x,
+      y,
+      this.spriteWidth,
+      this.spriteHeight
+    );
+  }
 }
 
 export class AnimatedSprite {
@@ -134,12 +134,10 @@ export class AnimatedSprite {
     this.isMoving = moving;
 
     if (moving) {
-      // Cycle through all 4 frames continuously when moving
-      this.animationTime += this.animationSpeed * (deltaTime / 16.67); // Normalize to 60fps
-      if (this.animationTime >= 1.0) {
-        this.animationTime = 0;
-        this.currentFrame = (this.currentFrame + 1) % this.numFrames;
-      }
+      // Cycle through all 4 frames continuously when moving. animationTime counts
+      // frames elapsed (wrapped to one cycle), so the frame index falls out directly
+      this.animationTime = (this.animationTime + this.animationSpeed * (deltaTime / 16.67)) % this.numFrames; // Normalize to 60fps
+      this.currentFrame = Math.floor(this.animationTime);
     } else {
       // Reset to frame 0 when not moving
       this.currentFrame = 0;
@@ -152,13 +150,141 @@ export class AnimatedSprite {
   }
 }
 
+export interface TextSprite {
+  canvas: HTMLCanvasElement;
+  anchorX: number; // Offset of the fillText x position inside the canvas
+  anchorY: number; // Offset of the fillText y position inside the canvas
+}
+
+export interface TextOutline {
+  color: string;
+  width: number; // strokeText lineWidth
+}
+
+export function renderTextSprite(
+  text: string,
+  font: string,
+  color: string,
+  align: CanvasTextAlign = 'left',
+  baseline: CanvasTextBaseline = 'top',
+  outline?: TextOutline
+): TextSprite {
+  // Rasterize text once so it can be drawn with drawImage instead of fillText every frame
+  const canvas = document.createElement('canvas');
+  const ctx = canvas.getContext('2d');
+  if (!ctx) return { canvas, anchorX: 0, anchorY: 0 };
+
+  const fontSize = parseInt(font, 10) || 16;
+  const padding = Math.ceil(fontSize / 4) + (outline ? Math.ceil(outline.width / 2) : 0);
+  ctx.font = font;
+  const textWidth = Math.ceil(ctx.measureText(text).width);
+
+  // Keep dimensions even so centered anchors land on whole pixels
+  canvas.width = textWidth + (textWidth % 2) + padding * 2;
+  canvas.height = fontSize * 2;
+
+  let anchorX = padding;
+  if (align === 'center') {
+    anchorX = canvas.width / 2;
+  } else if (align === 'right' || align === 'end') {
+    anchorX = canvas.width - padding;
+  }
+
+  let anchorY = canvas.height - padding;
+  if (baseline === 'top' || baseline === 'hanging') {
+    anchorY = padding;
+  } else if (baseline === 'middle') {
+    anchorY = canvas.height / 2;
+  }
+
+  // Resizing the canvas resets the context, so set text state afterwards
+  ctx.font = font;
+  ctx.fillStyle = color;
+  ctx.textAlign = align;
+  ctx.textBaseline = baseline;
+  if (outline) {
+    ctx.strokeStyle = outline.color;
+    ctx.lineWidth = outline.width;
+    ctx.strokeText(text, anchorX, anchorY);
+  }
+  ctx.fillText(text, anchorX, anchorY);
+
+  return { canvas, anchorX, anchorY };
+}
+
+export function drawTextSprite(ctx: CanvasRenderingContext2D, sprite: TextSprite, x: number, y: number): void {
+  // Snap to whole pixels so the cached canvas is copied 1:1 instead of resampled
+  ctx.drawImage(sprite.canvas, Math.round(x - sprite.anchorX), Math.round(y - sprite.anchorY));
+}
+
+export class TextCache {
+  // Map iteration order doubles as recency order, oldest first
+  private entries: Map<string, TextSprite> = new Map();
+  private maxSize: number;
+
+  constructor(maxSize: number = 256) {
+    this.maxSize = maxSize;
+  }
+
+  get(
+    text: string,
+    font: string,
+    color: string,
+    align: CanvasTextAlign = 'left',
+    baseline: CanvasTextBaseline = 'top',
+    outline?: TextOutline
+  ): TextSprite {
+    const outlineKey = outline ? `${outline.color}/${outline.width}` : '';
+    const key = `${font}|${color}|${align}|${baseline}|${outlineKey}|${text}`;
+
+    let sprite = this.entries.get(key);
+    if (sprite) {
+      // Move to the most recently used position
+      this.entries.delete(key);
+      this.entries.set(key, sprite);
+      return sprite;
+    }
+
+    sprite = renderTextSprite(text, font, color, align, baseline, outline);
+    this.entries.set(key, sprite);
+    if (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) {
+        this.entries.delete(oldest);
+      }
+    }
+    return sprite;
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+export function scaleImageTo(
+  image: HTMLImageElement,
+  width: number,
+  height: number
+): HTMLImageElement | HTMLCanvasElement {
+  // Already the target size: drawing it unscaled is a plain copy, so keep the original
+  if (image.width === width && image.height === height) return image;
+
+  const canvas = document.createElement('canvas');
+  canvas.width = width;
+  canvas.height = height;
+  const ctx = canvas.getContext('2d');
+  if (!ctx) return image;
+
+  ctx.drawImage(image, 0, 0, width, height);
+  return canvas;
+}
+
 export async function loadImage(src: string): Promise<HTMLImageElement> {
-  return new Promise((resolve, reject) => {
-    const img = new Image();
-    img.onload = () => resolve(img);
-    img.onerror = reject;
-    img.src = src;
-  });
+  const img = new Image();
+  img.src = src;
+  // Decode off the main thread up front so the first drawImage doesn't stall a frame
+  await img.decode();
+  return img;
 }
 
 export async function loadAudio(src: string): Promise<HTMLAudioElement> {